@@ -0,0 +1,39 @@
+"""
+Measures `parse_many` throughput for an increasing number of worker processes.
+
+Usage:
+    python benchmarks/bench_batch.py [symbols]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cpp_fqn_parser import parse_many  # noqa: E402
+
+
+def make_symbols(count: int) -> List[str]:
+    """Builds `count` distinct method symbols."""
+    return [f"std::vector<ns{i % 97}::Item> ns{i % 97}::Container<int>::method{i}(const ns{i % 97}::Item &, int) const"
+            for i in range(count)]
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    symbols: List[str] = make_symbols(count)
+    print(f"{'workers':>8} {'seconds':>10} {'symbols/s':>12}")
+    workers: int = 1
+    while workers <= (os.cpu_count() or 1):
+        start: float = time.perf_counter()
+        for _ in parse_many(symbols, workers=workers, chunksize=2048):
+            pass
+        elapsed: float = time.perf_counter() - start
+        print(f"{workers:>8} {elapsed:>10.2f} {count / elapsed:>12.0f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Measures the memory held by parsed FQNs, per symbol.
+
+Usage:
+    python benchmarks/bench_memory.py [symbols]
+"""
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cpp_fqn_parser import Parser, FQN  # noqa: E402
+
+
+def make_symbols(count: int) -> List[str]:
+    """Builds `count` distinct method symbols sharing a few scope chains."""
+    return [f"void std::__1::basic_string<char>::ns{i % 13}::Widget::method{i}(int, const ns{i % 13}::Item &) const"
+            for i in range(count)]
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    symbols: List[str] = make_symbols(count)
+
+    tracemalloc.start()
+    parsed: List[FQN] = [Parser(symbol).parse() for symbol in symbols]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # The list itself and the `full_name` strings are shared with `symbols`, not the FQNs.
+    held -= sys.getsizeof(parsed)
+    print(f"{count} symbols: {held / count:.0f} bytes per FQN")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compares the trie operator recognizer with the linear scan over SORTED_OPERATORS it replaced.
+
+Usage:
+    python benchmarks/bench_operators.py
+"""
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cpp_fqn_parser.operators import match_symbol  # noqa: E402
+from cpp_fqn_parser.tokenizer import SORTED_OPERATORS  # noqa: E402
+
+FIXTURES: Path = Path(__file__).resolve().parent.parent / "test_data" / "fqns.json"
+
+
+def linear_symbol(string: str, pos: int) -> Optional[str]:
+    """Matches an operator symbol the way the tokenizer used to: `startswith` over every operator."""
+    rest: str = string[pos:]
+    for op in SORTED_OPERATORS:
+        if rest.startswith(op):
+            return op
+    return None
+
+
+def main() -> None:
+    with FIXTURES.open() as f:
+        symbols: List[str] = [fqn["fqn"] for fqn in json.load(f)]
+    samples: List[Tuple[str, int]] = [(symbol, symbol.index("operator") + len("operator"))
+                                      for symbol in symbols if "operator" in symbol]
+    samples = [(symbol, pos + len(symbol[pos:]) - len(symbol[pos:].lstrip())) for symbol, pos in samples]
+
+    number: int = 20000
+    trie: float = min(timeit.repeat(lambda: [match_symbol(s, p) for s, p in samples], number=number, repeat=5))
+    linear: float = min(timeit.repeat(lambda: [linear_symbol(s, p) for s, p in samples], number=number, repeat=5))
+    per_lookup: float = 1e9 / (number * len(samples))
+    print(f"{len(samples)} operator symbols from the fixtures")
+    print(f"trie:   {trie * per_lookup:8.1f} ns per lookup")
+    print(f"linear: {linear * per_lookup:8.1f} ns per lookup ({linear / trie:.1f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
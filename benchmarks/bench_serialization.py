@@ -0,0 +1,75 @@
+"""
+Compares the serialization paths of FQN against the reflective `utils.to_dict`/`check_keys` ones.
+
+Usage:
+    python benchmarks/bench_serialization.py [symbols]
+"""
+import io
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cpp_fqn_parser import Parser, FQN, Scope, dump_many, load_many  # noqa: E402
+from cpp_fqn_parser.utils import to_dict, check_keys  # noqa: E402
+
+
+def make_symbols(count: int) -> List[str]:
+    """Builds `count` distinct method symbols."""
+    return [f"std::vector<ns{i % 97}::Item> ns{i % 97}::Container<int>::method{i}(const ns{i % 97}::Item &, int) const"
+            for i in range(count)]
+
+
+def reflective_from_dict(data: Dict[str, Any]) -> FQN:
+    """Rebuilds an FQN the way `FQN.from_dict` used to, validating every key up front."""
+    check_keys(["name", "full_name", "return_type", "args", "scopes", "template", "constant", "volatile"], data)
+    for scope in data["scopes"]:
+        check_keys(["name", "template"], scope)
+    return FQN(name=data["name"], full_name=data["full_name"], return_type=data["return_type"],
+               args=tuple(data["args"]), scopes=tuple(Scope(s["name"], s["template"]) for s in data["scopes"]),
+               template=data["template"], constant=data["constant"], volatile=data["volatile"])
+
+
+def main() -> None:
+    count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    fqns: List[FQN] = [Parser(symbol).parse() for symbol in make_symbols(count)]
+    dicts: List[Dict[str, Any]] = [fqn.to_dict() for fqn in fqns]
+    jsonl: str = "".join(json.dumps(data) + "\n" for data in dicts)
+
+    def dump(format: str) -> Callable[[], Any]:
+        return lambda: dump_many(fqns, io.BytesIO() if format == "msgpack" else io.StringIO(), format)
+
+    def load(format: str) -> Callable[[], Any]:
+        fp = io.BytesIO() if format == "msgpack" else io.StringIO()
+        dump_many(fqns, fp, format)
+        payload = fp.getvalue()
+        return lambda: list(load_many(io.BytesIO(payload) if format == "msgpack" else io.StringIO(payload), format))
+
+    cases: Dict[str, Callable[[], Any]] = {
+        "utils.to_dict": lambda: [to_dict(fqn) for fqn in fqns],
+        "FQN.to_dict": lambda: [fqn.to_dict() for fqn in fqns],
+        "FQN.to_tuple": lambda: [fqn.to_tuple() for fqn in fqns],
+        "check_keys from_dict": lambda: [reflective_from_dict(data) for data in dicts],
+        "FQN.from_dict": lambda: [FQN.from_dict(data) for data in dicts],
+        "json.dumps(utils.to_dict)": lambda: "".join(json.dumps(to_dict(fqn)) + "\n" for fqn in fqns),
+        "json.loads + check_keys": lambda: [reflective_from_dict(json.loads(line)) for line in jsonl.splitlines()],
+    }
+    for format in ("jsonl", "tuples", "msgpack"):
+        try:
+            __import__("msgpack") if format == "msgpack" else None
+        except ImportError:
+            continue
+        cases[f"dump_many({format})"] = dump(format)
+        cases[f"load_many({format})"] = load(format)
+
+    print(f"{'case':>28} {'us/FQN':>8}")
+    for name, case in cases.items():
+        elapsed: float = min(timeit.repeat(case, number=1, repeat=3))
+        print(f"{name:>28} {elapsed / count * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measures how `Tokenizer.get_all_tokens` scales with the length of the input.
+
+The previous engine sliced the remaining input for every token, so its cost grew quadratically
+with the length of the symbol. It is kept here as `legacy_tokens` to compare against.
+
+Usage:
+    python benchmarks/bench_tokenizer.py
+"""
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from cpp_fqn_parser import Tokenizer, Token  # noqa: E402
+from cpp_fqn_parser.tokenizer import SORTED_OPERATORS  # noqa: E402
+
+_LEGACY_SPEC = [
+    (re.compile(r"^\s+"), "WHITESPACE"),
+    (re.compile(r"^::"), "SCOPE"),
+    (re.compile(r"^<"), "TEMPLATE_START"),
+    (re.compile(r"^>"), "TEMPLATE_END"),
+    (re.compile(r"^\("), "PARENTHESIS_START"),
+    (re.compile(r"^\)"), "PARENTHESIS_END"),
+    (re.compile(r"^\*"), "POINTER"),
+    (re.compile(r"^&"), "REFERENCE"),
+    (re.compile(r"^,"), "SEPARATOR"),
+    (re.compile(r"^[a-zA-Z_]\w*"), "MEMBER"),
+]
+_LEGACY_OPERATOR_RE = re.compile(r"^operator\b\s*")
+
+
+def legacy_tokens(string: str) -> List[Token]:
+    """Tokenizes `string` the way the slicing engine did."""
+    tokens: List[Token] = []
+    cursor: int = 0
+    while cursor < len(string):
+        rest: str = string[cursor:]
+        match = _LEGACY_OPERATOR_RE.match(rest)
+        if match:
+            symbol = next((op for op in SORTED_OPERATORS if rest[match.end():].startswith(op)), None)
+            if symbol:
+                cursor += match.end() + len(symbol)
+                tokens.append(Token("OPERATOR", f"operator{symbol}"))
+            else:
+                cursor += match.end()
+                tokens.append(Token("MEMBER", "operator"))
+            continue
+        for pattern, token_type in _LEGACY_SPEC:
+            match = pattern.match(rest)
+            if match:
+                cursor += match.end()
+                tokens.append(Token(token_type, match[0]))
+                break
+        else:
+            raise SyntaxError(f"Unexpected token '{rest[0]}'")
+    return tokens
+
+
+def make_symbol(args: int) -> str:
+    """Builds a template-heavy symbol with `args` arguments."""
+    arg: str = "std::vector<std::pair<const std::string, ns::Value<int> >, std::allocator<int> > const &"
+    return f"void ns::Container<int>::operator[]({', '.join([arg] * args)}) const"
+
+
+def main() -> None:
+    print(f"{'chars':>8} {'tokens':>8} {'master (ms)':>12} {'legacy (ms)':>12} {'speedup':>8}")
+    for args in (1, 4, 16, 64, 256):
+        symbol: str = make_symbol(args)
+        tokens: List[Token] = list(Tokenizer(symbol).get_all_tokens())
+        assert tokens == legacy_tokens(symbol)
+
+        number: int = max(1, 200 // args)
+        master: float = min(timeit.repeat(lambda: list(Tokenizer(symbol).get_all_tokens()),
+                                          number=number, repeat=3)) / number
+        legacy: float = min(timeit.repeat(lambda: legacy_tokens(symbol),
+                                          number=number, repeat=3)) / number
+        print(f"{len(symbol):>8} {len(tokens):>8} {master * 1e3:>12.3f} {legacy * 1e3:>12.3f} "
+              f"{legacy / master:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
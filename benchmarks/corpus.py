@@ -0,0 +1,45 @@
+"""
+Synthetic symbol corpora for the benchmark suite.
+
+Each generator scales one dimension of a symbol while keeping the others small, so that a
+throughput regression can be traced to the shape of input that triggers it.
+"""
+from typing import List
+
+
+def nested_templates(depth: int) -> str:
+    """A symbol whose argument nests `depth` templates, e.g. 'a<b<c<int> > >'."""
+    inner: str = "int"
+    for level in range(depth):
+        inner = f"ns::t{level}<{inner} >"
+    return f"void ns::Holder::set(const {inner} &)"
+
+
+def wide_template(size: int) -> str:
+    """A symbol whose scope and name carry templates of `size` parameters each."""
+    params: str = ", ".join(f"ns::T{i} *" for i in range(size))
+    return f"ns::Result ns::Widget<{params}>::apply<{params}>(int) const"
+
+
+def many_args(count: int) -> str:
+    """A symbol taking `count` arguments."""
+    args: str = ", ".join(f"const ns::Arg{i} &" for i in range(count))
+    return f"int ns::Api::call({args})"
+
+
+def long_scopes(count: int) -> str:
+    """A symbol nested in `count` scopes, every other one being a template."""
+    scopes: str = "::".join(f"s{i}<int>" if i % 2 else f"s{i}" for i in range(count))
+    return f"unsigned long {scopes}::operator()(int)"
+
+
+def mixed(count: int) -> List[str]:
+    """A corpus of `count` symbols resembling an STL-heavy `nm -C` dump."""
+    shapes: List[str] = [
+        "std::vector<ns{i}::Item, std::allocator<ns{i}::Item> >::operator[](unsigned long)",
+        "bool ns{i}::operator==(const ns{i}::Key &, const ns{i}::Key &)",
+        "void ns{i}::Widget<int>::method{i}(int, const std::basic_string<char> &) const",
+        "ns{i}::Value & std::map<int, ns{i}::Value>::at(const int &)",
+        "free_function{i}()",
+    ]
+    return [shapes[i % len(shapes)].format(i=i) for i in range(count)]
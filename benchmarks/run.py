@@ -0,0 +1,164 @@
+"""
+Benchmark suite with regression tracking.
+
+Runs each case on synthetic corpora (see `corpus.py`), writes the results as JSON and, given
+a baseline, fails when a case got slower than the tolerance allows. Timings are divided by a
+pure-Python calibration loop measured in the same run, so baselines recorded on one machine
+remain meaningful on another. They are not across Python versions, so a baseline recorded on
+another version is not compared against.
+
+Usage:
+    python benchmarks/run.py                                 # compare against baseline.json
+    python benchmarks/run.py --output results.json --baseline benchmarks/baseline.json
+    python benchmarks/run.py --save-baseline                 # record a new baseline.json
+    python benchmarks/run.py --save-baseline --baseline base.json   # e.g. on the base branch, then
+    python benchmarks/run.py --baseline base.json                    # on the change, in the same job
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import corpus  # noqa: E402
+from cpp_fqn_parser import Tokenizer, Parser, FQN, parse_stream  # noqa: E402
+
+BASELINE: Path = Path(__file__).resolve().parent / "baseline.json"
+
+
+def calibrate() -> float:
+    """Times a fixed pure-Python workload, used as the unit of every result."""
+    def workload() -> None:
+        items: Dict[str, int] = {}
+        for i in range(2000):
+            key: str = f"k{i % 97}"
+            items[key] = items.get(key, 0) + len(key)
+    return min(timeit.repeat(workload, number=20, repeat=5)) / 20
+
+
+def measure(case: Callable[[], Any]) -> float:
+    """Returns the best time of one call of `case`, in seconds."""
+    number, _ = timeit.Timer(case).autorange()
+    return min(timeit.repeat(case, number=number, repeat=3)) / number
+
+
+def scaled_cases() -> Dict[str, Callable[[], Any]]:
+    """Tokenize and parse cases over every scaled dimension of the synthetic corpora."""
+    cases: Dict[str, Callable[[], Any]] = {}
+    dimensions: Dict[str, List[str]] = {
+        "depth": [corpus.nested_templates(n) for n in (1, 8, 32)],
+        "template": [corpus.wide_template(n) for n in (1, 8, 32)],
+        "args": [corpus.many_args(n) for n in (1, 8, 32)],
+        "scopes": [corpus.long_scopes(n) for n in (2, 16, 64)],
+    }
+    for dimension, symbols in dimensions.items():
+        for size, symbol in zip(("small", "medium", "large"), symbols):
+            Parser(symbol).parse()
+            cases[f"tokenize/{dimension}/{size}"] = lambda s=symbol: Tokenizer(s).tokenize()
+            cases[f"parse/{dimension}/{size}"] = lambda s=symbol: Parser(s).parse()
+    return cases
+
+
+def corpus_cases(workdir: str) -> Dict[str, Callable[[], Any]]:
+    """Serialization and end-to-end cases over a mixed corpus."""
+    symbols: List[str] = corpus.mixed(2000)
+    fqns: List[FQN] = [Parser(symbol).parse() for symbol in symbols]
+    dicts: List[Dict[str, Any]] = [fqn.to_dict() for fqn in fqns]
+    path: str = os.path.join(workdir, "symbols.txt")
+    with open(path, "w") as f:
+        f.write("\n".join(symbols))
+
+    def parse_file() -> None:
+        with open(path) as f:
+            for _ in parse_stream(f):
+                pass
+
+    return {
+        "corpus/parse": lambda: [Parser(symbol).parse() for symbol in symbols],
+        "corpus/to_dict": lambda: [fqn.to_dict() for fqn in fqns],
+        "corpus/from_dict": lambda: [FQN.from_dict(data) for data in dicts],
+        "corpus/to_json": lambda: json.dump(dicts, io.StringIO()),
+        "corpus/parse_file": parse_file,
+    }
+
+
+def run(only: Optional[str] = None) -> Dict[str, Any]:
+    """Runs the suite and returns its results."""
+    timings: Dict[str, float] = {}
+    unit: float = calibrate()
+    with tempfile.TemporaryDirectory() as workdir:
+        cases: Dict[str, Callable[[], Any]] = {**scaled_cases(), **corpus_cases(workdir)}
+        for name, case in cases.items():
+            if only and only not in name:
+                continue
+            timings[name] = measure(case)
+            print(f"{name:<28} {timings[name] * 1e6:>12.1f} us", file=sys.stderr)
+    # Calibrating on both ends of the run evens out load spikes on the machine.
+    unit = min(unit, calibrate())
+
+    results: Dict[str, Dict[str, float]] = {name: {"seconds": seconds, "relative": seconds / unit}
+                                            for name, seconds in timings.items()}
+    return {"python": platform.python_version(), "machine": platform.machine(), "unit_seconds": unit,
+            "results": results}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Returns a description of every case slower than its baseline by more than `tolerance`."""
+    regressions: List[str] = []
+    for name, result in results["results"].items():
+        expected: Optional[Dict[str, float]] = baseline["results"].get(name)
+        if expected is None:
+            continue
+        ratio: float = result["relative"] / expected["relative"]
+        if ratio > 1 + tolerance:
+            regressions.append(f"{name}: {ratio:.2f}x the baseline time")
+    return regressions
+
+
+def _minor(version: str) -> str:
+    """Returns the major and minor parts of a Python version, e.g. '3.13' for '3.13.1'."""
+    return ".".join(version.split(".")[:2])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    arg_parser.add_argument("--output", help="Write the results to this JSON file.")
+    arg_parser.add_argument("--baseline", default=str(BASELINE), help="Baseline to compare against.")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25,
+                            help="Allowed slowdown before a case counts as a regression. Defaults to 0.25.")
+    arg_parser.add_argument("--save-baseline", action="store_true", help="Write the results to the baseline.")
+    arg_parser.add_argument("--only", help="Only run cases whose name contains this string.")
+    args = arg_parser.parse_args(argv)
+
+    results: Dict[str, Any] = run(args.only)
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    if args.save_baseline:
+        Path(args.baseline).write_text(json.dumps(results, indent=2) + "\n")
+        return 0
+    if not Path(args.baseline).exists():
+        print(f"No baseline at '{args.baseline}', skipping the comparison", file=sys.stderr)
+        return 0
+
+    baseline: Dict[str, Any] = json.loads(Path(args.baseline).read_text())
+    if _minor(baseline["python"]) != _minor(results["python"]):
+        print(f"Baseline '{args.baseline}' was recorded on Python {baseline['python']}, not "
+              f"{results['python']}, skipping the comparison", file=sys.stderr)
+        return 0
+
+    regressions: List[str] = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,79 @@
 __version__ = "0.1.0"
 
-from .tokenizer import Tokenizer
-from .parser import Parser
-from .fqn import FQN
-from .token import Token
-from .scope import Scope
+from importlib import import_module
+from typing import Any, Dict, List, TYPE_CHECKING
+
+# The public names, by the submodule defining them. Submodules are only imported when one of
+# their names is first accessed, so that `import cpp_fqn_parser` stays cheap for short-lived
+# processes that only parse a few symbols.
+_EXPORTS: Dict[str, List[str]] = {
+    "tokenizer": ["Tokenizer"],
+    "parser": ["Parser", "ParseSpans", "parse"],
+    "fqn": ["FQN"],
+    "token": ["Token"],
+    "buffer": ["TokenBuffer"],
+    "scope": ["Scope"],
+    "pool": ["ScopePool", "PoolInfo"],
+    "batch": ["parse_many"],
+    "cache": ["ParseCache", "CacheInfo"],
+    "stream": ["parse_stream"],
+    "serialization": ["dump_many", "load_many"],
+    "lazy": ["LazyFQN"],
+    "index": ["FQNIndex"],
+    "store": ["SymbolStore", "StoreWriter", "merge_stores"],
+    "typed": ["TypeNode", "TypeCache", "TypedFQN", "parse_typed"],
+    "service": ["AsyncParser", "ServiceStats", "serve"],
+    "profiling": ["ParseProfiler", "ProfileStats", "Histogram"],
+    "validate": ["is_fqn", "filter_fqns"],
+    "mangled": ["parse_mangled", "is_mangled"],
+    "incremental": ["IncrementalParse"],
+    "diff": ["diff_symbols", "SymbolChange", "CHANGE_KINDS"],
+    "canonical": ["normalize_type", "canonical_name", "canonicalize", "canonical_key", "scope_key", "unique_fqns"],
+    "columnar": ["parse_columns", "SymbolColumns"],
+}
+
+_MODULES: Dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports the submodule defining a public name on its first access.
+    """
+    module: str = _MODULES.get(name, "")
+    if not module:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *__all__])
+
+
+if TYPE_CHECKING:
+    from .tokenizer import Tokenizer
+    from .parser import Parser, ParseSpans, parse
+    from .fqn import FQN
+    from .token import Token
+    from .buffer import TokenBuffer
+    from .scope import Scope
+    from .pool import ScopePool, PoolInfo
+    from .batch import parse_many
+    from .cache import ParseCache, CacheInfo
+    from .stream import parse_stream
+    from .serialization import dump_many, load_many
+    from .lazy import LazyFQN
+    from .index import FQNIndex
+    from .store import SymbolStore, StoreWriter, merge_stores
+    from .typed import TypeNode, TypeCache, TypedFQN, parse_typed
+    from .service import AsyncParser, ServiceStats, serve
+    from .profiling import ParseProfiler, ProfileStats, Histogram
+    from .validate import is_fqn, filter_fqns
+    from .mangled import parse_mangled, is_mangled
+    from .incremental import IncrementalParse
+    from .diff import diff_symbols, SymbolChange, CHANGE_KINDS
+    from .canonical import normalize_type, canonical_name, canonicalize, canonical_key, scope_key, unique_fqns
+    from .columnar import parse_columns, SymbolColumns
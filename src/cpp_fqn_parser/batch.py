@@ -0,0 +1,169 @@
+import os
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Union, Deque, Set, TYPE_CHECKING
+
+from .fqn import FQN
+from .parser import Parser
+
+# The process pool and the demangler are imported on first use, as most short-lived callers
+# parse a few demangled symbols in-process.
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+ERROR_POLICIES = ("raise", "skip", "return")
+
+ParseResult = Union[FQN, SyntaxError]
+
+
+def parse_many(strings: Iterable[str],
+               workers: Optional[int] = None,
+               chunksize: int = 1024,
+               ordered: bool = True,
+               errors: str = "raise",
+               mangled: bool = False,
+               threads: bool = False) -> Iterator[ParseResult]:
+    """
+    Parses many FQN strings, fanning the work out to a pool of worker processes or threads.
+
+    Inputs are read lazily in chunks of `chunksize` strings, and at most two chunks per worker
+    are in flight at any time, so arbitrarily long iterables (e.g. an `nm -C` dump) can be
+    streamed through without being loaded in memory.
+
+    Args:
+        strings (Iterable[str]): The strings to parse.
+        workers (Optional[int]): Number of worker processes, or threads with `threads`.
+            Defaults to `os.cpu_count()`. With 1 or fewer workers, strings are parsed serially
+            in the current process.
+        chunksize (int): Number of strings sent to a worker at once.
+        ordered (bool): Whether results are yielded in input order. If False, each chunk is
+            yielded as soon as it is done.
+        errors (str): What to do when a string fails to parse:
+            - 'raise': raise its SyntaxError (after yielding all previous results).
+            - 'skip': drop it from the results.
+            - 'return': yield the SyntaxError in place of its FQN.
+        mangled (bool): Whether to parse Itanium-mangled strings ('_Z...') with `parse_mangled`,
+            instead of demangling them beforehand. Other strings are parsed as they are.
+        threads (bool): Whether the workers are threads instead of processes. Results are then
+            not pickled back, but threads only parse in parallel on free-threaded (no-GIL) builds.
+
+    Yields:
+        Iterator[Union[FQN, SyntaxError]]: The parse result of each input string.
+
+    Raises:
+        ValueError: If `errors` is not a known policy or `chunksize` is not positive.
+        SyntaxError: If a string fails to parse and `errors` is 'raise'.
+    """
+    if errors not in ERROR_POLICIES:
+        raise ValueError(f"Unknown error policy '{errors}'. Expected one of {ERROR_POLICIES}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive, got {chunksize}")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        return _apply_policy((_parse_one(string, mangled) for string in strings), errors)
+
+    return _parse_in_pool(strings, workers, chunksize, ordered, errors, mangled, threads)
+
+
+def _parse_in_pool(strings: Iterable[str],
+                   workers: int,
+                   chunksize: int,
+                   ordered: bool,
+                   errors: str,
+                   mangled: bool,
+                   threads: bool = False) -> Iterator[ParseResult]:
+    """
+    Streams chunks of `strings` through a process or thread pool. See `parse_many`.
+    """
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+    executor: Executor = ThreadPoolExecutor(max_workers=workers) if threads else ProcessPoolExecutor(max_workers=workers)
+    with executor:
+        results = _chunk_results(executor, strings, 2 * workers, chunksize, ordered, mangled)
+        yield from _apply_policy((result for chunk in results for result in chunk), errors)
+
+
+def _chunk_results(executor: 'Executor',
+                   strings: Iterable[str],
+                   max_pending: int,
+                   chunksize: int,
+                   ordered: bool,
+                   mangled: bool = False) -> Iterator[List[ParseResult]]:
+    """
+    Submits chunks of `strings` to `executor`, keeping at most `max_pending` of them in flight.
+
+    Args:
+        executor (Executor): The pool that parses the chunks.
+        strings (Iterable[str]): The strings to parse.
+        max_pending (int): Maximum number of submitted chunks not yet yielded.
+        chunksize (int): Number of strings per chunk.
+        ordered (bool): Whether chunks are yielded in submission order.
+        mangled (bool): Whether mangled strings are parsed with `parse_mangled`.
+
+    Yields:
+        Iterator[List[Union[FQN, SyntaxError]]]: The results of each chunk.
+    """
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    iterator: Iterator[str] = iter(strings)
+
+    def submit() -> Optional['Future']:
+        chunk: List[str] = list(islice(iterator, chunksize))
+        return executor.submit(_parse_chunk, chunk, mangled) if chunk else None
+
+    if ordered:
+        queue: Deque['Future'] = deque()
+        while len(queue) < max_pending and (future := submit()):
+            queue.append(future)
+        while queue:
+            done: 'Future' = queue.popleft()
+            if future := submit():
+                queue.append(future)
+            yield done.result()
+        return
+
+    pending: Set['Future'] = set()
+    while len(pending) < max_pending and (future := submit()):
+        pending.add(future)
+    while pending:
+        finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for done in finished:
+            if future := submit():
+                pending.add(future)
+            yield done.result()
+
+
+def _apply_policy(results: Iterable[ParseResult], errors: str) -> Iterator[ParseResult]:
+    """
+    Applies the `errors` policy of `parse_many` to a stream of results.
+    """
+    for result in results:
+        if isinstance(result, SyntaxError):
+            if errors == "raise":
+                raise result
+            if errors == "skip":
+                continue
+        yield result
+
+
+def _parse_one(string: str, mangled: bool = False) -> ParseResult:
+    """
+    Parses a single string, returning the SyntaxError instead of raising it.
+    """
+    try:
+        if mangled:
+            from .mangled import is_mangled, parse_mangled
+            if is_mangled(string):
+                return parse_mangled(string)
+        return Parser(string).parse()
+    except SyntaxError as e:
+        return e
+
+
+def _parse_chunk(chunk: List[str], mangled: bool = False) -> List[ParseResult]:
+    """
+    Parses a chunk of strings inside a worker.
+    """
+    return [_parse_one(string, mangled) for string in chunk]
@@ -0,0 +1,93 @@
+from array import array
+from typing import Dict, Iterator, Optional, Tuple
+
+from .token import Token
+
+# Token types, in the order of the groups of the tokenizer's master regex, so that the code of a
+# match is its `lastindex` minus one.
+TYPE_NAMES: Tuple[str, ...] = ("OPERATOR", "WHITESPACE", "SCOPE", "TEMPLATE_START", "TEMPLATE_END",
+                               "PARENTHESIS_START", "PARENTHESIS_END", "POINTER", "REFERENCE",
+                               "SEPARATOR", "MEMBER")
+
+TYPE_CODES: Dict[str, int] = {name: code for code, name in enumerate(TYPE_NAMES)}
+
+(OPERATOR, WHITESPACE, SCOPE, TEMPLATE_START, TEMPLATE_END, PARENTHESIS_START, PARENTHESIS_END,
+ POINTER, REFERENCE, SEPARATOR, MEMBER) = range(len(TYPE_NAMES))
+
+
+class TokenBuffer:
+    """
+    A compact token stream: parallel arrays of type codes and of start/end offsets into the
+    tokenized string.
+
+    Tokens whose value is not their span (operators, whose names are normalized) keep their
+    value and kind in a side table. `Token` objects are only built when indexing or iterating.
+
+    Attributes:
+        string (str): The tokenized string.
+        types (array): The type code of each token, see `TYPE_NAMES`.
+        starts (array): The start offset of each token.
+        ends (array): The end offset of each token.
+        overrides (Dict[int, Tuple[str, Optional[str]]]): The value and kind of the tokens
+            whose value differs from their span, by index.
+    """
+    __slots__ = ("string", "types", "starts", "ends", "overrides")
+
+    def __init__(self, string: str) -> None:
+        """
+        Initializes an empty buffer.
+
+        Args:
+            string (str): The string the tokens are read from.
+        """
+        self.string: str = string
+        self.types: array = array('B')
+        self.starts: array = array('I')
+        self.ends: array = array('I')
+        self.overrides: Dict[int, Tuple[str, Optional[str]]] = {}
+
+    def append(self, code: int, start: int, end: int) -> None:
+        """
+        Appends a token whose value is its span.
+
+        Args:
+            code (int): The type code of the token.
+            start (int): Start offset of the token.
+            end (int): End offset of the token.
+        """
+        self.types.append(code)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def value(self, index: int) -> str:
+        """
+        Returns the value of a token.
+
+        Args:
+            index (int): The index of the token.
+
+        Returns:
+            str: Its value.
+        """
+        override: Optional[Tuple[str, Optional[str]]] = self.overrides.get(index)
+        if override is not None:
+            return override[0]
+        return self.string[self.starts[index]:self.ends[index]]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: int) -> Token:
+        if index < 0:
+            index += len(self.types)
+        value: Optional[str] = None
+        kind: Optional[str] = None
+        override: Optional[Tuple[str, Optional[str]]] = self.overrides.get(index)
+        if override is not None:
+            value, kind = override
+        return Token(TYPE_NAMES[self.types[index]], value, kind,
+                     source=self.string, start=self.starts[index], end=self.ends[index])
+
+    def __iter__(self) -> Iterator[Token]:
+        for index in range(len(self.types)):
+            yield self[index]
@@ -0,0 +1,142 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from .fqn import FQN
+from .parser import Parser
+from .pool import ScopePool
+
+
+class CacheInfo(NamedTuple):
+    """
+    Usage statistics of a `ParseCache`.
+
+    Attributes:
+        hits (int): Number of lookups answered from the cache.
+        misses (int): Number of lookups that had to parse the string.
+        evictions (int): Number of entries dropped to respect `maxsize`.
+        maxsize (int): Maximum number of cached entries.
+        currsize (int): Current number of cached entries.
+    """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """
+    A bounded, least-recently-used memo of parsed FQNs keyed by their input string.
+
+    FQNs are immutable, so cached results are shared between callers without copying.
+    All operations are thread-safe.
+
+    Attributes:
+        maxsize (int): Maximum number of cached entries. The least recently used entry is
+            evicted when a new one would exceed it.
+        pool (Optional[ScopePool]): The pool the scopes of parsed FQNs are taken from, if any.
+
+    Private Attributes:
+        __entries (OrderedDict[str, FQN]): Cached results, from least to most recently used.
+        __lock (Lock): Guards the entries and counters.
+    """
+
+    def __init__(self, maxsize: int = 4096, pool: Optional[ScopePool] = None) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of cached entries.
+            pool (Optional[ScopePool]): A pool to take the scopes of parsed FQNs from, so that
+                entries share them.
+
+        Raises:
+            ValueError: If `maxsize` is not positive.
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize: int = maxsize
+        self.pool: Optional[ScopePool] = pool
+        self.__entries: OrderedDict[str, FQN] = OrderedDict()
+        self.__lock: Lock = Lock()
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__evictions: int = 0
+
+    def parse(self, string: str) -> FQN:
+        """
+        Returns the parsed FQN of `string`, parsing it only if it is not cached.
+
+        Args:
+            string (str): The string to parse.
+
+        Returns:
+            FQN: The parsed FQN.
+
+        Raises:
+            SyntaxError: If the string can't be parsed. Failures are not cached.
+        """
+        fqn: Optional[FQN] = self.lookup(string)
+        if fqn is None:
+            fqn = Parser(string, pool=self.pool).parse()
+            self.store(string, fqn)
+        return fqn
+
+    def lookup(self, string: str) -> Optional[FQN]:
+        """
+        Returns the cached FQN of `string`, counting the lookup as a hit or a miss.
+
+        Args:
+            string (str): The parsed string.
+
+        Returns:
+            Optional[FQN]: The cached FQN, or None if it is not cached.
+        """
+        with self.__lock:
+            fqn = self.__entries.get(string)
+            if fqn is None:
+                self.__misses += 1
+                return None
+            self.__entries.move_to_end(string)
+            self.__hits += 1
+            return fqn
+
+    def store(self, string: str, fqn: FQN) -> None:
+        """
+        Caches the parsed FQN of `string`, evicting the least recently used entries if full.
+
+        Args:
+            string (str): The parsed string.
+            fqn (FQN): Its parsed FQN.
+        """
+        with self.__lock:
+            self.__entries[string] = fqn
+            self.__entries.move_to_end(string)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the current usage statistics of the cache.
+
+        Returns:
+            CacheInfo: Hit, miss and eviction counters plus the current size.
+        """
+        with self.__lock:
+            return CacheInfo(self.__hits, self.__misses, self.__evictions, self.maxsize, len(self.__entries))
+
+    def clear(self) -> None:
+        """
+        Drops every cached entry and resets the counters.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = self.__misses = self.__evictions = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, string: object) -> bool:
+        return string in self.__entries
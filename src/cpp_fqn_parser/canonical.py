@@ -0,0 +1,235 @@
+import re
+import sys
+from dataclasses import replace
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Set
+
+from .fqn import FQN
+from .scope import Scope
+
+# Names and numbers, '::', or any other single non-space character.
+_LEXEME_RE: Pattern[str] = re.compile(r"\w+|::|\S")
+
+_QUALIFIERS: Dict[str, int] = {"const": 0, "volatile": 1}
+
+# Words a qualifier never moves past, when moved to the front of the type it applies to.
+_BARRIERS = frozenset(["operator", "const", "volatile"])
+
+
+def normalize_type(text: str) -> str:
+    """
+    Returns the canonical spelling of a type, such as an argument, a return type or a template.
+
+    Whitespace is only kept between two words, after commas, and before the qualifiers of
+    pointers. A cv-qualifier written after the type it applies to is moved in front of it
+    (`four const &` becomes `const four&`), and qualifiers are sorted. Qualifiers of pointers
+    (`four * const`) stay where they are. Templates are normalized along with the rest of the text.
+
+    Args:
+        text (str): The type to normalize.
+
+    Returns:
+        str: The interned canonical spelling.
+    """
+    return _normalize_type(text)
+
+
+@lru_cache(maxsize=65536)
+def _normalize_type(text: str) -> str:
+    """
+    Memoized `normalize_type`, as the same types repeat across most symbols.
+    """
+    lexemes: List[str] = _LEXEME_RE.findall(text)
+
+    i: int = 0
+    while i < len(lexemes):
+        if lexemes[i] in _QUALIFIERS and i > 0 and _ends_type(lexemes[i - 1]):
+            start: int = _type_start(lexemes, i)
+            lexemes.insert(start, lexemes.pop(i))
+        i += 1
+
+    i = 0
+    while i < len(lexemes):
+        if lexemes[i] in _QUALIFIERS:
+            end: int = i
+            while end < len(lexemes) and lexemes[end] in _QUALIFIERS:
+                end += 1
+            qualifiers: List[str] = sorted(set(lexemes[i:end]), key=_QUALIFIERS.__getitem__)
+            lexemes[i:end] = qualifiers
+            i += len(qualifiers)
+        else:
+            i += 1
+
+    parts: List[str] = []
+    previous: str = ""
+    for lexeme in lexemes:
+        if previous == "," or (_is_word(previous) and _is_word(lexeme)) or (previous in ("*", "&") and lexeme in _QUALIFIERS):
+            parts.append(" ")
+        parts.append(lexeme)
+        previous = lexeme
+    return sys.intern("".join(parts))
+
+
+def _is_word(lexeme: str) -> bool:
+    return lexeme[:1].isalnum() or lexeme[:1] == "_"
+
+
+def _ends_type(lexeme: str) -> bool:
+    """
+    Checks whether a qualifier after `lexeme` applies to a type name rather than to a pointer.
+    """
+    return lexeme == ">" or (_is_word(lexeme) and lexeme not in _BARRIERS)
+
+
+def _type_start(lexemes: List[str], end: int) -> int:
+    """
+    Returns the index of the first lexeme of the (possibly scoped, templated or multi-word)
+    type name ending before `end`.
+    """
+    i: int = end - 1
+    while i >= 0:
+        lexeme: str = lexemes[i]
+        if lexeme == ">":
+            depth: int = 0
+            while i >= 0:
+                if lexemes[i] == ">":
+                    depth += 1
+                elif lexemes[i] == "<":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                i -= 1
+            i -= 1
+        elif lexeme == "::" or (_is_word(lexeme) and lexeme not in _BARRIERS):
+            i -= 1
+        else:
+            break
+    return i + 1
+
+
+def canonical_name(fqn: FQN) -> str:
+    """
+    Returns the canonical spelling of an FQN: its parts normalized by `normalize_type` and
+    joined back with fixed spacing. Equivalent spellings of a symbol share it.
+
+    Args:
+        fqn (FQN): The FQN.
+
+    Returns:
+        str: The canonical full name.
+    """
+    parts: List[str] = []
+    if fqn.return_type is not None:
+        parts.append(normalize_type(fqn.return_type))
+        parts.append(" ")
+    if fqn.scopes is not None:
+        parts.append(_scopes_name(fqn.scopes))
+        parts.append("::")
+    parts.append(normalize_type(fqn.name))
+    if fqn.template is not None:
+        parts.append(normalize_type(fqn.template))
+    parts.append("(")
+    if fqn.args is not None:
+        parts.append(", ".join([normalize_type(arg) for arg in fqn.args]))
+    parts.append(")")
+    if fqn.constant:
+        parts.append(" const")
+    if fqn.volatile:
+        parts.append(" volatile")
+    return "".join(parts)
+
+
+def canonicalize(fqn: FQN) -> FQN:
+    """
+    Returns the canonical form of an FQN, whose parts and full name are normalized.
+
+    Args:
+        fqn (FQN): The FQN.
+
+    Returns:
+        FQN: An FQN equal to the canonical form of every equivalent spelling of `fqn`.
+    """
+    return replace(fqn,
+                   name=normalize_type(fqn.name),
+                   full_name=canonical_name(fqn),
+                   return_type=normalize_type(fqn.return_type) if fqn.return_type is not None else None,
+                   args=tuple([normalize_type(arg) for arg in fqn.args]) if fqn.args is not None else None,
+                   scopes=tuple([_normalize_scope(scope) for scope in fqn.scopes]) if fqn.scopes is not None else None,
+                   template=normalize_type(fqn.template) if fqn.template is not None else None)
+
+
+def canonical_key(fqn: FQN, bits: int = 64) -> int:
+    """
+    Returns a compact key of an FQN, shared by its equivalent spellings: a hash of its
+    canonical name. Unlike `hash()`, keys are stable across processes and runs, so they can be
+    stored in place of full names.
+
+    Args:
+        fqn (FQN): The FQN.
+        bits (int): The key size: 64 or 128. Collisions become likely from about 2**32 (with
+            64 bits) or 2**64 (with 128 bits) distinct symbols.
+
+    Returns:
+        int: The unsigned key.
+
+    Raises:
+        ValueError: If `bits` is neither 64 nor 128.
+    """
+    return _key(canonical_name(fqn), bits)
+
+
+def scope_key(scopes: Optional[Sequence[Scope]], bits: int = 64) -> int:
+    """
+    Returns a compact key of a scope chain, shared by its equivalent spellings, see `canonical_key`.
+
+    Args:
+        scopes (Optional[Sequence[Scope]]): The scopes, from outermost to innermost, e.g. `FQN.scopes`.
+        bits (int): The key size: 64 or 128.
+
+    Returns:
+        int: The unsigned key.
+
+    Raises:
+        ValueError: If `bits` is neither 64 nor 128.
+    """
+    return _key(_scopes_name(scopes) if scopes else "", bits)
+
+
+def unique_fqns(fqns: Iterable[FQN], bits: int = 64) -> Iterator[FQN]:
+    """
+    Lazily drops the FQNs that are equivalent to an earlier one, by their `canonical_key`.
+
+    Args:
+        fqns (Iterable[FQN]): The FQNs.
+        bits (int): The key size: 64 or 128.
+
+    Yields:
+        Iterator[FQN]: The first FQN of each equivalence class.
+
+    Raises:
+        ValueError: If `bits` is neither 64 nor 128.
+    """
+    seen: Set[int] = set()
+    for fqn in fqns:
+        key: int = canonical_key(fqn, bits)
+        if key not in seen:
+            seen.add(key)
+            yield fqn
+
+
+def _normalize_scope(scope: Scope) -> Scope:
+    if scope.template is None:
+        return scope
+    return Scope(scope.name, normalize_type(scope.template))
+
+
+def _scopes_name(scopes: Sequence[Scope]) -> str:
+    return "::".join([scope.name + normalize_type(scope.template) if scope.template is not None else scope.name
+                      for scope in scopes])
+
+
+def _key(text: str, bits: int) -> int:
+    if bits != 64 and bits != 128:
+        raise ValueError(f"bits must be 64 or 128, got {bits}")
+    return int.from_bytes(blake2b(text.encode("utf-8"), digest_size=bits // 8).digest(), "little")
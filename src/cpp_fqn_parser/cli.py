@@ -0,0 +1,105 @@
+import argparse
+import sys
+from typing import IO, Iterator, List, Optional
+
+from . import __version__
+from .batch import ParseResult
+from .fqn import FQN
+from .stream import FORMATS, parse_stream, open_input, open_output, write_jsonl, write_csv, write_parquet
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """
+    Builds the argument parser of the `cpp-fqn-parser` command.
+
+    Returns:
+        argparse.ArgumentParser: The configured argument parser.
+    """
+    arg_parser = argparse.ArgumentParser(
+        prog="cpp-fqn-parser",
+        description="Parse newline-delimited C++ fully qualified names (e.g. `nm -C` or `c++filt` output) "
+                    "into structured records.")
+    arg_parser.add_argument("input", nargs="?", default="-",
+                            help="Input file, optionally gzip or zstd compressed. Defaults to stdin.")
+    arg_parser.add_argument("-o", "--output", default="-",
+                            help="Output file. Defaults to stdout. A '.gz' suffix compresses jsonl and csv output.")
+    arg_parser.add_argument("-f", "--format", choices=FORMATS, default="jsonl",
+                            help="Output format. Defaults to jsonl.")
+    arg_parser.add_argument("--nm", action="store_true",
+                            help="Input lines are `nm` output: strip the address and symbol type columns.")
+    arg_parser.add_argument("--mangled", action="store_true",
+                            help="Parse Itanium-mangled symbols ('_Z...') directly, without piping them through "
+                                 "c++filt. Other symbols are parsed as they are.")
+    arg_parser.add_argument("-j", "--workers", type=int, default=1,
+                            help="Number of worker processes, or threads with --threads. Defaults to 1.")
+    arg_parser.add_argument("--threads", action="store_true",
+                            help="Use worker threads instead of processes, for free-threaded Python builds.")
+    arg_parser.add_argument("--chunksize", type=int, default=1024,
+                            help="Number of lines sent to a worker at once.")
+    arg_parser.add_argument("--strict", action="store_true",
+                            help="Stop at the first line that can't be parsed instead of skipping it.")
+    arg_parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    return arg_parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the `cpp-fqn-parser` command.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The process exit code.
+    """
+    args = build_arg_parser().parse_args(argv)
+    if args.format == "parquet" and args.output == "-":
+        print("cpp-fqn-parser: parquet output requires --output", file=sys.stderr)
+        return 2
+
+    failures: List[SyntaxError] = []
+    try:
+        fileobj: IO[str] = open_input(args.input)
+    except OSError as e:
+        print(f"cpp-fqn-parser: {e}", file=sys.stderr)
+        return 2
+    with fileobj:
+        results = parse_stream(fileobj, nm=args.nm, workers=args.workers, chunksize=args.chunksize,
+                               errors="raise" if args.strict else "return", mangled=args.mangled,
+                               threads=args.threads)
+        fqns: Iterator[FQN] = _collect_failures(results, failures)
+        try:
+            if args.format == "parquet":
+                write_parquet(fqns, args.output)
+            else:
+                out: IO[str] = open_output(args.output)
+                try:
+                    (write_csv if args.format == "csv" else write_jsonl)(fqns, out)
+                finally:
+                    if out is not sys.stdout:
+                        out.close()
+        except SyntaxError as e:
+            print(f"cpp-fqn-parser: {e}", file=sys.stderr)
+            return 1
+        except OSError as e:
+            print(f"cpp-fqn-parser: {e}", file=sys.stderr)
+            return 2
+
+    if failures:
+        print(f"cpp-fqn-parser: skipped {len(failures)} line(s) that could not be parsed", file=sys.stderr)
+    return 0
+
+
+def _collect_failures(results: Iterator[ParseResult], failures: List[SyntaxError]) -> Iterator[FQN]:
+    """
+    Yields the parsed FQNs of `results`, appending parse errors to `failures`.
+    """
+    for result in results:
+        if isinstance(result, SyntaxError):
+            failures.append(result)
+        else:
+            yield result
+
+
+if __name__ == "__main__":
+    sys.exit(main())
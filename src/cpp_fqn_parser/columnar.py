@@ -0,0 +1,308 @@
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .fqn import FQN
+from .parser import Parser, ParseSpans
+from .scope import Scope
+
+ERROR_POLICIES = ("raise", "skip")
+
+# The dictionary-encoded string columns, with one code per row.
+_DICTIONARY_COLUMNS: Tuple[str, ...] = ("name", "template", "return_type", "scope_path")
+
+# The list columns, with their dictionary-encoded values and one offset per row, plus one.
+_LIST_COLUMNS: Tuple[str, ...] = ("args", "scopes")
+
+
+class _Dictionary:
+    """
+    The distinct values of a dictionary-encoded column, and the code of each of them.
+
+    Attributes:
+        values (List[str]): The values, in the order they were first met.
+        codes (Dict[str, int]): The index of each value in `values`.
+    """
+    __slots__ = ("values", "codes")
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        """
+        Returns the code of a value, adding it if it is new.
+        """
+        code: Optional[int] = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class SymbolColumns:
+    """
+    Parsed symbols stored column by column, in typed arrays rather than one `FQN` per row.
+
+    String columns are dictionary-encoded: each row holds an integer code into the column's
+    distinct values, -1 standing for None. Arguments and scopes are list columns: the codes of
+    every row's items are stored one after the other, and row `i` spans `offsets[i]` to
+    `offsets[i + 1]`. Each scope is encoded as its name followed by its template, if any.
+    Values are the same strings as in the FQNs `Parser` builds.
+
+    The columns are exposed as NumPy arrays (`to_numpy`) or as an Arrow table (`to_arrow`),
+    both sharing the memory of the arrays below instead of converting row by row.
+
+    Attributes:
+        full_name (List[str]): The input string of each row.
+        name (array): The code of each row's name.
+        template (array): The code of each row's template.
+        return_type (array): The code of each row's return type.
+        scope_path (array): The code of each row's scopes, joined by '::'.
+        arg_offsets (array): The start of each row's arguments in `args`, plus the end of the last row's.
+        args (array): The code of every argument.
+        arg_count (array): The number of arguments of each row.
+        scope_offsets (array): The start of each row's scopes in `scopes`, plus the end of the last row's.
+        scopes (array): The code of every scope.
+        constant (array): Whether each row is const-qualified, as 0 or 1.
+        volatile (array): Whether each row is volatile-qualified, as 0 or 1.
+        dictionaries (Dict[str, List[str]]): The distinct values of each dictionary-encoded column,
+            by column name ('name', 'template', 'return_type', 'scope_path', 'args' and 'scopes').
+        failures (int): The number of strings skipped because they could not be parsed.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes empty columns.
+        """
+        self.full_name: List[str] = []
+        self.name: array = array("i")
+        self.template: array = array("i")
+        self.return_type: array = array("i")
+        self.scope_path: array = array("i")
+        self.arg_offsets: array = array("i", [0])
+        self.args: array = array("i")
+        self.arg_count: array = array("i")
+        self.scope_offsets: array = array("i", [0])
+        self.scopes: array = array("i")
+        self.constant: array = array("b")
+        self.volatile: array = array("b")
+        self.failures: int = 0
+        self.__dictionaries: Dict[str, _Dictionary] = {column: _Dictionary()
+                                                        for column in _DICTIONARY_COLUMNS + _LIST_COLUMNS}
+
+    @property
+    def dictionaries(self) -> Dict[str, List[str]]:
+        return {column: dictionary.values for column, dictionary in self.__dictionaries.items()}
+
+    def append(self, string: str) -> None:
+        """
+        Parses a string into a new row. Nothing is appended if it can't be parsed.
+
+        Args:
+            string (str): The string to parse.
+
+        Raises:
+            SyntaxError: If the string can't be parsed.
+        """
+        parser: Parser = Parser(string)
+        spans: ParseSpans = parser.scan()
+        starts: array = parser.buffer.starts
+        ends: array = parser.buffer.ends
+
+        # Every value is sliced before any is encoded, so a string failing to parse leaves no
+        # unused entry in the dictionaries.
+        arg_values: List[str] = []
+        if spans.args is not None and (len(spans.args) > 1 or ends[spans.args[0][0] - 1] != starts[spans.args[0][1]]):
+            arg_values = [string[ends[lo - 1]:starts[hi]] for lo, hi in spans.args]
+
+        scope_values: List[str] = []
+        scope_path_value: Optional[str] = None
+        if spans.scopes is not None:
+            for name_index, template_indices in spans.scopes:
+                end: int = ends[template_indices[1]] if template_indices is not None else ends[name_index]
+                scope_values.append(string[starts[name_index]:end])
+            scope_path_value = string[starts[spans.scopes[0][0]]:end]
+
+        dictionaries: Dict[str, _Dictionary] = self.__dictionaries
+        encode_arg = dictionaries["args"].encode
+        args: List[int] = [encode_arg(value) for value in arg_values]
+        template: int = -1
+        if spans.template is not None:
+            template = dictionaries["template"].encode(string[starts[spans.template[0]]:ends[spans.template[1]]])
+        name: int = dictionaries["name"].encode(parser.buffer.value(spans.name))
+        encode_scope = dictionaries["scopes"].encode
+        scopes: List[int] = [encode_scope(value) for value in scope_values]
+        scope_path: int = dictionaries["scope_path"].encode(scope_path_value) if scope_path_value is not None else -1
+        return_type: int = -1
+        if spans.return_type is not None:
+            return_type = dictionaries["return_type"].encode(string[:ends[spans.return_type - 1]])
+
+        self.full_name.append(string)
+        self.name.append(name)
+        self.template.append(template)
+        self.return_type.append(return_type)
+        self.scope_path.append(scope_path)
+        self.args.extend(args)
+        self.arg_offsets.append(len(self.args))
+        self.arg_count.append(len(args))
+        self.scopes.extend(scopes)
+        self.scope_offsets.append(len(self.scopes))
+        self.constant.append(spans.constant)
+        self.volatile.append(spans.volatile)
+
+    def row(self, index: int) -> FQN:
+        """
+        Rebuilds the FQN of a row, e.g. to check it or to hand it to code expecting FQNs.
+
+        Args:
+            index (int): The row.
+
+        Returns:
+            FQN: The FQN the string of the row parses into.
+        """
+        values: Dict[str, List[str]] = self.dictionaries
+
+        def value(column: str, code: int) -> Optional[str]:
+            return values[column][code] if code >= 0 else None
+
+        args: List[str] = [values["args"][code] for code in self.args[self.arg_offsets[index]:self.arg_offsets[index + 1]]]
+        scopes: List[Scope] = []
+        for code in self.scopes[self.scope_offsets[index]:self.scope_offsets[index + 1]]:
+            text: str = values["scopes"][code]
+            split: int = text.find("<")
+            scopes.append(Scope(text, None) if split < 0 else Scope(text[:split], text[split:]))
+        return FQN(name=values["name"][self.name[index]],
+                   full_name=self.full_name[index],
+                   return_type=value("return_type", self.return_type[index]),
+                   args=tuple(args) if args else None,
+                   scopes=tuple(scopes) if scopes else None,
+                   template=value("template", self.template[index]),
+                   constant=bool(self.constant[index]),
+                   volatile=bool(self.volatile[index]))
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Exposes the columns as NumPy arrays. Requires the `numpy` package.
+
+        Code, offset and count columns are int32 arrays and qualifier columns bool arrays, which
+        share the memory of this object's arrays: they must not outlive it, nor be read after more
+        rows are appended. The values of each dictionary-encoded column are an object array under
+        the column name followed by '_values', and `full_name` is an object array.
+
+        Returns:
+            Dict[str, numpy.ndarray]: The arrays, by column name.
+
+        Raises:
+            ImportError: If `numpy` is not installed.
+        """
+        np = _numpy()
+        columns: Dict[str, Any] = {"full_name": np.array(self.full_name, dtype=object)}
+        for column in _DICTIONARY_COLUMNS + ("arg_offsets", "args", "arg_count", "scope_offsets", "scopes"):
+            columns[column] = np.frombuffer(getattr(self, column), dtype=np.int32)
+        for column in ("constant", "volatile"):
+            columns[column] = np.frombuffer(getattr(self, column), dtype=np.bool_)
+        for column, values in self.dictionaries.items():
+            columns[f"{column}_values"] = np.array(values, dtype=object)
+        return columns
+
+    def to_arrow(self) -> Any:
+        """
+        Exposes the columns as an Arrow table. Requires the `pyarrow` package.
+
+        String columns are dictionary arrays, `args` and `scopes` are lists of dictionary
+        values (null for rows without any) and `arg_count` is an int32 column. Codes and offsets
+        are read from this object's arrays without converting them row by row.
+
+        Returns:
+            pyarrow.Table: The table, with one row per parsed symbol.
+
+        Raises:
+            ImportError: If `pyarrow` is not installed.
+        """
+        pa, pc = _pyarrow()
+        values: Dict[str, List[str]] = self.dictionaries
+
+        def int32(data: array) -> Any:
+            return pa.Array.from_buffers(pa.int32(), len(data), [None, pa.py_buffer(data)])
+
+        def dictionary(column: str, codes: array) -> Any:
+            indices = int32(codes)
+            indices = pc.if_else(pc.less(indices, 0), pa.scalar(None, pa.int32()), indices)
+            return pa.DictionaryArray.from_arrays(indices, pa.array(values[column], pa.string()))
+
+        def flag(data: array) -> Any:
+            return pc.not_equal(pa.Array.from_buffers(pa.int8(), len(data), [None, pa.py_buffer(data)]), 0)
+
+        def list_column(column: str, offsets: array, codes: array, counts: Any) -> Any:
+            return pa.ListArray.from_arrays(int32(offsets), dictionary(column, codes), mask=pc.equal(counts, 0))
+
+        arg_count = int32(self.arg_count)
+        scope_count = pc.subtract(int32(self.scope_offsets)[1:], int32(self.scope_offsets)[:-1])
+        return pa.table({"name": dictionary("name", self.name),
+                         "full_name": pa.array(self.full_name, pa.string()),
+                         "return_type": dictionary("return_type", self.return_type),
+                         "args": list_column("args", self.arg_offsets, self.args, arg_count),
+                         "arg_count": arg_count,
+                         "scopes": list_column("scopes", self.scope_offsets, self.scopes, scope_count),
+                         "scope_path": dictionary("scope_path", self.scope_path),
+                         "template": dictionary("template", self.template),
+                         "constant": flag(self.constant),
+                         "volatile": flag(self.volatile)})
+
+    def __len__(self) -> int:
+        return len(self.full_name)
+
+
+def parse_columns(strings: Iterable[str], errors: str = "raise") -> SymbolColumns:
+    """
+    Parses many FQN strings straight into columns, without building an `FQN` per string.
+
+    Args:
+        strings (Iterable[str]): The strings to parse.
+        errors (str): What to do when a string fails to parse:
+            - 'raise': raise its SyntaxError.
+            - 'skip': leave it out of the columns, counting it in `failures`.
+
+    Returns:
+        SymbolColumns: One row per parsed string, in input order.
+
+    Raises:
+        ValueError: If `errors` is not a known policy.
+        SyntaxError: If a string fails to parse and `errors` is 'raise'.
+    """
+    if errors not in ERROR_POLICIES:
+        raise ValueError(f"Unknown error policy '{errors}'. Expected one of {ERROR_POLICIES}")
+
+    columns: SymbolColumns = SymbolColumns()
+    append = columns.append
+    for string in strings:
+        try:
+            append(string)
+        except SyntaxError:
+            if errors == "raise":
+                raise
+            columns.failures += 1
+    return columns
+
+
+def _numpy() -> Any:
+    """
+    Imports the optional `numpy` package.
+    """
+    try:
+        import numpy  # type: ignore[import-not-found, import-untyped, unused-ignore]
+    except ImportError as e:
+        raise ImportError("NumPy export requires the 'numpy' package") from e
+    return numpy
+
+
+def _pyarrow() -> Tuple[Any, Any]:
+    """
+    Imports the optional `pyarrow` package and its compute module.
+    """
+    try:
+        import pyarrow  # type: ignore[import-not-found, import-untyped, unused-ignore]
+        import pyarrow.compute  # type: ignore[import-not-found, import-untyped, unused-ignore]
+    except ImportError as e:
+        raise ImportError("Arrow export requires the 'pyarrow' package") from e
+    return pyarrow, pyarrow.compute
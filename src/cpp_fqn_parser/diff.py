@@ -0,0 +1,206 @@
+import os
+import tempfile
+from typing import Dict, IO, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from .fqn import FQN
+from .scope import Scope
+from .serialization import dump_many, load_many
+
+ADDED = "added"
+REMOVED = "removed"
+SIGNATURE_CHANGED = "signature_changed"
+QUALIFIER_CHANGED = "qualifier_changed"
+CHANGE_KINDS = (ADDED, REMOVED, SIGNATURE_CHANGED, QUALIFIER_CHANGED)
+
+# The key symbols are matched on: their scopes and name.
+_SymbolKey = Tuple[Optional[Tuple[Scope, ...]], str]
+
+# The signature of a symbol, but for its cv-qualifiers: args, template and return type.
+_Signature = Tuple[Optional[Tuple[str, ...]], Optional[str], Optional[str]]
+
+# Number of FQNs buffered per partition file before being written.
+_SPILL_CHUNK: int = 4096
+
+
+class SymbolChange(NamedTuple):
+    """
+    A difference between two symbol sets.
+
+    Attributes:
+        kind (str): One of `CHANGE_KINDS`:
+            - 'added': `new` has no counterpart in the old set.
+            - 'removed': `old` has no counterpart in the new set.
+            - 'signature_changed': `old` became `new`, with other args, template or return type.
+            - 'qualifier_changed': `old` became `new`, with only other cv-qualifiers.
+        old (Optional[FQN]): The old symbol, None if added.
+        new (Optional[FQN]): The new symbol, None if removed.
+    """
+    kind: str
+    old: Optional[FQN]
+    new: Optional[FQN]
+
+    @property
+    def fqn(self) -> FQN:
+        """
+        The symbol the change is about: the new one, or the old one if removed.
+        """
+        return self.new if self.new is not None else self.old  # type: ignore[return-value]
+
+
+def diff_symbols(old: Iterable[FQN], new: Iterable[FQN], partitions: int = 1,
+                 tmpdir: Optional[str] = None) -> Iterator[SymbolChange]:
+    """
+    Lazily compares two symbol sets, e.g. the exported symbols of two releases of a library.
+
+    Symbols are matched on their scopes and name, with hash lookups. Among the symbols sharing
+    both, those with the same full name are unchanged. An old and a new one that only differ by
+    their cv-qualifiers are a 'qualifier_changed'. If then a single old and a single new one are
+    left, they are a 'signature_changed'. Other leftovers, such as overloads that were added or
+    removed, are reported as 'added' and 'removed'.
+
+    With one partition, both sets are held in memory. With more, both are first spilled to
+    temporary files, partitioned by the hash of their key, and the partitions are compared one
+    at a time, so only about `1 / partitions` of the symbols are in memory at once.
+
+    Args:
+        old (Iterable[FQN]): The old symbols, e.g. from `parse_stream` or a `SymbolStore`.
+        new (Iterable[FQN]): The new symbols.
+        partitions (int): Number of partitions to compare separately.
+        tmpdir (Optional[str]): The directory of the partition files. Defaults to the system's.
+
+    Yields:
+        Iterator[SymbolChange]: The changes. Within a partition, changes come in the order
+            their symbols were first met.
+
+    Raises:
+        ValueError: If `partitions` is not positive.
+    """
+    if partitions < 1:
+        raise ValueError(f"partitions must be positive, got {partitions}")
+    if partitions == 1:
+        return _diff_partition(old, new)
+    return _diff_spilled(old, new, partitions, tmpdir)
+
+
+def _diff_spilled(old: Iterable[FQN], new: Iterable[FQN], partitions: int,
+                  tmpdir: Optional[str]) -> Iterator[SymbolChange]:
+    """
+    Generator behind `diff_symbols` with several partitions.
+    """
+    with tempfile.TemporaryDirectory(prefix="fqn-diff-", dir=tmpdir) as directory:
+        old_paths: List[str] = _spill(old, partitions, os.path.join(directory, "old"))
+        new_paths: List[str] = _spill(new, partitions, os.path.join(directory, "new"))
+        for old_path, new_path in zip(old_paths, new_paths):
+            with open(old_path, encoding="utf-8") as old_file, open(new_path, encoding="utf-8") as new_file:
+                yield from _diff_partition(load_many(old_file, "tuples"), load_many(new_file, "tuples"))
+
+
+def _spill(fqns: Iterable[FQN], partitions: int, prefix: str) -> List[str]:
+    """
+    Writes FQNs to one file per partition, in the 'tuples' format of `dump_many`.
+
+    Returns:
+        List[str]: The path of each partition file.
+    """
+    paths: List[str] = [f"{prefix}-{i}.jsonl" for i in range(partitions)]
+    files: List[IO[str]] = [open(path, "w", encoding="utf-8") for path in paths]
+    try:
+        buffers: List[List[FQN]] = [[] for _ in range(partitions)]
+        for fqn in fqns:
+            i: int = hash((fqn.scopes, fqn.name)) % partitions
+            buffer: List[FQN] = buffers[i]
+            buffer.append(fqn)
+            if len(buffer) >= _SPILL_CHUNK:
+                dump_many(buffer, files[i], "tuples")
+                buffer.clear()
+        for buffer, file in zip(buffers, files):
+            dump_many(buffer, file, "tuples")
+    finally:
+        for file in files:
+            file.close()
+    return paths
+
+
+def _diff_partition(old: Iterable[FQN], new: Iterable[FQN]) -> Iterator[SymbolChange]:
+    """
+    Compares two symbol sets in memory.
+    """
+    old_groups: Dict[_SymbolKey, List[FQN]] = _group(old)
+    new_groups: Dict[_SymbolKey, List[FQN]] = _group(new)
+
+    for key, olds in old_groups.items():
+        yield from _diff_group(olds, new_groups.pop(key, []))
+    for news in new_groups.values():
+        for fqn in news:
+            yield SymbolChange(ADDED, None, fqn)
+
+
+def _group(fqns: Iterable[FQN]) -> Dict[_SymbolKey, List[FQN]]:
+    """
+    Groups FQNs by their scopes and name.
+    """
+    groups: Dict[_SymbolKey, List[FQN]] = {}
+    for fqn in fqns:
+        key: _SymbolKey = (fqn.scopes, fqn.name)
+        group: Optional[List[FQN]] = groups.get(key)
+        if group is None:
+            groups[key] = [fqn]
+        else:
+            group.append(fqn)
+    return groups
+
+
+def _diff_group(olds: List[FQN], news: List[FQN]) -> Iterator[SymbolChange]:
+    """
+    Compares the old and new symbols sharing scopes and a name.
+    """
+    if len(olds) == 1 and len(news) == 1:
+        old, new = olds[0], news[0]
+        if old.full_name != new.full_name:
+            yield SymbolChange(_change_kind(old, new), old, new)
+        return
+
+    new_names: Dict[str, FQN] = {fqn.full_name: fqn for fqn in news}
+    old_names: Dict[str, FQN] = {fqn.full_name: fqn for fqn in olds}
+    olds = [fqn for fqn in olds if fqn.full_name not in new_names]
+    news = [fqn for fqn in news if fqn.full_name not in old_names]
+
+    signatures: Dict[_Signature, List[FQN]] = {}
+    for fqn in news:
+        signatures.setdefault(_signature(fqn), []).append(fqn)
+    paired: Dict[int, FQN] = {}
+    for fqn in olds:
+        candidates: Optional[List[FQN]] = signatures.get(_signature(fqn))
+        if candidates:
+            paired[id(fqn)] = candidates.pop(0)
+    matched: Set[int] = {id(fqn) for fqn in paired.values()}
+    news = [fqn for fqn in news if id(fqn) not in matched]
+
+    unpaired: List[FQN] = [fqn for fqn in olds if id(fqn) not in paired]
+    if len(unpaired) == 1 and len(news) == 1:
+        paired[id(unpaired[0])] = news.pop()
+
+    for fqn in olds:
+        counterpart: Optional[FQN] = paired.get(id(fqn))
+        if counterpart is None:
+            yield SymbolChange(REMOVED, fqn, None)
+        else:
+            yield SymbolChange(_change_kind(fqn, counterpart), fqn, counterpart)
+    for fqn in news:
+        yield SymbolChange(ADDED, None, fqn)
+
+
+def _signature(fqn: FQN) -> _Signature:
+    """
+    Returns the parts of a symbol's signature, but for its cv-qualifiers.
+    """
+    return fqn.args, fqn.template, fqn.return_type
+
+
+def _change_kind(old: FQN, new: FQN) -> str:
+    """
+    Classifies the change between two different symbols with the same scopes and name.
+    """
+    if _signature(old) == _signature(new) and (old.constant, old.volatile) != (new.constant, new.volatile):
+        return QUALIFIER_CHANGED
+    return SIGNATURE_CHANGED
@@ -1,21 +1,25 @@
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Sequence
 
 from .scope import Scope
-from .utils import to_dict, check_keys
+from .utils import check_keys
 
+_KEYS: List[str] = ["name", "full_name", "return_type", "args", "scopes", "template", "constant", "volatile"]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class FQN:
     """
     Represents a fully qualified name (FQN) of a function, method, or symbol.
 
+    FQNs are immutable and hashable, so they can be shared freely and used as dict keys or set members.
+
     Attributes:
         name (str): The simple (unqualified) name.
         full_name (str): The fully qualified name (e.g., including namespaces or modules).
         return_type (Optional[str]): The return type of the symbol, if known.
-        args (Optional[List[str]]): The list of argument types or names.
-        scopes (Optional[List[Scope]]): The lexical or semantic scopes the symbol belongs to.
+        args (Optional[Tuple[str, ...]]): The argument types or names.
+        scopes (Optional[Tuple[Scope, ...]]): The lexical or semantic scopes the symbol belongs to.
         template (Optional[str]): Template/generic type information, if applicable.
         constant (bool): Whether the symbol represents a constant value.
         volatile (bool): Whether the symbol is considered volatile (e.g., changes frequently or is side-effect-prone).
@@ -23,8 +27,8 @@ class FQN:
     name: str
     full_name: str
     return_type: Optional[str] = None
-    args: Optional[List[str]] = None
-    scopes: Optional[List[Scope]] = None
+    args: Optional[Tuple[str, ...]] = None
+    scopes: Optional[Tuple[Scope, ...]] = None
     template: Optional[str] = None
     constant: bool = False
     volatile: bool = False
@@ -50,17 +54,111 @@ class FQN:
                 self.volatile == other.volatile)
 
     def to_dict(self) -> Dict[str, Any]:
-        return to_dict(self)
+        """
+        Converts the FQN into a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The FQN attributes, with `args` and `scopes` as lists.
+        """
+        return {"name": self.name,
+                "full_name": self.full_name,
+                "return_type": self.return_type,
+                "args": list(self.args) if self.args is not None else None,
+                "scopes": [scope.to_dict() for scope in self.scopes] if self.scopes is not None else None,
+                "template": self.template,
+                "constant": self.constant,
+                "volatile": self.volatile}
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'FQN':
-        attrs: List[str] = ["name", "full_name", "return_type", "args", "scopes", "template", "constant", "volatile"]
-        check_keys(attrs, data)
-        return FQN(name=data["name"],
-                   full_name=data["full_name"],
-                   return_type=data["return_type"],
-                   args=data["args"],
-                   scopes=[Scope.from_dict(scope) for scope in data["scopes"]],
-                   template=data["template"],
-                   constant=data["constant"],
-                   volatile=data["volatile"])
+        """
+        Builds an FQN from a dictionary produced by `to_dict`.
+
+        Args:
+            data (Dict[str, Any]): The FQN attributes.
+
+        Returns:
+            FQN: The rebuilt FQN.
+
+        Raises:
+            KeyError: If any attribute is missing.
+        """
+        try:
+            args: Optional[List[str]] = data["args"]
+            scopes: Optional[List[Dict[str, Any]]] = data["scopes"]
+            return FQN(name=data["name"],
+                       full_name=data["full_name"],
+                       return_type=data["return_type"],
+                       args=tuple(args) if args is not None else None,
+                       scopes=tuple([Scope.from_dict(scope) for scope in scopes]) if scopes is not None else None,
+                       template=data["template"],
+                       constant=data["constant"],
+                       volatile=data["volatile"])
+        except KeyError:
+            check_keys(_KEYS, data)
+            raise
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Converts the FQN into a compact, positional encoding, e.g. for msgpack or JSON arrays.
+
+        Returns:
+            Tuple[Any, ...]: The attributes in declaration order, with each scope as a
+                `(name, template)` pair.
+        """
+        return (self.name,
+                self.full_name,
+                self.return_type,
+                self.args,
+                tuple([(scope.name, scope.template) for scope in self.scopes]) if self.scopes is not None else None,
+                self.template,
+                self.constant,
+                self.volatile)
+
+    @staticmethod
+    def from_tuple(data: Sequence[Any]) -> 'FQN':
+        """
+        Builds an FQN from the positional encoding produced by `to_tuple`. Nested sequences may
+        be lists, as produced by JSON or msgpack decoders.
+
+        Args:
+            data (Sequence[Any]): The FQN attributes in declaration order.
+
+        Returns:
+            FQN: The rebuilt FQN.
+        """
+        name, full_name, return_type, args, scopes, template, constant, volatile = data
+        return FQN(name=name,
+                   full_name=full_name,
+                   return_type=return_type,
+                   args=tuple(args) if args is not None else None,
+                   scopes=tuple([Scope(scope[0], scope[1]) for scope in scopes]) if scopes is not None else None,
+                   template=template,
+                   constant=constant,
+                   volatile=volatile)
+
+    def to_json(self) -> str:
+        """
+        Serializes the FQN as a JSON object.
+
+        Returns:
+            str: The JSON encoding of `to_dict()`.
+        """
+        import json
+
+        return json.dumps(self.to_dict())
+
+    @staticmethod
+    def from_json(data: str | bytes) -> 'FQN':
+        """
+        Deserializes an FQN from a JSON object produced by `to_json`.
+
+        Args:
+            data (str | bytes): The JSON document.
+
+        Returns:
+            FQN: The rebuilt FQN.
+        """
+        import json
+
+        return FQN.from_dict(json.loads(data))
@@ -0,0 +1,178 @@
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from .buffer import TokenBuffer
+from .fqn import FQN
+from .parser import Parser, ParseSpans
+from .scope import Scope
+from .tokenizer import Tokenizer
+
+# A span of the input string, as its start and end offsets.
+Span = Tuple[int, int]
+
+# The key of a scope: the span of its name and the span of its template, if any.
+_ScopeKey = Tuple[Span, Optional[Span]]
+
+
+class IncrementalParse:
+    """
+    A parsed FQN that can be re-parsed cheaply after an edit of its string, e.g. on every
+    keystroke of a symbol browser.
+
+    Editing re-tokenizes only the region around the edit (see `Tokenizer.retokenize`), and the
+    arguments, templates and scopes whose text lies entirely outside of it are reused from the
+    previous result instead of being sliced and built again. The FQN is always the same as
+    `Parser(string).parse()`.
+
+    Attributes:
+        string (str): The parsed string.
+        buffer (TokenBuffer): Its tokens.
+        fqn (FQN): The parsed FQN.
+
+    Private Attributes:
+        _args (Dict[Span, str]): Each argument, by its span.
+        _templates (Dict[Span, str]): The template of the symbol and of its scopes, by their span.
+        _scopes (Dict[_ScopeKey, Scope]): Each scope, by the spans of its name and template.
+    """
+    __slots__ = ("string", "buffer", "fqn", "_args", "_templates", "_scopes")
+
+    def __init__(self, string: str, buffer: Optional[TokenBuffer] = None,
+                 previous: Optional['IncrementalParse'] = None, edit: Optional[Tuple[int, int, int]] = None) -> None:
+        """
+        Parses a string.
+
+        Args:
+            string (str): The string to parse.
+            buffer (Optional[TokenBuffer]): Its tokens, if already tokenized.
+            previous (Optional[IncrementalParse]): The parse of the string before `edit`, whose
+                components are reused. Use `edit` rather than passing it directly.
+            edit (Optional[Tuple[int, int, int]]): The position of the edit and the number of
+                characters it removed and inserted.
+
+        Raises:
+            SyntaxError: If the string can't be parsed.
+        """
+        self.string: str = string
+        self.buffer: TokenBuffer = buffer if buffer is not None else Tokenizer(string).tokenize()
+        self._args: Dict[Span, str] = {}
+        self._templates: Dict[Span, str] = {}
+        self._scopes: Dict[_ScopeKey, Scope] = {}
+        self.fqn: FQN = self._parse(previous, edit)
+
+    def edit(self, offset: int, removed: int, inserted: str) -> 'IncrementalParse':
+        """
+        Parses the string resulting from an edit of this one.
+
+        Args:
+            offset (int): The position of the edit.
+            removed (int): The number of characters removed at `offset`.
+            inserted (str): The text inserted at `offset`.
+
+        Returns:
+            IncrementalParse: The parse of the edited string.
+
+        Raises:
+            ValueError: If the edit is out of the bounds of the string.
+            SyntaxError: If the edited string can't be parsed.
+        """
+        if offset < 0 or removed < 0 or offset + removed > len(self.string):
+            raise ValueError(f"Edit ({offset}, {removed}) is out of the bounds of a {len(self.string)} characters string")
+        string: str = self.string[:offset] + inserted + self.string[offset + removed:]
+        buffer: TokenBuffer = Tokenizer(string).retokenize(self.buffer, offset, removed, len(inserted))
+        return IncrementalParse(string, buffer, self, (offset, removed, len(inserted)))
+
+    def _parse(self, previous: Optional['IncrementalParse'], edit: Optional[Tuple[int, int, int]]) -> FQN:
+        """
+        Builds the components found by `Parser.scan`, except those that `previous` has outside
+        of `edit`.
+        """
+        string: str = self.string
+        starts: array = self.buffer.starts
+        ends: array = self.buffer.ends
+        spans: ParseSpans = Parser(string, self.buffer).scan()
+
+        def old_span(span: Span) -> Optional[Span]:
+            """The span of the same text in the previous string, if it is outside the edit."""
+            if edit is None:
+                return None
+            offset, removed, inserted = edit
+            if span[1] <= offset:
+                return span
+            if span[0] >= offset + inserted:
+                return span[0] - inserted + removed, span[1] - inserted + removed
+            return None
+
+        def template(span: Span) -> str:
+            old: Optional[Span] = old_span(span)
+            text: Optional[str] = previous._templates.get(old) if previous is not None and old is not None else None
+            if text is None:
+                text = sys.intern(string[span[0]:span[1]])
+            self._templates[span] = text
+            return text
+
+        args: Optional[Tuple[str, ...]] = None
+        if spans.args is not None:
+            arg_list: List[str] = []
+            for lo, hi in spans.args:
+                span: Span = (ends[lo - 1], starts[hi])
+                old: Optional[Span] = old_span(span)
+                arg: Optional[str] = previous._args.get(old) if previous is not None and old is not None else None
+                if arg is None:
+                    arg = sys.intern(string[span[0]:span[1]])
+                self._args[span] = arg
+                arg_list.append(arg)
+            if len(arg_list) > 1 or arg_list[0]:
+                args = _reuse(tuple(arg_list), previous.fqn.args if previous is not None else None)
+
+        fqn_template: Optional[str] = None
+        if spans.template is not None:
+            fqn_template = template((starts[spans.template[0]], ends[spans.template[1]]))
+
+        name: str = sys.intern(self.buffer.value(spans.name))
+
+        scopes: Optional[Tuple[Scope, ...]] = None
+        if spans.scopes is not None:
+            scope_list: List[Scope] = []
+            for name_index, template_indices in spans.scopes:
+                name_span: Span = (starts[name_index], ends[name_index])
+                template_span: Optional[Span] = None
+                if template_indices is not None:
+                    template_span = (starts[template_indices[0]], ends[template_indices[1]])
+                scope: Optional[Scope] = None
+                old_name: Optional[Span] = old_span(name_span)
+                old_template: Optional[Span] = old_span(template_span) if template_span is not None else None
+                if previous is not None and old_name is not None and (template_span is None or old_template is not None):
+                    scope = previous._scopes.get((old_name, old_template))
+                if scope is None:
+                    scope = Scope(sys.intern(string[name_span[0]:name_span[1]]),
+                                  template(template_span) if template_span is not None else None)
+                elif template_span is not None and scope.template is not None:
+                    self._templates[template_span] = scope.template
+                self._scopes[(name_span, template_span)] = scope
+                scope_list.append(scope)
+            scopes = _reuse(tuple(scope_list), previous.fqn.scopes if previous is not None else None)
+
+        return_type: Optional[str] = None
+        if spans.return_type is not None:
+            text: str = string[:ends[spans.return_type - 1]]
+            return_type = previous.fqn.return_type if previous is not None and previous.fqn.return_type == text else sys.intern(text)
+
+        return FQN(name=name,
+                   full_name=string,
+                   return_type=return_type,
+                   args=args,
+                   scopes=scopes,
+                   template=fqn_template,
+                   constant=spans.constant,
+                   volatile=spans.volatile)
+
+
+def _reuse(items: Tuple, previous: Optional[Tuple]) -> Tuple:
+    """
+    Returns `previous` if it holds the very same objects as `items`, so that unchanged tuples
+    are shared too.
+    """
+    if previous is not None and len(previous) == len(items) and all(a is b for a, b in zip(items, previous)):
+        return previous
+    return items
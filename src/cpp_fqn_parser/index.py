@@ -0,0 +1,326 @@
+from typing import Any, Optional, Dict, Set, List, Iterable, Iterator, Sequence, Tuple, Union
+
+from .fqn import FQN
+from .scope import Scope
+from .serialization import dump_many, load_many
+
+ScopePath = Union[str, Sequence[Scope]]
+
+# Default of `FQNIndex.find(template=...)`, as None is a valid template filter.
+_ANY: Any = object()
+
+
+class _ScopeNode:
+    """
+    A node of the scope trie: the symbols declared directly in a scope chain, and its children.
+
+    Attributes:
+        children (Dict[Scope, _ScopeNode]): Nested scopes, by scope.
+        ids (Set[int]): Ids of the symbols whose scope chain ends at this node.
+    """
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: Dict[Scope, _ScopeNode] = {}
+        self.ids: Set[int] = set()
+
+
+class FQNIndex:
+    """
+    An in-memory index of parsed FQNs answering scope, name, template and arity queries.
+
+    Symbols are kept in a trie keyed on their scope chain, plus hash indexes on `name`,
+    `template` and arity (the number of arguments), so queries only touch matching symbols.
+    The index behaves like a set: adding an FQN that is already present does nothing.
+
+    Scope chains can be given as a sequence of Scope objects or as a string such as
+    'ns::Foo<T>', whose templates must be written as they appear in the parsed symbols.
+
+    Private Attributes:
+        _ids (Dict[FQN, int]): Id of each indexed FQN.
+        _symbols (Dict[int, FQN]): Indexed FQNs, by id.
+        _root (_ScopeNode): The root of the scope trie (symbols without scopes).
+        _by_name (Dict[str, Set[int]]): Ids of the symbols with each name.
+        _by_template (Dict[Optional[str], Set[int]]): Ids of the symbols with each template.
+        _by_arity (Dict[int, Set[int]]): Ids of the symbols with each number of arguments.
+        _next_id (int): Id given to the next added FQN.
+    """
+
+    def __init__(self, fqns: Iterable[FQN] = ()) -> None:
+        """
+        Initializes the index, optionally adding some FQNs.
+
+        Args:
+            fqns (Iterable[FQN]): FQNs to add.
+        """
+        self._ids: Dict[FQN, int] = {}
+        self._symbols: Dict[int, FQN] = {}
+        self._root: _ScopeNode = _ScopeNode()
+        self._by_name: Dict[str, Set[int]] = {}
+        self._by_template: Dict[Optional[str], Set[int]] = {}
+        self._by_arity: Dict[int, Set[int]] = {}
+        self._next_id: int = 0
+        self.update(fqns)
+
+    def add(self, fqn: FQN) -> None:
+        """
+        Adds an FQN to the index.
+
+        Args:
+            fqn (FQN): The FQN to add.
+        """
+        if fqn in self._ids:
+            return
+        fqn_id: int = self._next_id
+        self._next_id += 1
+        self._ids[fqn] = fqn_id
+        self._symbols[fqn_id] = fqn
+
+        node: _ScopeNode = self._root
+        for scope in fqn.scopes or ():
+            child: Optional[_ScopeNode] = node.children.get(scope)
+            if child is None:
+                child = node.children[scope] = _ScopeNode()
+            node = child
+        node.ids.add(fqn_id)
+
+        self._by_name.setdefault(fqn.name, set()).add(fqn_id)
+        self._by_template.setdefault(fqn.template, set()).add(fqn_id)
+        self._by_arity.setdefault(_arity(fqn), set()).add(fqn_id)
+
+    def update(self, fqns: Iterable[FQN]) -> None:
+        """
+        Adds several FQNs to the index.
+
+        Args:
+            fqns (Iterable[FQN]): The FQNs to add.
+        """
+        for fqn in fqns:
+            self.add(fqn)
+
+    def discard(self, fqn: FQN) -> bool:
+        """
+        Removes an FQN from the index, if present.
+
+        Args:
+            fqn (FQN): The FQN to remove.
+
+        Returns:
+            bool: True if the FQN was indexed, False otherwise.
+        """
+        fqn_id: Optional[int] = self._ids.pop(fqn, None)
+        if fqn_id is None:
+            return False
+        del self._symbols[fqn_id]
+
+        path: List[Tuple[_ScopeNode, Scope]] = []
+        node: _ScopeNode = self._root
+        for scope in fqn.scopes or ():
+            path.append((node, scope))
+            node = node.children[scope]
+        node.ids.discard(fqn_id)
+        for parent, scope in reversed(path):
+            if node.ids or node.children:
+                break
+            del parent.children[scope]
+            node = parent
+
+        _discard(self._by_name, fqn.name, fqn_id)
+        _discard(self._by_template, fqn.template, fqn_id)
+        _discard(self._by_arity, _arity(fqn), fqn_id)
+        return True
+
+    def by_name(self, name: str) -> List[FQN]:
+        """
+        Returns the symbols with a given name, e.g. every overload of 'operator=='.
+
+        Args:
+            name (str): The unqualified name.
+
+        Returns:
+            List[FQN]: The matching FQNs, in insertion order.
+        """
+        return self._resolve(self._by_name.get(name, ()))
+
+    def by_template(self, template: Optional[str]) -> List[FQN]:
+        """
+        Returns the symbols with a given template (None for non-template symbols).
+
+        Args:
+            template (Optional[str]): The raw template string, e.g. '<int>'.
+
+        Returns:
+            List[FQN]: The matching FQNs, in insertion order.
+        """
+        return self._resolve(self._by_template.get(template, ()))
+
+    def by_arity(self, arity: int) -> List[FQN]:
+        """
+        Returns the symbols taking a given number of arguments.
+
+        Args:
+            arity (int): The number of arguments.
+
+        Returns:
+            List[FQN]: The matching FQNs, in insertion order.
+        """
+        return self._resolve(self._by_arity.get(arity, ()))
+
+    def in_scope(self, scope: ScopePath, recursive: bool = False) -> List[FQN]:
+        """
+        Returns the symbols declared in a scope chain, e.g. every method of 'ns::Foo<T>'.
+
+        Args:
+            scope (Union[str, Sequence[Scope]]): The scope chain.
+            recursive (bool): Whether to include symbols of nested scopes too, e.g. everything
+                under namespace 'boost::asio'.
+
+        Returns:
+            List[FQN]: The matching FQNs, in insertion order.
+        """
+        return self._resolve(self._scope_ids(scope, recursive))
+
+    def find(self,
+             name: Optional[str] = None,
+             scope: Optional[ScopePath] = None,
+             template: Optional[str] = _ANY,
+             arity: Optional[int] = None,
+             recursive: bool = False) -> List[FQN]:
+        """
+        Returns the symbols matching every given criterion.
+
+        Args:
+            name (Optional[str]): The unqualified name, if any.
+            scope (Optional[Union[str, Sequence[Scope]]]): The scope chain, if any.
+            template (Optional[str]): The template, if given. None matches non-template symbols.
+            arity (Optional[int]): The number of arguments, if any.
+            recursive (bool): Whether `scope` includes nested scopes.
+
+        Returns:
+            List[FQN]: The matching FQNs, in insertion order.
+        """
+        candidates: List[Set[int]] = []
+        if name is not None:
+            candidates.append(self._by_name.get(name, set()))
+        if template is not _ANY:
+            candidates.append(self._by_template.get(template, set()))
+        if arity is not None:
+            candidates.append(self._by_arity.get(arity, set()))
+        if scope is not None:
+            candidates.append(self._scope_ids(scope, recursive))
+        if not candidates:
+            return list(self)
+
+        candidates.sort(key=len)
+        ids: Set[int] = set(candidates[0]).intersection(*candidates[1:])
+        return self._resolve(ids)
+
+    def save(self, path: str) -> None:
+        """
+        Saves the indexed FQNs to a file, in the 'tuples' format of `dump_many`.
+
+        Args:
+            path (str): The file to write.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            dump_many(self, f, "tuples")
+
+    @staticmethod
+    def load(path: str) -> 'FQNIndex':
+        """
+        Loads an index saved with `save`.
+
+        Args:
+            path (str): The file to read.
+
+        Returns:
+            FQNIndex: The rebuilt index.
+        """
+        with open(path, encoding="utf-8") as f:
+            return FQNIndex(load_many(f, "tuples"))
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, fqn: object) -> bool:
+        return fqn in self._ids
+
+    def __iter__(self) -> Iterator[FQN]:
+        return iter(list(self._symbols.values()))
+
+    def _scope_ids(self, scope: ScopePath, recursive: bool) -> Set[int]:
+        """
+        Returns the ids of the symbols of a scope chain, and of its nested scopes if `recursive`.
+        """
+        node: Optional[_ScopeNode] = self._root
+        for item in parse_scope_path(scope) if isinstance(scope, str) else scope:
+            node = node.children.get(item) if node is not None else None
+        if node is None:
+            return set()
+        if not recursive:
+            return node.ids
+
+        ids: Set[int] = set()
+        stack: List[_ScopeNode] = [node]
+        while stack:
+            node = stack.pop()
+            ids.update(node.ids)
+            stack.extend(node.children.values())
+        return ids
+
+    def _resolve(self, ids: Iterable[int]) -> List[FQN]:
+        """
+        Returns the FQNs of some ids, in insertion order.
+        """
+        return [self._symbols[fqn_id] for fqn_id in sorted(ids)]
+
+
+def parse_scope_path(path: str) -> Tuple[Scope, ...]:
+    """
+    Splits a scope chain such as 'ns::Foo<std::pair<int, int> >' into Scope objects.
+
+    Args:
+        path (str): The scope chain, without a trailing '::'.
+
+    Returns:
+        Tuple[Scope, ...]: The scopes, outermost first. Empty for an empty path.
+    """
+    scopes: List[Scope] = []
+    depth: int = 0
+    start: int = 0
+    template_start: int = -1
+    i: int = 0
+    while i <= len(path):
+        if i == len(path) or (depth == 0 and path.startswith("::", i)):
+            if i > start:
+                end: int = template_start if template_start >= 0 else i
+                scopes.append(Scope(path[start:end], path[end:i] if template_start >= 0 else None))
+            start = i + 2
+            template_start = -1
+            i += 2
+            continue
+        if path[i] == "<":
+            if depth == 0:
+                template_start = i
+            depth += 1
+        elif path[i] == ">":
+            depth -= 1
+        i += 1
+    return tuple(scopes)
+
+
+def _arity(fqn: FQN) -> int:
+    """
+    Returns the number of arguments of an FQN.
+    """
+    return len(fqn.args) if fqn.args is not None else 0
+
+
+def _discard(index: Dict, key: object, fqn_id: int) -> None:
+    """
+    Removes an id from a hash index, dropping the key once it has no ids left.
+    """
+    ids: Set[int] = index[key]
+    ids.discard(fqn_id)
+    if not ids:
+        del index[key]
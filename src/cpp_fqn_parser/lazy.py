@@ -0,0 +1,162 @@
+from typing import Optional, Tuple, Dict, Any, Callable, List
+
+from .fqn import FQN
+from .parser import Parser
+from .scope import Scope
+
+
+class LazyFQN:
+    """
+    A view of a fully qualified name (FQN) that parses its components on first access.
+
+    The parser reads an FQN backwards, in this order: qualifiers, arguments, template, name,
+    scopes and return type. Reading an attribute only runs the parsing steps up to the one
+    that produces it, and each result is kept for later accesses. The input is tokenized on
+    the first access to any parsed attribute, so e.g. grouping symbols by `name` never builds
+    their scopes nor return type.
+
+    Once every attribute has been read, the values are the same as those of
+    `Parser(full_name).parse()`.
+
+    Attributes:
+        full_name (str): The original input string.
+
+    Private Attributes:
+        _parser (Optional[Parser]): The parser, created on first access.
+        _parsed (Dict[str, Any]): The components parsed so far, by attribute name.
+        _error (Optional[SyntaxError]): The error raised by the last step run, if any.
+    """
+    __slots__ = ("full_name", "_parser", "_parsed", "_error")
+
+    def __init__(self, string: str) -> None:
+        """
+        Initializes the view without tokenizing nor parsing anything.
+
+        Args:
+            string (str): The string to parse.
+        """
+        self.full_name: str = string
+        self._parser: Optional[Parser] = None
+        self._parsed: Dict[str, Any] = {}
+        self._error: Optional[SyntaxError] = None
+
+    def _get(self, attr: str) -> Any:
+        """
+        Returns a parsed component, running the parsing steps up to it if needed.
+
+        Args:
+            attr (str): The name of the component.
+
+        Returns:
+            Any: The parsed component.
+
+        Raises:
+            SyntaxError: If the input can't be parsed up to the component.
+        """
+        parsed: Dict[str, Any] = self._parsed
+        if attr in parsed:
+            return parsed[attr]
+        if self._error is not None:
+            raise self._error
+
+        if self._parser is None:
+            self._parser = Parser(self.full_name)
+        try:
+            for step in _STEPS:
+                if step[0] in parsed:
+                    continue
+                parsed.update(zip(step, _run(self._parser, step)))
+                if attr in parsed:
+                    break
+        except SyntaxError as e:
+            self._error = e
+            raise
+        return parsed[attr]
+
+    @property
+    def name(self) -> str:
+        return self._get("name")
+
+    @property
+    def return_type(self) -> Optional[str]:
+        return self._get("return_type")
+
+    @property
+    def args(self) -> Optional[Tuple[str, ...]]:
+        return self._get("args")
+
+    @property
+    def scopes(self) -> Optional[Tuple[Scope, ...]]:
+        return self._get("scopes")
+
+    @property
+    def template(self) -> Optional[str]:
+        return self._get("template")
+
+    @property
+    def constant(self) -> bool:
+        return self._get("constant")
+
+    @property
+    def volatile(self) -> bool:
+        return self._get("volatile")
+
+    def to_fqn(self) -> FQN:
+        """
+        Parses every remaining component and returns the equivalent FQN.
+
+        Returns:
+            FQN: The fully parsed FQN.
+        """
+        return FQN(name=self.name,
+                   full_name=self.full_name,
+                   return_type=self.return_type,
+                   args=self.args,
+                   scopes=self.scopes,
+                   template=self.template,
+                   constant=self.constant,
+                   volatile=self.volatile)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare this view with an FQN or another view, parsing every component.
+
+        Args:
+            other (object): Another object to compare with.
+
+        Returns:
+            bool: True if `other` has equal attributes, False otherwise.
+        """
+        if isinstance(other, LazyFQN):
+            other = other.to_fqn()
+        return isinstance(other, FQN) and self.to_fqn() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        parsed: str = ", ".join(f"{attr}={value!r}" for attr, value in self._parsed.items())
+        return f"LazyFQN(full_name={self.full_name!r}{', ' if parsed else ''}{parsed})"
+
+
+def _run(parser: Parser, step: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """
+    Runs the parser method producing the components of `step`.
+    """
+    result: Any = _METHODS[step[0]](parser)
+    if step == ("constant", "volatile"):
+        return result["constant"], result["volatile"]
+    return (result,)
+
+
+# The parsing steps, in the order the parser must run them. Qualifiers are parsed together.
+_STEPS: List[Tuple[str, ...]] = [("constant", "volatile"), ("args",), ("template",), ("name",),
+                                 ("scopes",), ("return_type",)]
+
+_METHODS: Dict[str, Callable[[Parser], Any]] = {
+    "constant": Parser._parse_qualifiers,
+    "args": Parser._parse_args,
+    "template": Parser._parse_template,
+    "name": Parser._parse_name,
+    "scopes": Parser._parse_scopes,
+    "return_type": Parser._parse_return_type,
+}
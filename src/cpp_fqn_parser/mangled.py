@@ -0,0 +1,557 @@
+import sys
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .fqn import FQN
+from .scope import Scope
+
+# Builtin types, by their one-letter code, as c++filt prints them.
+_BUILTIN_TYPES: Dict[str, str] = {
+    'v': "void", 'w': "wchar_t", 'b': "bool", 'c': "char", 'a': "signed char", 'h': "unsigned char",
+    's': "short", 't': "unsigned short", 'i': "int", 'j': "unsigned int", 'l': "long", 'm': "unsigned long",
+    'x': "long long", 'y': "unsigned long long", 'n': "__int128", 'o': "unsigned __int128",
+    'f': "float", 'd': "double", 'e': "long double", 'g': "__float128",
+}
+
+# Builtin types with a 'D' prefix.
+_EXTENDED_TYPES: Dict[str, str] = {'i': "char32_t", 's': "char16_t", 'u': "char8_t"}
+
+# Operators, by their two-letter code, as they follow the 'operator' keyword.
+_OPERATORS: Dict[str, str] = {
+    'nw': " new", 'na': " new[]", 'dl': " delete", 'da': " delete[]", 'aw': " co_await",
+    'ps': "+", 'ng': "-", 'ad': "&", 'de': "*", 'co': "~",
+    'pl': "+", 'mi': "-", 'ml': "*", 'dv': "/", 'rm': "%", 'an': "&", 'or': "|", 'eo': "^",
+    'aS': "=", 'pL': "+=", 'mI': "-=", 'mL': "*=", 'dV': "/=", 'rM': "%=", 'aN': "&=", 'oR': "|=", 'eO': "^=",
+    'ls': "<<", 'rs': ">>", 'lS': "<<=", 'rS': ">>=",
+    'eq': "==", 'ne': "!=", 'lt': "<", 'gt': ">", 'le': "<=", 'ge': ">=", 'ss': "<=>",
+    'nt': "!", 'aa': "&&", 'oo': "||", 'pp': "++", 'mm': "--", 'cm': ",", 'pm': "->*", 'pt': "->",
+    'cl': "()", 'ix': "[]",
+}
+
+_STD: Scope = Scope("std")
+_CHAR_TRAITS: str = "std::char_traits<char>"
+
+# Abbreviated substitutions of the standard library, expanded as c++filt does.
+_STD_SUBSTITUTIONS: Dict[str, Tuple[Scope, ...]] = {
+    'a': (_STD, Scope("allocator")),
+    'b': (_STD, Scope("basic_string")),
+    's': (_STD, Scope("basic_string", f"<char, {_CHAR_TRAITS}, std::allocator<char> >")),
+    'i': (_STD, Scope("basic_istream", f"<char, {_CHAR_TRAITS} >")),
+    'o': (_STD, Scope("basic_ostream", f"<char, {_CHAR_TRAITS} >")),
+    'd': (_STD, Scope("basic_iostream", f"<char, {_CHAR_TRAITS} >")),
+}
+
+# Kinds of the last component of a name.
+_NAME, _OPERATOR, _CONVERSION, _CONSTRUCTOR = range(4)
+
+
+class _Node(NamedTuple):
+    """
+    A demangled component, kept in the substitution table.
+
+    Attributes:
+        text (str): Its text, as c++filt prints it.
+        scopes (Optional[Tuple[Scope, ...]]): The scope chain of a name, outermost first, so that
+            substituting it as a prefix reuses its Scope objects. None for other types.
+        pack (Optional[Tuple[_Node, ...]]): The elements of a template argument pack, or None
+            if the node is not a pack.
+    """
+    text: str
+    scopes: Optional[Tuple[Scope, ...]] = None
+    pack: Optional[Tuple['_Node', ...]] = None
+
+
+def _scopes_text(scopes: Tuple[Scope, ...]) -> str:
+    """
+    Joins a scope chain into a qualified name, e.g. 'std::vector<int>'.
+    """
+    return "::".join(scope.name if scope.template is None else scope.name + scope.template for scope in scopes)
+
+
+def is_mangled(symbol: str) -> bool:
+    """
+    Checks whether a symbol is an Itanium C++ ABI mangled name.
+
+    Args:
+        symbol (str): The symbol to check.
+
+    Returns:
+        bool: True if it starts with the '_Z' prefix.
+    """
+    return symbol.startswith("_Z")
+
+
+def parse_mangled(symbol: str) -> FQN:
+    """
+    Parses an Itanium C++ ABI mangled function name (e.g. '_ZN3foo3barEi') into an FQN, without
+    demangling it to text first.
+
+    The result is the FQN `Parser` builds from the c++filt output of the symbol, which is its
+    `full_name`. Components are built once and referenced through the mangling's substitution
+    table, so repeated scopes and types are shared rather than rebuilt.
+
+    Args:
+        symbol (str): The mangled name.
+
+    Returns:
+        FQN: The parsed FQN.
+
+    Raises:
+        SyntaxError: If the symbol is not a mangled function name, uses a construct `Parser`
+            can't represent (e.g. destructors, function pointers, literals, special names), or
+            is malformed.
+    """
+    return _Demangler(symbol).parse()
+
+
+class _Demangler:
+    """
+    A recursive descent parser over the subset of the Itanium C++ ABI mangling grammar that
+    `Parser` can represent.
+
+    Attributes:
+        symbol (str): The mangled name.
+
+    Private Attributes:
+        __pos (int): The current position in the mangled name.
+        __substitutions (List[_Node]): The substitution candidates, in the order they were met.
+        __template_args (Optional[List[_Node]]): The template arguments of the function, which
+            template parameters refer to.
+        __pack_index (Optional[int]): The element of the packs being expanded, within a pack
+            expansion.
+        __pack_size (Optional[int]): The size of the pack being expanded, once met.
+    """
+
+    def __init__(self, symbol: str) -> None:
+        """
+        Initializes the demangler.
+
+        Args:
+            symbol (str): The mangled name.
+        """
+        self.symbol: str = symbol
+        self.__pos: int = 0
+        self.__substitutions: List[_Node] = []
+        self.__template_args: Optional[List[_Node]] = None
+        self.__pack_index: Optional[int] = None
+        self.__pack_size: Optional[int] = None
+
+    def parse(self) -> FQN:
+        """
+        Parses the mangled function name.
+
+        Returns:
+            FQN: The parsed FQN.
+
+        Raises:
+            SyntaxError: If the symbol can't be parsed.
+        """
+        if not is_mangled(self.symbol):
+            raise SyntaxError(f"'{self.symbol}' is not a mangled name")
+        self.__pos = 2
+        if self._peek() == 'T' or self._peek() == 'G':
+            raise SyntaxError(f"Special name '{self.symbol}' is not a function")
+
+        scopes, kind, qualifiers = self._name(function=True)
+        if self.__pos == len(self.symbol):
+            raise SyntaxError(f"'{self.symbol}' is not a function")
+
+        last: Scope = scopes[-1]
+        return_type: Optional[str] = None
+        if last.template is not None and kind != _CONSTRUCTOR and kind != _CONVERSION:
+            return_type = self._type().text
+        arg_types: List[str] = []
+        while self.__pos < len(self.symbol):
+            arg_types.extend(node.text for node in self._types())
+        if arg_types == ["void"]:
+            arg_types = []
+
+        name: str = last.name
+        if kind == _OPERATOR and last.template is not None and name.endswith("<"):
+            name += " "
+        text: str = _scopes_text(scopes[:-1] + (Scope(name, last.template),))
+        full_name: str = (f"{return_type} " if return_type is not None else "") + f"{text}({', '.join(arg_types)})"
+        full_name += "".join(f" {qualifier}" for qualifier in qualifiers)
+
+        return FQN(name=sys.intern(_normalize_operator(last.name) if kind in (_OPERATOR, _CONVERSION) else last.name),
+                   full_name=full_name,
+                   return_type=sys.intern(return_type) if return_type is not None else None,
+                   args=tuple(sys.intern(arg if i == 0 else f" {arg}") for i, arg in enumerate(arg_types)) or None,
+                   scopes=scopes[:-1] or None,
+                   template=last.template,
+                   constant="const" in qualifiers,
+                   volatile="volatile" in qualifiers)
+
+    def _peek(self, offset: int = 0) -> str:
+        """
+        Returns the character `offset` positions after the cursor, or '' past the end.
+        """
+        return self.symbol[self.__pos + offset:self.__pos + offset + 1]
+
+    def _consume(self, prefix: str) -> bool:
+        """
+        Consumes `prefix` if the cursor is at it.
+        """
+        if self.symbol.startswith(prefix, self.__pos):
+            self.__pos += len(prefix)
+            return True
+        return False
+
+    def _fail(self, what: str) -> SyntaxError:
+        """
+        Builds the error raised for an unsupported or malformed construct at the cursor.
+        """
+        return SyntaxError(f"Unsupported or invalid {what} at position {self.__pos} of '{self.symbol}'")
+
+    def _add(self, node: _Node) -> _Node:
+        """
+        Appends a substitution candidate and returns it.
+        """
+        self.__substitutions.append(node)
+        return node
+
+    def _name(self, function: bool = False) -> Tuple[Tuple[Scope, ...], int, Tuple[str, ...]]:
+        """
+        Parses a <name>.
+
+        Args:
+            function (bool): Whether it is the name of the function being parsed, whose template
+                arguments template parameters refer to.
+
+        Returns:
+            Tuple[Tuple[Scope, ...], int, Tuple[str, ...]]: The scope chain of the name, the kind
+                of its last component and the qualifiers of a nested name ('const', 'volatile').
+        """
+        if self._peek() == 'N':
+            return self._nested_name(function)
+        if self._peek() == 'Z':
+            raise self._fail("local name")
+
+        scopes: Tuple[Scope, ...]
+        kind: int = _NAME
+        if self._peek() == 'S' and self._peek(1) != 't':
+            scopes = self._substitution_scopes()
+            if self._peek() != 'I':
+                raise self._fail("substitution")
+        else:
+            prefix: Tuple[Scope, ...] = (_STD,) if self._consume("St") else ()
+            text, kind = self._unqualified_name()
+            scopes = prefix + (Scope(text),)
+            if self._peek() == 'I':
+                self._add(_Node(_scopes_text(scopes), scopes))
+
+        if self._peek() == 'I':
+            scopes = self._with_template_args(scopes, function)
+        return scopes, kind, ()
+
+    def _nested_name(self, function: bool) -> Tuple[Tuple[Scope, ...], int, Tuple[str, ...]]:
+        """
+        Parses a <nested-name>: 'N' [<CV-qualifiers>] <prefix> <unqualified-name> 'E'.
+        """
+        self.__pos += 1
+        qualifiers: List[str] = []
+        if self._consume("r"):
+            raise self._fail("restrict qualifier")
+        if self._consume("V"):
+            qualifiers.append("volatile")
+        if self._consume("K"):
+            qualifiers.insert(0, "const")
+        if self._peek() in ('R', 'O'):
+            raise self._fail("ref-qualifier")
+
+        scopes: Tuple[Scope, ...] = ()
+        kind: int = _NAME
+        while not self._consume("E"):
+            char: str = self._peek()
+            if char == 'S' and self._peek(1) != 't':
+                if scopes:
+                    raise self._fail("substitution")
+                scopes = self._substitution_scopes()
+                continue
+            if char == 'I':
+                if not scopes:
+                    raise self._fail("template arguments")
+                scopes = self._with_template_args(scopes, function)
+            elif char == 'T':
+                if scopes:
+                    raise self._fail("template parameter")
+                scopes = self._scopes_of(self._template_param())
+            elif char == 'C':
+                if not scopes or self._peek(1) not in ('1', '2', '3'):
+                    raise self._fail("constructor")
+                self.__pos += 2
+                scopes += (Scope(scopes[-1].name),)
+                kind = _CONSTRUCTOR
+            elif char == 'D' and self._peek(1) in ('0', '1', '2'):
+                raise self._fail("destructor")
+            elif char == '':
+                raise self._fail("nested name")
+            else:
+                prefix: Tuple[Scope, ...] = (_STD,) if not scopes and self._consume("St") else ()
+                text, kind = self._unqualified_name()
+                scopes += prefix + (Scope(text),)
+            self._add(_Node(_scopes_text(scopes), scopes))
+
+        if not scopes:
+            raise self._fail("nested name")
+        self.__substitutions.pop()
+        return scopes, kind, tuple(qualifiers)
+
+    def _unqualified_name(self) -> Tuple[str, int]:
+        """
+        Parses an <unqualified-name>: a <source-name> or an <operator-name>.
+
+        Returns:
+            Tuple[str, int]: Its text and its kind.
+        """
+        char: str = self._peek()
+        if char.isdigit():
+            return self._source_name(), _NAME
+        if char == 'c' and self._peek(1) == 'v':
+            self.__pos += 2
+            return f"operator {self._type().text}", _CONVERSION
+        if char == 'l' and self._peek(1) == 'i':
+            self.__pos += 2
+            return f'operator"" {self._source_name()}', _OPERATOR
+        operator: Optional[str] = _OPERATORS.get(self.symbol[self.__pos:self.__pos + 2])
+        if operator is None:
+            raise self._fail("unqualified name")
+        self.__pos += 2
+        return f"operator{operator}", _OPERATOR
+
+    def _source_name(self) -> str:
+        """
+        Parses a <source-name>: a decimal length followed by that many characters.
+        """
+        start: int = self.__pos
+        while self._peek().isdigit():
+            self.__pos += 1
+        if start == self.__pos:
+            raise self._fail("source name")
+        length: int = int(self.symbol[start:self.__pos])
+        name: str = self.symbol[self.__pos:self.__pos + length]
+        if len(name) != length or name.startswith("_GLOBAL__N"):
+            raise self._fail("source name")
+        self.__pos += length
+        return name
+
+    def _with_template_args(self, scopes: Tuple[Scope, ...], function: bool) -> Tuple[Scope, ...]:
+        """
+        Parses <template-args> and attaches them to the last scope of `scopes`.
+        """
+        template, args = self._template_args()
+        if function:
+            self.__template_args = args
+        last: Scope = scopes[-1]
+        if last.template is not None:
+            raise self._fail("template arguments")
+        return scopes[:-1] + (Scope(last.name, template),)
+
+    def _template_args(self) -> Tuple[str, List[_Node]]:
+        """
+        Parses <template-args>: 'I' <template-arg>+ 'E'. Argument packs are expanded in place.
+
+        Returns:
+            Tuple[str, List[_Node]]: The template text, e.g. '<int, std::allocator<int> >', and
+                each argument.
+        """
+        self.__pos += 1
+        args: List[_Node] = []
+        while not self._consume("E"):
+            if self._consume("J"):
+                pack: List[_Node] = []
+                while not self._consume("E"):
+                    pack.extend(self._template_arg())
+                args.append(_Node(", ".join(node.text for node in pack), pack=tuple(pack)))
+            else:
+                args.extend(self._template_arg())
+        text: str = ", ".join(arg.text for arg in args if arg.pack is None or arg.pack)
+        # Like c++filt, separate the closing '>' from the last argument's, not an empty pack's.
+        spaced: bool = bool(args) and args[-1].text.endswith(">")
+        return f"<{text}{' ' if spaced else ''}>", args
+
+    def _template_arg(self) -> List[_Node]:
+        """
+        Parses a <template-arg>: a type, a pack expansion or a boolean literal.
+        """
+        if self._peek() == 'L':
+            if self._consume("Lb0E"):
+                return [_Node("false")]
+            if self._consume("Lb1E"):
+                return [_Node("true")]
+            raise self._fail("literal")
+        if self._peek() in ('X', 'J', ''):
+            raise self._fail("template argument")
+        return self._types()
+
+    def _types(self) -> List[_Node]:
+        """
+        Parses a <type>, or a pack expansion 'Dp' <type>, which stands for one type per element
+        of the pack it refers to.
+        """
+        if not self._consume("Dp"):
+            return [self._type()]
+
+        start: int = self.__pos
+        outer: Tuple[Optional[int], Optional[int]] = (self.__pack_index, self.__pack_size)
+        self.__pack_index, self.__pack_size = 0, None
+        nodes: List[_Node] = [self._type()]
+        size: Optional[int] = self.__pack_size
+        if size is None:
+            raise self._fail("pack expansion")
+        end: int = self.__pos
+        candidates: int = len(self.__substitutions)
+        for index in range(1, size):
+            self.__pos, self.__pack_index = start, index
+            nodes.append(self._type())
+        del self.__substitutions[candidates:]
+        self.__pos = end
+        self.__pack_index, self.__pack_size = outer
+        return nodes if size else []
+
+    def _template_param(self) -> _Node:
+        """
+        Parses a <template-param>: 'T_' or 'T' <number> '_', which refers to a template argument
+        of the function.
+        """
+        end: int = self.symbol.find("_", self.__pos)
+        if end < 0:
+            raise self._fail("template parameter")
+        index: int = _seq_id(self.symbol[self.__pos + 1:end])
+        if self.__template_args is None or index >= len(self.__template_args):
+            raise self._fail("template parameter")
+        self.__pos = end + 1
+        node: _Node = self.__template_args[index]
+        if node.pack is None:
+            return node
+        if self.__pack_index is None:
+            raise self._fail("unexpanded pack")
+        self.__pack_size = len(node.pack)
+        return node.pack[self.__pack_index] if node.pack else _Node("")
+
+    def _substitution(self) -> _Node:
+        """
+        Parses a <substitution>: 'S_', 'S' <seq-id> '_', or a standard library abbreviation.
+        """
+        abbreviation: Optional[Tuple[Scope, ...]] = _STD_SUBSTITUTIONS.get(self._peek(1))
+        if abbreviation is not None:
+            self.__pos += 2
+            return _Node(_scopes_text(abbreviation), abbreviation)
+        end: int = self.symbol.find("_", self.__pos)
+        if end < 0:
+            raise self._fail("substitution")
+        index: int = _seq_id(self.symbol[self.__pos + 1:end])
+        if index >= len(self.__substitutions):
+            raise self._fail("substitution")
+        self.__pos = end + 1
+        return self.__substitutions[index]
+
+    def _substitution_scopes(self) -> Tuple[Scope, ...]:
+        """
+        Parses a <substitution> used as the prefix of a name.
+        """
+        return self._scopes_of(self._substitution())
+
+    def _scopes_of(self, node: _Node) -> Tuple[Scope, ...]:
+        """
+        Returns the scope chain of a node used as a prefix, which must be a name.
+        """
+        if node.scopes is None:
+            raise self._fail("prefix")
+        return node.scopes
+
+    def _type(self) -> _Node:
+        """
+        Parses a <type>.
+        """
+        char: str = self._peek()
+        builtin: Optional[str] = _BUILTIN_TYPES.get(char)
+        if builtin is not None:
+            self.__pos += 1
+            return _Node(builtin)
+        if char == 'D' and self._peek(1) in _EXTENDED_TYPES:
+            self.__pos += 2
+            return _Node(_EXTENDED_TYPES[self.symbol[self.__pos - 1]])
+
+        if char in ('r', 'V', 'K'):
+            qualifiers: List[str] = []
+            if self._consume("r"):
+                qualifiers.append(" restrict")
+            if self._consume("V"):
+                qualifiers.insert(0, " volatile")
+            if self._consume("K"):
+                qualifiers.insert(0, " const")
+            text: str = self._type().text
+            # Qualifying an already qualified type parameter does not repeat its qualifiers.
+            return self._add(_Node(text + "".join(qualifier for qualifier in qualifiers
+                                                  if qualifier not in _trailing_qualifiers(text))))
+        if char == 'P':
+            self.__pos += 1
+            return self._add(_Node(self._type().text + "*"))
+        if char == 'R':
+            self.__pos += 1
+            text = self._type().text
+            return self._add(_Node(text[:-1] if text.endswith("&&") else text if text.endswith("&") else text + "&"))
+        if char == 'O':
+            self.__pos += 1
+            text = self._type().text
+            return self._add(_Node(text if text.endswith("&") else text + "&&"))
+
+        if char == 'T':
+            node: _Node = self._add(self._template_param())
+            if self._peek() == 'I':
+                return self._add(self._template_id(node))
+            return node
+        if char == 'S' and self._peek(1) != 't':
+            node = self._substitution()
+            if self._peek() == 'I':
+                return self._add(self._template_id(node))
+            return node
+        if char == 'N' or char == 'S' or char.isdigit():
+            scopes, kind, qualifiers_ = self._name()
+            if kind != _NAME or qualifiers_:
+                raise self._fail("type name")
+            return self._add(_Node(_scopes_text(scopes), scopes))
+
+        raise self._fail("type")
+
+    def _template_id(self, node: _Node) -> _Node:
+        """
+        Applies <template-args> to a substituted template name.
+        """
+        scopes: Tuple[Scope, ...] = self._with_template_args(self._scopes_of(node), function=False)
+        return _Node(_scopes_text(scopes), scopes)
+
+
+def _seq_id(digits: str) -> int:
+    """
+    Decodes the index of a substitution or template parameter: '' is 0, and a base 36
+    <seq-id> (digits, then upper case letters) is its value plus one.
+    """
+    if not digits:
+        return 0
+    try:
+        return int(digits, 36) + 1
+    except ValueError:
+        raise SyntaxError(f"Invalid sequence id '{digits}'") from None
+
+
+def _trailing_qualifiers(text: str) -> List[str]:
+    """
+    Returns the qualifiers a type text ends with, e.g. [' volatile', ' const'] for 'int const volatile'.
+    """
+    qualifiers: List[str] = []
+    while True:
+        for qualifier in (" const", " volatile", " restrict"):
+            if text.endswith(qualifier):
+                qualifiers.append(qualifier)
+                text = text[:-len(qualifier)]
+                break
+        else:
+            return qualifiers
+
+
+def _normalize_operator(text: str) -> str:
+    """
+    Returns the name `Parser` gives an operator: literal operators lose the space after '""'.
+    """
+    return text.replace('"" ', '""', 1)
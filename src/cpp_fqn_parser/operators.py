@@ -0,0 +1,150 @@
+from typing import Optional, Dict, Tuple, Any
+
+# Every overloadable C++20 operator symbol, with the kind reported on its OPERATOR token.
+OPERATOR_KINDS: Dict[str, str] = {
+    '+': "ADD", '-': "SUBTRACT", '*': "MULTIPLY", '/': "DIVIDE", '%': "MODULO",
+    '++': "INCREMENT", '--': "DECREMENT",
+    '==': "EQUAL", '!=': "NOT_EQUAL", '<': "LESS", '>': "GREATER", '<=': "LESS_EQUAL", '>=': "GREATER_EQUAL",
+    '<=>': "THREE_WAY_COMPARE",
+    '=': "ASSIGN", '+=': "ADD_ASSIGN", '-=': "SUBTRACT_ASSIGN", '*=': "MULTIPLY_ASSIGN", '/=': "DIVIDE_ASSIGN",
+    '%=': "MODULO_ASSIGN", '&=': "BITWISE_AND_ASSIGN", '|=': "BITWISE_OR_ASSIGN", '^=': "BITWISE_XOR_ASSIGN",
+    '<<=': "SHIFT_LEFT_ASSIGN", '>>=': "SHIFT_RIGHT_ASSIGN",
+    '<<': "SHIFT_LEFT", '>>': "SHIFT_RIGHT", '&': "BITWISE_AND", '^': "BITWISE_XOR", '~': "BITWISE_NOT",
+    '|': "BITWISE_OR",
+    '&&': "LOGICAL_AND", '||': "LOGICAL_OR", '!': "LOGICAL_NOT",
+    '->': "MEMBER_ACCESS", '->*': "MEMBER_POINTER_ACCESS", '[]': "SUBSCRIPT", '()': "CALL", ',': "COMMA",
+    'new': "NEW", 'new[]': "NEW_ARRAY", 'delete': "DELETE", 'delete[]': "DELETE_ARRAY",
+    'co_await': "CO_AWAIT",
+}
+
+# Kinds of the operators that are not a fixed symbol.
+LITERAL: str = "LITERAL"
+CONVERSION: str = "CONVERSION"
+
+# Operators spelled as keywords, which must not be followed by an identifier character.
+_KEYWORDS = frozenset(['new', 'delete', 'co_await'])
+
+# Prefix of user-defined literal operators, followed by their suffix.
+_LITERAL_PREFIX: str = '""'
+
+# Key of the trie nodes that terminate an operator symbol.
+_END: str = ""
+
+
+def _build_trie() -> Dict[str, Any]:
+    """
+    Builds a character trie of `OPERATOR_KINDS` and the literal prefix, where each node ending
+    a symbol maps `_END` to that symbol.
+    """
+    trie: Dict[str, Any] = {}
+    for symbol in [*OPERATOR_KINDS, _LITERAL_PREFIX]:
+        node: Dict[str, Any] = trie
+        for char in symbol:
+            node = node.setdefault(char, {})
+        node[_END] = symbol
+    return trie
+
+
+_TRIE: Dict[str, Any] = _build_trie()
+
+
+def match_symbol(string: str, pos: int = 0) -> Optional[str]:
+    """
+    Finds the longest operator symbol starting at `pos`, in a single pass over the input.
+
+    Keyword operators ('new', 'delete', 'co_await') only match as whole words.
+
+    Args:
+        string (str): The string to match against.
+        pos (int): Where the symbol must start.
+
+    Returns:
+        Optional[str]: The matched operator symbol, or None.
+    """
+    node: Optional[Dict[str, Any]] = _TRIE
+    best: Optional[str] = None
+    end: int = len(string)
+    while pos < end and node is not None:
+        node = node.get(string[pos])
+        pos += 1
+        if node is not None and _END in node:
+            symbol: str = node[_END]
+            if symbol not in _KEYWORDS or pos == end or not _is_identifier_char(string[pos]):
+                best = symbol
+    return best
+
+
+def match_operator(string: str, pos: int) -> Optional[Tuple[int, str, str]]:
+    """
+    Recognizes the operator that follows an 'operator' keyword.
+
+    Handles, in this order:
+        - operator symbols and keywords, by longest match (e.g. 'operator<<=', 'operator new[]'),
+        - user-defined literals (e.g. 'operator""_km', 'operator"" _km'),
+        - conversion operators (e.g. 'operator bool', 'operator std::string const&'), whose type
+          extends up to the next top-level '(', ')', ',' or '>', trailing whitespace excluded.
+
+    Args:
+        string (str): The string being tokenized.
+        pos (int): The position right after the 'operator' keyword and its trailing whitespace.
+
+    Returns:
+        Optional[Tuple[int, str, str]]: The end position of the operator, its normalized name
+            (e.g. 'operator[]', 'operator delete[]', 'operator bool') and its kind, or None if
+            no operator follows.
+    """
+    symbol: Optional[str] = match_symbol(string, pos)
+    if symbol == _LITERAL_PREFIX:
+        return _match_literal(string, pos + len(_LITERAL_PREFIX))
+    if symbol is not None:
+        name: str = f"operator {symbol}" if symbol[0].isalpha() else f"operator{symbol}"
+        return pos + len(symbol), name, OPERATOR_KINDS[symbol]
+    if pos < len(string) and _is_identifier_start(string[pos]):
+        return _match_conversion(string, pos)
+    return None
+
+
+def _match_literal(string: str, pos: int) -> Optional[Tuple[int, str, str]]:
+    """
+    Matches the suffix of a user-defined literal operator, after its '""'.
+    """
+    end: int = len(string)
+    start: int = pos
+    while start < end and string[start].isspace():
+        start += 1
+    if start == end or not _is_identifier_start(string[start]):
+        return None
+    pos = start + 1
+    while pos < end and _is_identifier_char(string[pos]):
+        pos += 1
+    return pos, f'operator""{string[start:pos]}', LITERAL
+
+
+def _match_conversion(string: str, pos: int) -> Tuple[int, str, str]:
+    """
+    Matches the target type of a conversion operator.
+    """
+    depth: int = 0
+    last: int = pos
+    cursor: int = pos
+    end: int = len(string)
+    while cursor < end:
+        char: str = string[cursor]
+        if char == '<':
+            depth += 1
+        elif depth == 0 and char in '(),>':
+            break
+        elif char == '>':
+            depth -= 1
+        cursor += 1
+        if not char.isspace():
+            last = cursor
+    return last, f"operator {string[pos:last]}", CONVERSION
+
+
+def _is_identifier_start(char: str) -> bool:
+    return char == '_' or ('a' <= char <= 'z') or ('A' <= char <= 'Z')
+
+
+def _is_identifier_char(char: str) -> bool:
+    return _is_identifier_start(char) or '0' <= char <= '9'
@@ -1,9 +1,48 @@
-from typing import Optional, List, Dict
+import sys
+from array import array
+from typing import Callable, Optional, List, NamedTuple, Tuple, Dict, TYPE_CHECKING
 
 from .tokenizer import Tokenizer, Token
+from .buffer import (TokenBuffer, TYPE_NAMES, OPERATOR, WHITESPACE, SCOPE, TEMPLATE_START, TEMPLATE_END,
+                     PARENTHESIS_START, PARENTHESIS_END, SEPARATOR, MEMBER)
 from .fqn import FQN
 from .scope import Scope
 
+if TYPE_CHECKING:
+    from .cache import ParseCache
+    from .pool import ScopePool
+
+# The phases of `Parser.scan`, in the order they run.
+SCAN_PHASES: Tuple[str, ...] = ("qualifiers", "args", "template", "name", "scopes", "return_type")
+
+
+class ParseSpans(NamedTuple):
+    """
+    The components of an FQN found by `Parser.scan`, as token indices into the parser's buffer,
+    before any string is built from them.
+
+    Attributes:
+        constant (bool): Whether the symbol is const-qualified.
+        volatile (bool): Whether the symbol is volatile-qualified.
+        args (Optional[List[Tuple[int, int]]]): The token range `[lo, hi)` of each argument, in
+            order, or None without parentheses. Empty parentheses hold a single empty argument.
+        template (Optional[Tuple[int, int]]): The indices of the opening '<' and closing '>'
+            tokens of the template, or None.
+        name (int): The index of the name token.
+        scopes (Optional[List[Tuple[int, Optional[Tuple[int, int]]]]]): For each scope, in
+            order, the index of its name token and the indices of its template delimiters, if
+            any. None if no scopes found.
+        return_type (Optional[int]): The end `hi` of the token range `[0, hi)` of the return
+            type, or None.
+    """
+    constant: bool
+    volatile: bool
+    args: Optional[List[Tuple[int, int]]]
+    template: Optional[Tuple[int, int]]
+    name: int
+    scopes: Optional[List[Tuple[int, Optional[Tuple[int, int]]]]]
+    return_type: Optional[int]
+
 
 class Parser:
     """
@@ -17,25 +56,46 @@ class Parser:
       - return type
       - and any enclosing scopes
 
+    The tokens are kept in a `TokenBuffer`, and matched on their integer type codes.
+
+    A parser built with a string parses it once. A parser built without one (`Parser()`) is
+    reusable: each `parse(string)` call runs on its own state, and the lexer and operator
+    tables are immutable module constants, so a single parser can be shared by threads.
+
     Attributes:
         string (str): The original input string.
         tokenizer (Tokenizer): Tokenizer instance processing the input.
-        tokens (List[Token]): All parsed tokens from the input.
+        buffer (TokenBuffer): All parsed tokens from the input.
+        pool (Optional[ScopePool]): The pool the scopes are taken from, if any.
 
     Private Attributes:
-        __cursor (int): Current index in the token list (reverse parsing).
+        __cursor (int): Current index in the token buffer (reverse parsing).
+        __types (array): The type codes of the tokens.
     """
-    def __init__(self, string: str) -> None:
+    def __init__(self, string: str = "", buffer: Optional[TokenBuffer] = None, pool: Optional['ScopePool'] = None) -> None:
         """
         Initializes the parser and tokenizes the input string.
 
         Args:
-            string (str): The string to parse.
+            string (str): The string to parse. Empty for a reusable parser, see `parse`.
+            buffer (Optional[TokenBuffer]): The tokens of the string, if already tokenized
+                (e.g. by `Tokenizer.retokenize`).
+            pool (Optional[ScopePool]): A pool to take the scopes from, so that they are shared
+                with the other FQNs parsed with it.
         """
         self.string: str = string
         self.tokenizer: Tokenizer = Tokenizer(string)
-        self.tokens: List[Token] = list(self.tokenizer.get_all_tokens())
-        self.__cursor: int = len(self.tokens) - 1
+        self.buffer: TokenBuffer = buffer if buffer is not None else self.tokenizer.tokenize()
+        self.pool: Optional['ScopePool'] = pool
+        self.__types: array = self.buffer.types
+        self.__cursor: int = len(self.__types) - 1
+
+    @property
+    def tokens(self) -> List[Token]:
+        """
+        All parsed tokens from the input, as Token objects.
+        """
+        return list(self.buffer)
 
     def _peek(self) -> Optional[Token]:
         """
@@ -44,64 +104,112 @@ class Parser:
         Returns:
             Optional[Token]: The current token, or None if at the start.
         """
-        return self.tokens[self.__cursor] if self.__cursor >= 0 else None
+        return self.buffer[self.__cursor] if self.__cursor >= 0 else None
 
-    def _consume(self, expected_type: Optional[str] = None) -> Token:
+    def _consume(self, expected_type: Optional[int] = None) -> int:
         """
-        Consumes and returns the current token, optionally verifying its type.
+        Consumes the current token, optionally verifying its type.
 
         Args:
-            expected_type (Optional[str]): Expected token type (if any).
+            expected_type (Optional[int]): Expected token type code (if any).
 
         Returns:
-            Token: The consumed token.
+            int: The index of the consumed token in the buffer.
 
         Raises:
             SyntaxError: If the token type doesn't match or input ends unexpectedly.
         """
-        token: Optional[Token] = self._peek()
-        if token is None:
-            raise SyntaxError(f"Unexpected end of input, expected: '{expected_type}'")
-        if expected_type and token.type_ != expected_type:
-            raise SyntaxError(f"Expected token type '{token.type_}' with value '{token.value}'. "
-                              f"Expected type: '{expected_type}'")
-        self.__cursor -= 1
-        return token
-
-    def _match(self, token_type: str) -> bool:
+        index: int = self.__cursor
+        if index < 0:
+            expected: Optional[str] = TYPE_NAMES[expected_type] if expected_type is not None else None
+            raise SyntaxError(f"Unexpected end of input, expected: '{expected}'")
+        if expected_type is not None and self.__types[index] != expected_type:
+            raise SyntaxError(f"Expected token type '{TYPE_NAMES[self.__types[index]]}' "
+                              f"with value '{self.buffer.value(index)}'. "
+                              f"Expected type: '{TYPE_NAMES[expected_type]}'")
+        self.__cursor = index - 1
+        return index
+
+    def _match(self, token_type: int) -> bool:
         """
         Checks if the current token matches a given type.
 
         Args:
-            token_type (str): The token type to check.
+            token_type (int): The token type code to check.
 
         Returns:
             bool: True if the current token matches the type, False otherwise.
         """
-        token = self._peek()
-        return token is not None and token.type_ == token_type
+        return self.__cursor >= 0 and self.__types[self.__cursor] == token_type
+
+    def _peek_type(self) -> str:
+        """
+        Returns the type of the current token, or 'None' if at the start, for error messages.
+        """
+        return TYPE_NAMES[self.__types[self.__cursor]] if self.__cursor >= 0 else 'None'
 
-    def parse(self) -> FQN:
+    def parse(self, string: Optional[str] = None) -> FQN:
         """
         Parses the entire input string into an FQN object.
 
+        Args:
+            string (Optional[str]): A string to parse instead of the input string. This parser's
+                state is then neither used nor changed, so the call is reentrant and thread-safe.
+
         Returns:
             FQN: The parsed fully qualified name structure.
         """
-        fqn_qualifiers: Dict[str, bool] = self._parse_qualifiers()
-        fqn_args: Optional[List[str]] = self._parse_args()
-        fqn_template: Optional[str] = self._parse_template()
-        fqn_name: str = self._parse_name()
-        fqn_scopes: Optional[List[Scope]] = self._parse_scopes()
-        fqn_return_type: Optional[str] = self._parse_return_type()
-        return FQN(name=fqn_name,
+        if string is not None:
+            return Parser(string, pool=self.pool).parse()
+        return self._build(self.scan())
+
+    def scan(self, on_phase: Optional[Callable[[str], None]] = None) -> ParseSpans:
+        """
+        Runs the phases of `parse` over the tokens, without building any string, e.g. to encode
+        the components of many symbols rather than building their FQNs.
+
+        Args:
+            on_phase (Optional[Callable[[str], None]]): Called with the name of each phase of
+                `SCAN_PHASES` as soon as it is done, e.g. to time them.
+
+        Returns:
+            ParseSpans: The token indices of each component.
+
+        Raises:
+            SyntaxError: If the input can't be parsed.
+        """
+        qualifiers: Dict[str, bool] = self._parse_qualifiers()
+        if on_phase is not None:
+            on_phase("qualifiers")
+        args: Optional[List[Tuple[int, int]]] = self._scan_args()
+        if on_phase is not None:
+            on_phase("args")
+        template: Optional[Tuple[int, int]] = self._scan_template()
+        if on_phase is not None:
+            on_phase("template")
+        name: int = self._scan_name()
+        if on_phase is not None:
+            on_phase("name")
+        scopes: Optional[List[Tuple[int, Optional[Tuple[int, int]]]]] = self._scan_scopes()
+        if on_phase is not None:
+            on_phase("scopes")
+        return_type: Optional[int] = self._scan_return_type()
+        if on_phase is not None:
+            on_phase("return_type")
+        return ParseSpans(qualifiers["constant"], qualifiers["volatile"], args, template, name, scopes, return_type)
+
+    def _build(self, spans: ParseSpans) -> FQN:
+        """
+        Builds the FQN whose components `scan` found.
+        """
+        return FQN(name=sys.intern(self.buffer.value(spans.name)),
                    full_name=self.string,
-                   return_type=fqn_return_type,
-                   args=fqn_args,
-                   scopes=fqn_scopes,
-                   template=fqn_template,
-                   constant=fqn_qualifiers["constant"],
-                   volatile=fqn_qualifiers["volatile"])
+                   return_type=self._return_type_string(spans.return_type),
+                   args=self._args_strings(spans.args),
+                   scopes=self._scope_objects(spans.scopes),
+                   template=self._template_string(*spans.template) if spans.template is not None else None,
+                   constant=spans.constant,
+                   volatile=spans.volatile)
 
     def _parse_qualifiers(self) -> Dict[str, bool]:
         """
@@ -110,63 +218,91 @@ class Parser:
         Returns:
             Dict[str, bool]: A dictionary with boolean flags: {'constant': bool, 'volatile': bool}
         """
-        if not self._match("MEMBER"):
+        if not self._match(MEMBER):
             return {"constant": False, "volatile": False}
 
-        token: Token = self._consume("MEMBER")
-        constant: bool = token.value == "const"
-        volatile: bool = token.value == "volatile"
+        value: str = self.buffer.value(self._consume(MEMBER))
+        constant: bool = value == "const"
+        volatile: bool = value == "volatile"
 
         if not constant and not volatile:
             raise SyntaxError("FQN has no arguments. "
-                              f"Last token is '{token.value}' but should be 'const', 'volatile' or ')'.")
+                              f"Last token is '{value}' but should be 'const', 'volatile' or ')'.")
 
-        if not self._match("WHITESPACE"):
-            _temp: Optional[Token] = self._peek()
-            raise SyntaxError(f"Expected WHITESPACE, found '{_temp.type_ if _temp else None}'")
-        self._consume("WHITESPACE")
+        if not self._match(WHITESPACE):
+            raise SyntaxError(f"Expected WHITESPACE, found '{self._peek_type()}'")
+        self._consume(WHITESPACE)
 
-        if not self._match("MEMBER"):
+        if not self._match(MEMBER):
             return {"constant": constant, "volatile": volatile}
 
-        token = self._consume("MEMBER")
-        constant = token.value == "const" if not constant else constant
-        volatile = token.value == "volatile" if not volatile else volatile
+        value = self.buffer.value(self._consume(MEMBER))
+        constant = value == "const" if not constant else constant
+        volatile = value == "volatile" if not volatile else volatile
 
-        if not self._match("WHITESPACE"):
-            _temp = self._peek()
-            raise SyntaxError(f"Expected WHITESPACE, found '{_temp.type_ if _temp else None}'")
-        self._consume("WHITESPACE")
+        if not self._match(WHITESPACE):
+            raise SyntaxError(f"Expected WHITESPACE, found '{self._peek_type()}'")
+        self._consume(WHITESPACE)
 
         return {"constant": constant, "volatile": volatile}
 
-    def _parse_args(self) -> Optional[List[str]]:
+    def _parse_args(self) -> Optional[Tuple[str, ...]]:
         """
-        Parses function arguments inside parentheses.
+        Parses function arguments inside parentheses. Each argument is a single slice of the
+        input, between its separators. Argument types repeat heavily across symbols, so they
+        are interned.
 
         Returns:
-            Optional[List[str]]: The list of argument strings, or None if no arguments found.
+            Optional[Tuple[str, ...]]: The argument strings, or None if no arguments found.
         """
-        if not self._match("PARENTHESIS_END"):
-            return None
+        return self._args_strings(self._scan_args())
 
-        self._consume("PARENTHESIS_END")
-        args_list: List[List[str]] = [[]]
-        counter: int = 0
-        while not self._match("PARENTHESIS_START"):
-            if self._match("SEPARATOR"):
-                counter += 1
-                args_list.append([])
-                self._consume("SEPARATOR")
-            args_list[counter].append(self._consume().value)
-        self._consume("PARENTHESIS_START")
+    def _args_strings(self, ranges: Optional[List[Tuple[int, int]]]) -> Optional[Tuple[str, ...]]:
+        """
+        Returns the interned arguments in the token ranges found by `_scan_args`.
+        """
+        if ranges is None:
+            return None
 
-        args: List[str] = [''.join(arg[::-1]) for arg in args_list]
+        starts: array = self.buffer.starts
+        ends: array = self.buffer.ends
+        args: Tuple[str, ...] = tuple(sys.intern(self.string[ends[lo - 1]:starts[hi]]) for lo, hi in ranges)
 
         if len(args) == 1 and not args[0]:
             return None
 
-        return args[::-1]
+        return args
+
+    def _scan_args(self) -> Optional[List[Tuple[int, int]]]:
+        """
+        Consumes function arguments inside parentheses. Commas inside template arguments do not
+        separate arguments.
+
+        Returns:
+            Optional[List[Tuple[int, int]]]: The token range `[lo, hi)` of each argument, in order,
+                or None if no arguments found.
+        """
+        if not self._match(PARENTHESIS_END):
+            return None
+
+        types: array = self.__types
+        hi: int = self._consume(PARENTHESIS_END)
+        ranges: List[Tuple[int, int]] = []
+        depth: int = 0
+        while not self._match(PARENTHESIS_START):
+            index: int = self._consume()
+            token_type: int = types[index]
+            if token_type == TEMPLATE_END:
+                depth += 1
+            elif token_type == TEMPLATE_START:
+                depth -= 1
+            elif token_type == SEPARATOR and depth == 0:
+                ranges.append((index + 1, hi))
+                hi = index
+        ranges.append((self._consume(PARENTHESIS_START) + 1, hi))
+
+        ranges.reverse()
+        return ranges
 
     def _parse_template(self) -> Optional[str]:
         """
@@ -175,18 +311,28 @@ class Parser:
         Returns:
             Optional[str]: The raw template string, or None.
         """
-        if self._match("WHITESPACE"):
-            self._consume("WHITESPACE")
+        template: Optional[Tuple[int, int]] = self._scan_template()
+        if template is None:
+            return None
+        return self._template_string(*template)
+
+    def _scan_template(self) -> Optional[Tuple[int, int]]:
+        """
+        Consumes template type parameters if present.
 
-        template: Optional[str] = None
-        if self._match("TEMPLATE_END"):
-            template = self._parse_nested_templates()
+        Returns:
+            Optional[Tuple[int, int]]: The indices of the opening '<' and closing '>' tokens, or None.
+        """
+        if self._match(WHITESPACE):
+            self._consume(WHITESPACE)
 
-        return template
+        if self._match(TEMPLATE_END):
+            return self._scan_nested_templates()
+        return None
 
     def _parse_name(self) -> str:
         """
-        Parses the function or symbol name.
+        Parses the function or symbol name. Names are interned, as the same names repeat across symbols.
 
         Returns:
             str: The unqualified name.
@@ -194,82 +340,175 @@ class Parser:
         Raises:
             SyntaxError: If a valid member token is not found.
         """
-        if self._match("WHITESPACE"):
-            self._consume("WHITESPACE")
+        return sys.intern(self.buffer.value(self._scan_name()))
 
-        if self._match("OPERATOR"):
-            name: str = self._consume("OPERATOR").value
-            return name
-        elif not self._match("MEMBER"):
-            _temp: Optional[Token] = self._peek()
-            raise SyntaxError(f"Expected 'MEMBER', but found '{_temp.type_ if _temp else 'None'}'")
+    def _scan_name(self) -> int:
+        """
+        Consumes the function or symbol name.
+
+        Returns:
+            int: The index of the name token.
+
+        Raises:
+            SyntaxError: If a valid member token is not found.
+        """
+        if self._match(WHITESPACE):
+            self._consume(WHITESPACE)
 
-        name = self._consume("MEMBER").value
-        return name
+        if self._match(OPERATOR):
+            return self._consume(OPERATOR)
+        elif not self._match(MEMBER):
+            raise SyntaxError(f"Expected 'MEMBER', but found '{self._peek_type()}'")
+
+        return self._consume(MEMBER)
 
     def _parse_nested_templates(self) -> str:
         """
         Parses a possibly nested set of template tokens.
 
         Returns:
-            str: The raw template string (reversed back to original order).
+            str: The raw template string, sliced from the input and interned.
 
         Raises:
             SyntaxError: If improper template structure is found.
         """
-        if not self._match("TEMPLATE_END"):
+        return self._template_string(*self._scan_nested_templates())
+
+    def _scan_nested_templates(self) -> Tuple[int, int]:
+        """
+        Consumes a possibly nested set of template tokens.
+
+        Returns:
+            Tuple[int, int]: The indices of the opening '<' and closing '>' tokens.
+
+        Raises:
+            SyntaxError: If improper template structure is found.
+        """
+        if not self._match(TEMPLATE_END):
             _temp: Optional[Token] = self._peek()
             raise SyntaxError(f"Expected '>', but found '{_temp.value if _temp else 'None'}'")
 
-        tokens: List[str] = [self._consume("TEMPLATE_END").value]
+        types: array = self.__types
+        end: int = self._consume(TEMPLATE_END)
         depth: int = 1
+        index: int = -1
         while depth > 0:
-            token: Token = self._consume()
-            tokens.append(token.value)
-            if token.type_ == "TEMPLATE_END":
+            index = self._consume()
+            if types[index] == TEMPLATE_END:
                 depth += 1
-            elif token.type_ == "TEMPLATE_START":
+            elif types[index] == TEMPLATE_START:
                 depth -= 1
 
-        return ''.join(tokens[::-1])
+        return index, end
+
+    def _template_string(self, start: int, end: int) -> str:
+        """
+        Returns the interned text of the template between the tokens `start` and `end`, included.
+        """
+        return sys.intern(self.string[self.buffer.starts[start]:self.buffer.ends[end]])
 
-    def _parse_scopes(self) -> Optional[List[Scope]]:
+    def _parse_scopes(self) -> Optional[Tuple[Scope, ...]]:
         """
-        Parses namespace or class scopes, if present.
+        Parses namespace or class scopes, if present. Scope names are interned, as a handful of
+        namespaces and classes are shared by most symbols. With a pool, the Scope objects and
+        their tuple are taken from it.
 
         Returns:
-            Optional[List[Scope]]: A list of Scope objects, or None if no scopes found.
+            Optional[Tuple[Scope, ...]]: The Scope objects, or None if no scopes found.
+        """
+        return self._scope_objects(self._scan_scopes())
+
+    def _scope_objects(self, scopes: Optional[List[Tuple[int, Optional[Tuple[int, int]]]]]) -> Optional[Tuple[Scope, ...]]:
         """
-        if not self._match("SCOPE"):
+        Returns the scopes whose tokens `_scan_scopes` found, taken from the pool if any.
+        """
+        if scopes is None:
             return None
 
-        scopes: List[Scope] = []
+        if self.pool is not None:
+            string: str = self.string
+            starts: array = self.buffer.starts
+            ends: array = self.buffer.ends
+            parts: List[Optional[str]] = []
+            for name, template in scopes:
+                parts.append(string[starts[name]:ends[name]])
+                parts.append(string[starts[template[0]]:ends[template[1]]] if template is not None else None)
+            return self.pool.chain_parts(parts)
+
+        return tuple(Scope(sys.intern(self.buffer.value(name)),
+                           self._template_string(*template) if template is not None else None)
+                     for name, template in scopes)
+
+    def _scan_scopes(self) -> Optional[List[Tuple[int, Optional[Tuple[int, int]]]]]:
+        """
+        Consumes namespace or class scopes, if present.
+
+        Returns:
+            Optional[List[Tuple[int, Optional[Tuple[int, int]]]]]: For each scope, in order, the
+                index of its name token and the indices of its template delimiters, if any.
+                None if no scopes found.
+        """
+        if not self._match(SCOPE):
+            return None
 
-        while not self._match("WHITESPACE") and self._peek():
-            self._consume("SCOPE")
-            template: Optional[str] = self._parse_nested_templates() if self._match("TEMPLATE_END") else None
-            token: Token = self._consume("MEMBER")
+        scopes: List[Tuple[int, Optional[Tuple[int, int]]]] = []
 
-            scopes.append(Scope(token.value, template))
+        while self.__cursor >= 0 and not self._match(WHITESPACE):
+            self._consume(SCOPE)
+            template: Optional[Tuple[int, int]] = self._scan_nested_templates() if self._match(TEMPLATE_END) else None
+            scopes.append((self._consume(MEMBER), template))
 
-        return scopes[::-1]
+        scopes.reverse()
+        return scopes
 
     def _parse_return_type(self) -> Optional[str]:
         """
         Parses any tokens remaining at the start of the string as a return type.
 
         Returns:
-            Optional[str]: The return type as a string, or None if not found.
+            Optional[str]: The return type as an interned string, or None if not found.
         """
-        if self._match("WHITESPACE"):
-            self._consume("WHITESPACE")
+        return self._return_type_string(self._scan_return_type())
 
-        if not self._peek():
+    def _return_type_string(self, end: Optional[int]) -> Optional[str]:
+        """
+        Returns the interned return type ending before the token `end`, found by `_scan_return_type`.
+        """
+        if end is None:
             return None
 
-        return_type: List[str] = []
-        while self._peek():
-            token = self._consume()
-            return_type.append(token.value)
+        return sys.intern(self.string[:self.buffer.ends[end - 1]])
 
-        return ''.join(return_type[::-1])
+    def _scan_return_type(self) -> Optional[int]:
+        """
+        Consumes any tokens remaining at the start of the string.
+
+        Returns:
+            Optional[int]: The end `hi` of the token range `[0, hi)` of the return type, or None
+                if not found.
+        """
+        if self._match(WHITESPACE):
+            self._consume(WHITESPACE)
+
+        end: int = self.__cursor + 1
+        self.__cursor = -1
+
+        return end if end > 0 else None
+
+
+def parse(string: str, cache: Optional['ParseCache'] = None, pool: Optional['ScopePool'] = None) -> FQN:
+    """
+    Parses a string representation of a fully qualified name (FQN).
+
+    Args:
+        string (str): The string to parse.
+        cache (Optional[ParseCache]): A cache to look the result up in (and store it into), if any.
+        pool (Optional[ScopePool]): A pool to take the scopes from, if any. Ignored with a
+            cache, which parses with its own pool.
+
+    Returns:
+        FQN: The parsed fully qualified name structure.
+    """
+    if cache is not None:
+        return cache.parse(string)
+    return Parser(string, pool=pool).parse()
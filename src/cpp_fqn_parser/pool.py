@@ -0,0 +1,162 @@
+import sys
+from dataclasses import replace
+from threading import Lock
+from typing import Dict, Iterable, MutableMapping, NamedTuple, Optional, Sequence, Tuple
+from weakref import WeakValueDictionary
+
+from .fqn import FQN
+from .scope import Scope
+
+# The key of a scope chain: the name and template of each of its scopes, in order.
+_ChainKey = Tuple[Optional[str], ...]
+
+
+class PoolInfo(NamedTuple):
+    """
+    Usage statistics of a `ScopePool`.
+
+    Attributes:
+        scopes (int): Number of distinct scopes in the pool.
+        chains (int): Number of distinct scope chains in the pool.
+    """
+    scopes: int
+    chains: int
+
+
+class ScopePool:
+    """
+    An interning pool of `Scope` objects and of whole scope chains (the `FQN.scopes` tuples).
+
+    Millions of symbols share a handful of namespaces and classes. Parsed with a pool (see
+    `Parser`), every symbol of `std::__1::basic_string<char>` holds the very same `Scope`
+    objects and the very same chain tuple, so each is stored once, and comparing or grouping
+    by scope mostly reduces to identity checks. A chain found in the pool is returned without
+    building any `Scope`.
+
+    A strong pool keeps every entry alive as long as the pool. A weak pool only keeps scopes
+    alive while something else references them, so a long-running process doesn't accumulate
+    the scopes of symbols it has dropped. Tuples can't be weakly referenced, so a weak pool
+    shares scopes but not chains. All operations are thread-safe.
+
+    Attributes:
+        weak (bool): Whether the pool holds its scopes by weak references.
+
+    Private Attributes:
+        __scopes (MutableMapping[Tuple[str, Optional[str]], Scope]): Each scope, by its name and template.
+        __chains (Dict[_ChainKey, Tuple[Scope, ...]]): Each chain, by the names and templates of its scopes.
+        __lock (Lock): Guards the entries.
+    """
+
+    def __init__(self, weak: bool = False) -> None:
+        """
+        Initializes an empty pool.
+
+        Args:
+            weak (bool): Whether to hold scopes by weak references, and not to pool chains.
+        """
+        self.weak: bool = weak
+        self.__scopes: MutableMapping[Tuple[str, Optional[str]], Scope] = WeakValueDictionary() if weak else {}
+        self.__chains: Dict[_ChainKey, Tuple[Scope, ...]] = {}
+        self.__lock: Lock = Lock()
+
+    def scope(self, name: str, template: Optional[str] = None) -> Scope:
+        """
+        Returns the pooled scope with a name and template, adding it if needed.
+
+        Args:
+            name (str): The name of the scope.
+            template (Optional[str]): Its template, if any.
+
+        Returns:
+            Scope: The shared scope.
+        """
+        with self.__lock:
+            return self._scope(name, template)
+
+    def chain(self, scopes: Iterable[Scope]) -> Tuple[Scope, ...]:
+        """
+        Returns the pooled chain equal to a sequence of scopes, adding it if needed.
+
+        Args:
+            scopes (Iterable[Scope]): The scopes, from outermost to innermost.
+
+        Returns:
+            Tuple[Scope, ...]: The shared chain, made of shared scopes.
+        """
+        return self.chain_parts([part for scope in scopes for part in (scope.name, scope.template)])
+
+    def chain_parts(self, parts: Sequence[Optional[str]]) -> Tuple[Scope, ...]:
+        """
+        Returns the pooled chain of the scopes whose names and templates alternate in `parts`,
+        adding it if needed. Unlike `chain`, it takes plain strings, so that `Parser` finds a
+        chain already pooled without building any `Scope`.
+
+        Args:
+            parts (Sequence[Optional[str]]): The name and template (or None) of each scope,
+                from outermost to innermost, e.g. `['std', None, 'vector', '<int>']`.
+
+        Returns:
+            Tuple[Scope, ...]: The shared chain, made of shared scopes.
+        """
+        key: _ChainKey = tuple(parts)
+        with self.__lock:
+            chain: Optional[Tuple[Scope, ...]] = self.__chains.get(key)
+            if chain is None:
+                chain = tuple([self._scope(parts[i], parts[i + 1]) for i in range(0, len(parts), 2)])  # type: ignore[arg-type]
+                if not self.weak:
+                    self.__chains[key] = chain
+            return chain
+
+    def intern(self, fqn: FQN) -> FQN:
+        """
+        Returns an FQN whose scopes come from the pool, e.g. for FQNs parsed in another process
+        or loaded from a file.
+
+        Args:
+            fqn (FQN): The FQN to intern.
+
+        Returns:
+            FQN: `fqn` itself if it has no scopes or already holds the pooled chain, otherwise
+                an equal FQN holding it.
+        """
+        if fqn.scopes is None:
+            return fqn
+        scopes: Tuple[Scope, ...] = self.chain(fqn.scopes)
+        return fqn if scopes is fqn.scopes else replace(fqn, scopes=scopes)
+
+    def info(self) -> PoolInfo:
+        """
+        Returns the current size of the pool.
+
+        Returns:
+            PoolInfo: The number of distinct scopes and chains.
+        """
+        with self.__lock:
+            return PoolInfo(len(self.__scopes), len(self.__chains))
+
+    def clear(self) -> None:
+        """
+        Empties the pool. Scopes and chains already handed out stay valid, but are no longer shared
+        with the ones returned afterwards.
+        """
+        with self.__lock:
+            self.__scopes.clear()
+            self.__chains.clear()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of distinct scopes in the pool.
+        """
+        return len(self.__scopes)
+
+    def _scope(self, name: str, template: Optional[str]) -> Scope:
+        """
+        Returns the pooled scope with a name and template. The lock must be held.
+        """
+        scope: Optional[Scope] = self.__scopes.get((name, template))
+        if scope is None:
+            name = sys.intern(name)
+            template = sys.intern(template) if template is not None else None
+            scope = Scope(name, template)
+            self.__scopes[(name, template)] = scope
+        return scope
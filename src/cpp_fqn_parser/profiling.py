@@ -0,0 +1,341 @@
+from array import array
+from bisect import bisect_left
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .batch import ParseResult, ERROR_POLICIES, _apply_policy
+from .buffer import TEMPLATE_START, TEMPLATE_END
+from .cache import ParseCache
+from .fqn import FQN
+from .parser import Parser, ParseSpans, SCAN_PHASES
+
+# The phases of `Parser.parse`, in the order they run. 'tokenize' is the construction of the
+# parser, and 'build' the creation of the strings, scopes and FQN from the scanned tokens.
+PHASES: Tuple[str, ...] = ("tokenize",) + SCAN_PHASES + ("build",)
+
+SECONDS_BUCKETS: Tuple[float, ...] = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                                      1e-3, 2.5e-3, 5e-3, 1e-2, 1e-1)
+TOKENS_BUCKETS: Tuple[float, ...] = (4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+DEPTH_BUCKETS: Tuple[float, ...] = (0, 1, 2, 3, 4, 6, 8, 16, 32)
+
+
+class HistogramSnapshot(NamedTuple):
+    """
+    The state of a `Histogram` at a point in time.
+
+    Attributes:
+        bounds (Tuple[float, ...]): The upper bound of each bucket, in increasing order.
+        counts (Tuple[int, ...]): The number of observations in each bucket, not cumulative,
+            plus a last one for observations above every bound.
+        total (float): The sum of all observations.
+        samples (int): The number of observations.
+    """
+    bounds: Tuple[float, ...]
+    counts: Tuple[int, ...]
+    total: float
+    samples: int
+
+    @property
+    def mean(self) -> float:
+        """
+        The mean of all observations, or 0.0 if there are none.
+        """
+        return self.total / self.samples if self.samples else 0.0
+
+
+class Histogram:
+    """
+    A fixed-bucket histogram, as used by Prometheus: each observation is counted in the first
+    bucket whose upper bound it does not exceed.
+
+    Attributes:
+        bounds (Tuple[float, ...]): The upper bound of each bucket, in increasing order.
+        counts (List[int]): The number of observations in each bucket, plus a last one for
+            observations above every bound.
+        total (float): The sum of all observations.
+        count (int): The number of observations.
+    """
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Iterable[float]) -> None:
+        """
+        Initializes an empty histogram.
+
+        Args:
+            bounds (Iterable[float]): The upper bound of each bucket, in increasing order.
+        """
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.total: float = 0.0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Records an observation.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def merge(self, other: 'Histogram') -> None:
+        """
+        Adds the observations of another histogram with the same bounds.
+
+        Args:
+            other (Histogram): The histogram to add.
+
+        Raises:
+            ValueError: If the bounds differ.
+        """
+        if other.bounds != self.bounds:
+            raise ValueError("Can't merge histograms with different bounds")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.total += other.total
+        self.count += other.count
+
+    def snapshot(self) -> HistogramSnapshot:
+        """
+        Returns the current state of the histogram.
+
+        Returns:
+            HistogramSnapshot: A copy of the buckets and totals.
+        """
+        return HistogramSnapshot(self.bounds, tuple(self.counts), self.total, self.count)
+
+
+class ProfileStats(NamedTuple):
+    """
+    Statistics aggregated by a `ParseProfiler`.
+
+    Attributes:
+        parses (int): Number of strings parsed, successfully or not, including cache hits.
+        failures (int): Number of strings that failed to parse.
+        cache_hits (int): Number of strings answered from the cache.
+        cache_misses (int): Number of strings looked up in the cache and parsed.
+        phases (Dict[str, HistogramSnapshot]): The time, in seconds, spent in each phase of
+            `PHASES`, per parse. Cache hits are not timed.
+        tokens (HistogramSnapshot): The number of tokens of each parsed string.
+        template_depth (HistogramSnapshot): The maximum template nesting depth of each parsed string.
+    """
+    parses: int
+    failures: int
+    cache_hits: int
+    cache_misses: int
+    phases: Dict[str, HistogramSnapshot]
+    tokens: HistogramSnapshot
+    template_depth: HistogramSnapshot
+
+
+class ParseProfiler:
+    """
+    An instrumented parser: parses strings like `Parser.parse`, recording the time spent in each
+    phase, token counts, template nesting depths and cache hits into histograms.
+
+    Phases are timed through the `on_phase` hook of `Parser.scan`, so the profiler runs the
+    very same code as `Parser.parse`. Profile a representative sample, or the slow symbols, through
+    `parse` or `parse_many`, then read `stats()` or export `to_prometheus()`.
+
+    Attributes:
+        cache (Optional[ParseCache]): A cache to look strings up in (and store them into), if any.
+        phases (Dict[str, Histogram]): The time spent in each phase of `PHASES`, in seconds.
+        tokens (Histogram): The number of tokens of each parsed string.
+        template_depth (Histogram): The maximum template nesting depth of each parsed string.
+    """
+
+    def __init__(self, cache: Optional[ParseCache] = None) -> None:
+        """
+        Initializes a profiler with empty statistics.
+
+        Args:
+            cache (Optional[ParseCache]): A cache to look strings up in (and store them into), if any.
+        """
+        self.cache: Optional[ParseCache] = cache
+        self.phases: Dict[str, Histogram] = {phase: Histogram(SECONDS_BUCKETS) for phase in PHASES}
+        self.tokens: Histogram = Histogram(TOKENS_BUCKETS)
+        self.template_depth: Histogram = Histogram(DEPTH_BUCKETS)
+        self.__parses: int = 0
+        self.__failures: int = 0
+        self.__cache_hits: int = 0
+        self.__cache_misses: int = 0
+
+    def parse(self, string: str) -> FQN:
+        """
+        Parses a string, recording its statistics.
+
+        Args:
+            string (str): The string to parse.
+
+        Returns:
+            FQN: The parsed FQN.
+
+        Raises:
+            SyntaxError: If the string can't be parsed. The phases it got through are recorded.
+        """
+        self.__parses += 1
+        if self.cache is not None:
+            cached: Optional[FQN] = self.cache.lookup(string)
+            if cached is not None:
+                self.__cache_hits += 1
+                return cached
+            self.__cache_misses += 1
+
+        try:
+            fqn: FQN = self._parse_phases(string)
+        except SyntaxError:
+            self.__failures += 1
+            raise
+
+        if self.cache is not None:
+            self.cache.store(string, fqn)
+        return fqn
+
+    def parse_many(self, strings: Iterable[str], errors: str = "raise") -> Iterator[ParseResult]:
+        """
+        Parses many strings serially, recording the statistics of each.
+
+        Args:
+            strings (Iterable[str]): The strings to parse.
+            errors (str): What to do when a string fails to parse, see `parse_many`.
+
+        Yields:
+            Iterator[Union[FQN, SyntaxError]]: The parse result of each input string.
+
+        Raises:
+            ValueError: If `errors` is not a known policy.
+        """
+        if errors not in ERROR_POLICIES:
+            raise ValueError(f"Unknown error policy '{errors}'. Expected one of {ERROR_POLICIES}")
+        return _apply_policy((self._parse_one(string) for string in strings), errors)
+
+    def _parse_one(self, string: str) -> ParseResult:
+        """
+        Parses a single string, returning the SyntaxError instead of raising it.
+        """
+        try:
+            return self.parse(string)
+        except SyntaxError as e:
+            return e
+
+    def _parse_phases(self, string: str) -> FQN:
+        """
+        Runs the phases of `Parser.parse`, timing each of them. Scopes are taken from the
+        cache's pool, if any, like `ParseCache.parse` does.
+        """
+        phases: Dict[str, Histogram] = self.phases
+
+        start: float = perf_counter()
+        parser: Parser = Parser(string, pool=self.cache.pool if self.cache is not None else None)
+        phases["tokenize"].observe(perf_counter() - start)
+        self.tokens.observe(len(parser.buffer))
+        self.template_depth.observe(_template_depth(parser.buffer.types))
+
+        clock: List[float] = [perf_counter()]
+
+        def on_phase(phase: str) -> None:
+            now: float = perf_counter()
+            phases[phase].observe(now - clock[0])
+            clock[0] = now
+
+        spans: ParseSpans = parser.scan(on_phase)
+        fqn: FQN = parser._build(spans)
+        phases["build"].observe(perf_counter() - clock[0])
+        return fqn
+
+    def merge(self, other: 'ParseProfiler') -> None:
+        """
+        Adds the statistics of another profiler, e.g. one that ran in a worker process.
+
+        Args:
+            other (ParseProfiler): The profiler to add.
+        """
+        for phase, histogram in self.phases.items():
+            histogram.merge(other.phases[phase])
+        self.tokens.merge(other.tokens)
+        self.template_depth.merge(other.template_depth)
+        stats: ProfileStats = other.stats()
+        self.__parses += stats.parses
+        self.__failures += stats.failures
+        self.__cache_hits += stats.cache_hits
+        self.__cache_misses += stats.cache_misses
+
+    def stats(self) -> ProfileStats:
+        """
+        Returns the statistics recorded so far.
+
+        Returns:
+            ProfileStats: Counters and histogram snapshots.
+        """
+        return ProfileStats(self.__parses,
+                            self.__failures,
+                            self.__cache_hits,
+                            self.__cache_misses,
+                            {phase: histogram.snapshot() for phase, histogram in self.phases.items()},
+                            self.tokens.snapshot(),
+                            self.template_depth.snapshot())
+
+    def to_prometheus(self, prefix: str = "cpp_fqn_parser") -> str:
+        """
+        Exports the statistics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): The prefix of every metric name.
+
+        Returns:
+            str: The metrics, one sample per line.
+        """
+        stats: ProfileStats = self.stats()
+        lines: List[str] = []
+        for name, help_text, value in ((f"{prefix}_parses_total", "Strings parsed.", stats.parses),
+                                       (f"{prefix}_failures_total", "Strings that failed to parse.", stats.failures),
+                                       (f"{prefix}_cache_hits_total", "Strings answered from the cache.",
+                                        stats.cache_hits),
+                                       (f"{prefix}_cache_misses_total", "Strings missing from the cache.",
+                                        stats.cache_misses)):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter", f"{name} {value}"]
+
+        name = f"{prefix}_phase_seconds"
+        lines += [f"# HELP {name} Time spent in each parsing phase.", f"# TYPE {name} histogram"]
+        for phase, snapshot in stats.phases.items():
+            lines += _prometheus_histogram(name, snapshot, f'phase="{phase}"')
+        for name, help_text, snapshot in ((f"{prefix}_tokens", "Tokens per parsed string.", stats.tokens),
+                                          (f"{prefix}_template_depth", "Maximum template nesting depth per parsed string.",
+                                           stats.template_depth)):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            lines += _prometheus_histogram(name, snapshot)
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_histogram(name: str, snapshot: HistogramSnapshot, labels: str = "") -> List[str]:
+    """
+    Formats the samples of a histogram: cumulative buckets, then the sum and the count.
+    """
+    prefix: str = f"{labels}," if labels else ""
+    lines: List[str] = []
+    cumulative: int = 0
+    for bound, count in zip(snapshot.bounds + (float("inf"),), snapshot.counts):
+        cumulative += count
+        le: str = "+Inf" if bound == float("inf") else repr(bound)
+        lines.append(f'{name}_bucket{{{prefix}le="{le}"}} {cumulative}')
+    suffix: str = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {snapshot.total!r}")
+    lines.append(f"{name}_count{suffix} {snapshot.samples}")
+    return lines
+
+
+def _template_depth(types: array) -> int:
+    """
+    Returns the maximum nesting depth of template brackets in a token type array.
+    """
+    depth: int = 0
+    deepest: int = 0
+    for code in types:
+        if code == TEMPLATE_START:
+            depth += 1
+            if depth > deepest:
+                deepest = depth
+        elif code == TEMPLATE_END:
+            depth -= 1
+    return deepest
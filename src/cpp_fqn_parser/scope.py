@@ -1,14 +1,26 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
 
-from .utils import to_dict, check_keys
+from .utils import check_keys
 
+_KEYS: List[str] = ["name", "template"]
 
-@dataclass
-class Scope:
+
+class _WeakReferenceable:
+    """
+    Gives a slotted subclass a `__weakref__` slot, which `dataclass(slots=True)` doesn't add
+    before Python 3.11.
+    """
+    __slots__ = ("__weakref__",)
+
+
+@dataclass(frozen=True, slots=True)
+class Scope(_WeakReferenceable):
     """
     Represents a lexical or semantic scope, such as a namespace, class, or function context.
 
+    Scopes are immutable and hashable, and can be weakly referenced (see `ScopePool`).
+
     Attributes:
         name (str): The name of the scope (e.g., function name, class name, or module).
         template (Optional[str]): Template or generic parameter associated with the scope, if any.
@@ -17,14 +29,16 @@ class Scope:
     template: Optional[str] = None
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, Scope) and self.name == other.name and self.template == other.template
+        return self is other or (isinstance(other, Scope) and self.name == other.name and self.template == other.template)
 
     def to_dict(self) -> Dict[str, Any]:
-        return to_dict(self)
+        return {"name": self.name, "template": self.template}
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Scope':
-        attrs: List[str] = ["name", "template"]
-        check_keys(attrs, data)
-        return Scope(name=data["name"],
-                     template=data["template"])
+        try:
+            return Scope(name=data["name"],
+                         template=data["template"])
+        except KeyError:
+            check_keys(_KEYS, data)
+            raise
@@ -0,0 +1,98 @@
+import json
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from .fqn import FQN
+
+FORMATS = ("jsonl", "tuples", "msgpack")
+
+_encode: Callable[[Any], str] = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def dump_many(fqns: Iterable[FQN], fp: IO[Any], format: str = "jsonl") -> int:
+    """
+    Streams FQNs to a file object, one record at a time.
+
+    Formats:
+        - 'jsonl': one `FQN.to_dict()` JSON object per line (text stream).
+        - 'tuples': one `FQN.to_tuple()` JSON array per line (text stream). Smaller and
+          faster than 'jsonl', as keys are not repeated for every record.
+        - 'msgpack': consecutive msgpack arrays of `FQN.to_tuple()` (binary stream).
+          Requires the `msgpack` package.
+
+    Args:
+        fqns (Iterable[FQN]): The FQNs to write.
+        fp (IO[Any]): The stream to write to.
+        format (str): The record format.
+
+    Returns:
+        int: The number of FQNs written.
+
+    Raises:
+        ValueError: If `format` is unknown.
+        ImportError: If `format` is 'msgpack' and `msgpack` is not installed.
+    """
+    count: int = 0
+    write = fp.write
+    if format == "jsonl":
+        for fqn in fqns:
+            write(_encode(fqn.to_dict()) + "\n")
+            count += 1
+    elif format == "tuples":
+        for fqn in fqns:
+            write(_encode(fqn.to_tuple()) + "\n")
+            count += 1
+    elif format == "msgpack":
+        pack = _msgpack().Packer().pack
+        for fqn in fqns:
+            write(pack(fqn.to_tuple()))
+            count += 1
+    else:
+        raise ValueError(f"Unknown format '{format}'. Expected one of {FORMATS}")
+    return count
+
+
+def load_many(fp: IO[Any], format: str = "jsonl") -> Iterator[FQN]:
+    """
+    Lazily reads FQNs written by `dump_many`.
+
+    Args:
+        fp (IO[Any]): The stream to read from.
+        format (str): The record format, see `dump_many`.
+
+    Yields:
+        Iterator[FQN]: The FQNs, in the order they were written.
+
+    Raises:
+        ValueError: If `format` is unknown.
+        ImportError: If `format` is 'msgpack' and `msgpack` is not installed.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format '{format}'. Expected one of {FORMATS}")
+    return _load_many(fp, format)
+
+
+def _load_many(fp: IO[Any], format: str) -> Iterator[FQN]:
+    """
+    Generator behind `load_many`, so that the format is validated eagerly.
+    """
+    if format == "msgpack":
+        for record in _msgpack().Unpacker(fp, use_list=False):
+            yield FQN.from_tuple(record)
+        return
+
+    decode = json.JSONDecoder().decode
+    from_record: Callable[[Any], FQN] = FQN.from_dict if format == "jsonl" else FQN.from_tuple
+    for line in fp:
+        if line.strip():
+            yield from_record(decode(line))
+
+
+def _msgpack() -> Any:
+    """
+    Imports the optional `msgpack` package.
+    """
+    try:
+        import msgpack  # type: ignore[import-not-found, import-untyped, unused-ignore]
+    except ImportError as e:
+        raise ImportError("The 'msgpack' format requires the 'msgpack' package") from e
+    return msgpack
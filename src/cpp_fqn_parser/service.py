@@ -0,0 +1,390 @@
+import asyncio
+import json
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+from typing import Deque, List, NamedTuple, Optional, Set, Tuple
+
+from .batch import ParseResult, _parse_chunk
+from .fqn import FQN
+
+# A queued request: the string to parse, the future of its result and its enqueue time.
+_Request = Tuple[str, 'asyncio.Future[FQN]', float]
+
+
+class ServiceStats(NamedTuple):
+    """
+    Usage statistics of an `AsyncParser`.
+
+    Attributes:
+        requests (int): Number of requests answered, successfully or not.
+        failures (int): Number of requests whose string failed to parse.
+        batches (int): Number of batches dispatched to the worker pool.
+        queue_depth (int): Number of requests waiting to be batched.
+        in_flight (int): Number of batches currently being parsed.
+        latency_p50 (float): Median latency, in seconds, from submission to result.
+        latency_p90 (float): 90th percentile latency, in seconds.
+        latency_p99 (float): 99th percentile latency, in seconds.
+    """
+    requests: int
+    failures: int
+    batches: int
+    queue_depth: int
+    in_flight: int
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+
+
+class AsyncParser:
+    """
+    An asyncio front-end that micro-batches concurrent parse requests.
+
+    Requests wait in a bounded queue. A single batching task takes up to `max_batch_size` of
+    them at once, giving late requests `max_delay` seconds to join, and dispatches the batch to
+    a worker pool, so the per-request overhead is paid once per batch. When the queue is full,
+    `submit` waits for room, which pushes back on producers instead of buffering without bound.
+
+    Use it as an async context manager, or call `start` and `close` explicitly.
+
+    Attributes:
+        max_batch_size (int): Maximum number of strings per batch.
+        max_delay (float): Time, in seconds, a batch waits for more requests before being dispatched.
+        max_queue (int): Maximum number of requests waiting to be batched.
+        workers (int): Number of worker processes. With 1, batches are parsed in a single worker thread.
+
+    Private Attributes:
+        __executor (Optional[Executor]): The pool that parses the batches.
+        __owns_executor (bool): Whether the executor was created here, and must be shut down on close.
+        __queue (Optional[asyncio.Queue]): The requests waiting to be batched.
+        __slots (Optional[asyncio.Semaphore]): Bounds the number of batches in flight.
+        __batcher (Optional[asyncio.Task]): The batching task.
+        __dispatches (Set[asyncio.Task]): The batches in flight.
+        __latencies (Deque[float]): The latencies of the most recent requests.
+    """
+
+    def __init__(self,
+                 max_batch_size: int = 256,
+                 max_delay: float = 0.001,
+                 max_queue: int = 4096,
+                 workers: Optional[int] = 1,
+                 executor: Optional[Executor] = None,
+                 latency_window: int = 10000) -> None:
+        """
+        Initializes a stopped service.
+
+        Args:
+            max_batch_size (int): Maximum number of strings per batch.
+            max_delay (float): Time, in seconds, a batch waits for more requests before being dispatched.
+            max_queue (int): Maximum number of requests waiting to be batched.
+            workers (Optional[int]): Number of worker processes. With 1 or fewer, batches are
+                parsed in a single worker thread. None uses `os.cpu_count()`.
+            executor (Optional[Executor]): A pool to parse batches with instead of creating one.
+                It is not shut down on close.
+            latency_window (int): Number of most recent requests latency percentiles are computed over.
+
+        Raises:
+            ValueError: If `max_batch_size`, `max_queue` or `latency_window` is not positive,
+                or `max_delay` is negative.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        if max_queue < 1:
+            raise ValueError(f"max_queue must be positive, got {max_queue}")
+        if latency_window < 1:
+            raise ValueError(f"latency_window must be positive, got {latency_window}")
+        if max_delay < 0:
+            raise ValueError(f"max_delay must not be negative, got {max_delay}")
+
+        self.max_batch_size: int = max_batch_size
+        self.max_delay: float = max_delay
+        self.max_queue: int = max_queue
+        self.workers: int = max(1, workers if workers is not None else os.cpu_count() or 1)
+        self.__executor: Optional[Executor] = executor
+        self.__owns_executor: bool = executor is None
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__slots: Optional[asyncio.Semaphore] = None
+        self.__batcher: Optional[asyncio.Task] = None
+        self.__dispatches: Set[asyncio.Task] = set()
+        self.__latencies: Deque[float] = deque(maxlen=latency_window)
+        self.__requests: int = 0
+        self.__failures: int = 0
+        self.__batches: int = 0
+        self.__closing: bool = False
+
+    async def start(self) -> None:
+        """
+        Starts the batching task and, unless one was given, the worker pool.
+
+        Raises:
+            RuntimeError: If the service was already started.
+        """
+        if self.__batcher is not None:
+            raise RuntimeError("AsyncParser is already started")
+        if self.__executor is None:
+            self.__executor = (ThreadPoolExecutor(max_workers=1) if self.workers <= 1
+                               else ProcessPoolExecutor(max_workers=self.workers))
+        self.__queue = asyncio.Queue(maxsize=self.max_queue)
+        self.__slots = asyncio.Semaphore(2 * self.workers)
+        self.__closing = False
+        self.__batcher = asyncio.get_running_loop().create_task(self._batch_loop())
+
+    async def close(self) -> None:
+        """
+        Stops accepting requests, answers every request queued before the close, then stops the
+        batching task and shuts down the worker pool if it was created here. Requests that only
+        got room in the queue after the close fail with RuntimeError.
+        """
+        if self.__batcher is None or self.__queue is None:
+            return
+        self.__closing = True
+        queue: asyncio.Queue = self.__queue
+        await queue.put(None)
+        await self.__batcher
+        self.__queue = None
+        _fail_requests(queue)
+        if self.__dispatches:
+            await asyncio.gather(*self.__dispatches)
+        self.__batcher = None
+        if self.__owns_executor and self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    async def __aenter__(self) -> 'AsyncParser':
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def submit(self, string: str) -> 'asyncio.Future[FQN]':
+        """
+        Queues a string for parsing, waiting for room in the queue if it is full.
+
+        Args:
+            string (str): The string to parse.
+
+        Returns:
+            asyncio.Future[FQN]: The future of the parsed FQN. It raises SyntaxError if the
+                string can't be parsed.
+
+        Raises:
+            RuntimeError: If the service is not running, or is closed while waiting for room.
+        """
+        if self.__queue is None or self.__closing:
+            raise RuntimeError("AsyncParser is not running")
+        queue: asyncio.Queue = self.__queue
+        future: asyncio.Future[FQN] = asyncio.get_running_loop().create_future()
+        await queue.put((string, future, perf_counter()))
+        if queue is not self.__queue:
+            # The batching task is gone: nothing will take this request, nor the ones behind it.
+            future.cancel()
+            _fail_requests(queue)
+            raise RuntimeError("AsyncParser is closed")
+        return future
+
+    async def parse(self, string: str) -> FQN:
+        """
+        Parses a string, batched with the other requests submitted at the same time.
+
+        Args:
+            string (str): The string to parse.
+
+        Returns:
+            FQN: The parsed FQN.
+
+        Raises:
+            SyntaxError: If the string can't be parsed.
+            RuntimeError: If the service is not running.
+        """
+        return await (await self.submit(string))
+
+    def stats(self) -> ServiceStats:
+        """
+        Returns the current usage statistics of the service.
+
+        Returns:
+            ServiceStats: Request, failure and batch counters, queue depth, batches in flight
+                and latency percentiles over the most recent requests.
+        """
+        latencies: List[float] = sorted(self.__latencies)
+        return ServiceStats(self.__requests,
+                            self.__failures,
+                            self.__batches,
+                            self.__queue.qsize() if self.__queue is not None else 0,
+                            len(self.__dispatches),
+                            _percentile(latencies, 0.50),
+                            _percentile(latencies, 0.90),
+                            _percentile(latencies, 0.99))
+
+    async def _batch_loop(self) -> None:
+        """
+        Groups queued requests into batches and dispatches them, until the close sentinel is met.
+        """
+        assert self.__queue is not None and self.__slots is not None
+        queue: asyncio.Queue = self.__queue
+        loop = asyncio.get_running_loop()
+        closing: bool = False
+        while not closing:
+            request: Optional[_Request] = await queue.get()
+            if request is None:
+                break
+            batch: List[_Request] = [request]
+            closing = self._drain(batch)
+            if not closing and len(batch) < self.max_batch_size:
+                await asyncio.sleep(self.max_delay)
+                closing = self._drain(batch)
+
+            await self.__slots.acquire()
+            self.__batches += 1
+            task: asyncio.Task = loop.create_task(self._dispatch(batch))
+            self.__dispatches.add(task)
+            task.add_done_callback(self.__dispatches.discard)
+
+    def _drain(self, batch: List[_Request]) -> bool:
+        """
+        Moves queued requests into `batch` without waiting, up to `max_batch_size`.
+
+        Returns:
+            bool: True if the close sentinel was met.
+        """
+        assert self.__queue is not None
+        while len(batch) < self.max_batch_size:
+            try:
+                request: Optional[_Request] = self.__queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return False
+            if request is None:
+                return True
+            batch.append(request)
+        return False
+
+    async def _dispatch(self, batch: List[_Request]) -> None:
+        """
+        Parses a batch in the worker pool and resolves the futures of its requests.
+        """
+        assert self.__slots is not None
+        try:
+            strings: List[str] = [string for string, _, _ in batch]
+            try:
+                results: List[ParseResult] = await asyncio.get_running_loop().run_in_executor(
+                    self.__executor, _parse_chunk, strings)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            now: float = perf_counter()
+            for (_, future, submitted), result in zip(batch, results):
+                self.__requests += 1
+                self.__latencies.append(now - submitted)
+                if future.done():
+                    continue
+                if isinstance(result, SyntaxError):
+                    self.__failures += 1
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            self.__slots.release()
+
+
+def _fail_requests(queue: asyncio.Queue) -> None:
+    """
+    Fails the requests left in the queue of a closed service.
+    """
+    while True:
+        try:
+            request: Optional[_Request] = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        if request is not None and not request[1].done():
+            request[1].set_exception(RuntimeError("AsyncParser is closed"))
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """
+    Returns the nearest-rank percentile of sorted `values`, or 0.0 if there are none.
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def serve(parser: AsyncParser, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+    """
+    Serves an `AsyncParser` over TCP with a line protocol.
+
+    Each request is a line holding one symbol. Each response is a line holding either the
+    `FQN.to_dict()` JSON object of the symbol, or `{"error": "<message>"}` if it can't be
+    parsed. Requests may be pipelined: responses are sent in request order, and a client that
+    sends faster than the service parses is slowed down by the parser's bounded queue.
+
+    Args:
+        parser (AsyncParser): A started parser that answers the requests.
+        host (str): The interface to listen on.
+        port (int): The port to listen on. 0 picks a free port, see `server.sockets`.
+
+    Returns:
+        asyncio.AbstractServer: The listening server. Closing it does not close `parser`.
+    """
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        # The queue itself is unbounded, so that the end sentinel never waits for a responder
+        # that died or is stuck; `room` bounds the responses not written yet.
+        loop = asyncio.get_running_loop()
+        pending: asyncio.Queue = asyncio.Queue()
+        room: asyncio.Semaphore = asyncio.Semaphore(parser.max_queue)
+        responder: asyncio.Task = loop.create_task(_respond(pending, room, writer))
+        try:
+            async for line in reader:
+                string: str = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                if responder.done():
+                    break
+                if not string.strip():
+                    continue
+                if room.locked():
+                    # Wait for room, unless the responder dies first and never makes any.
+                    acquire: asyncio.Task = loop.create_task(room.acquire())
+                    await asyncio.wait({acquire, responder}, return_when=asyncio.FIRST_COMPLETED)
+                    if not acquire.done():
+                        acquire.cancel()
+                        break
+                else:
+                    await room.acquire()
+                pending.put_nowait(await parser.submit(string))
+        except ConnectionError:
+            pass
+        except BaseException:
+            responder.cancel()
+            writer.close()
+            raise
+        pending.put_nowait(None)
+        try:
+            await responder
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+async def _respond(pending: asyncio.Queue, room: asyncio.Semaphore, writer: asyncio.StreamWriter) -> None:
+    """
+    Writes the response of each pending request, in order, until the end sentinel is met,
+    releasing `room` once each is written. Once the client is gone, responses are still
+    awaited but no longer written.
+    """
+    connected: bool = True
+    while (future := await pending.get()) is not None:
+        try:
+            response: str = json.dumps((await future).to_dict())
+        except Exception as e:
+            response = json.dumps({"error": str(e)})
+        if connected:
+            try:
+                writer.write(response.encode("utf-8") + b"\n")
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+        room.release()
@@ -0,0 +1,420 @@
+import mmap
+import os
+import stat
+import struct
+import sys
+import tempfile
+from array import array
+from functools import lru_cache
+from types import TracebackType
+from typing import Optional, Dict, List, Iterable, Iterator, Sequence, Callable, Type, BinaryIO
+
+from .fqn import FQN
+from .scope import Scope
+
+MAGIC: bytes = b"FQNS"
+VERSION: int = 1
+
+# Magic, version, reserved, string count, record count, then the offsets of the record data,
+# the record offsets, the string offsets, the string data and the end of the file.
+_HEADER = struct.Struct("<4sHHQQQQQQQ")
+
+# Encodes a missing (None) string reference.
+_NONE: int = 0xFFFFFFFF
+
+_CONSTANT: int = 1
+_VOLATILE: int = 2
+
+
+class SymbolStore:
+    """
+    A read-only, memory-mapped store of parsed FQNs.
+
+    Opening a store only maps the file: records are decoded into FQN objects when they are
+    accessed, so a process starts instantly regardless of the size of the corpus, and several
+    processes opening the same file share its pages.
+
+    Stores are written and mapped in the native byte order of little-endian hosts.
+
+    File layout, see `StoreWriter`:
+        - a fixed-size header (`_HEADER`),
+        - the record data: per symbol, a packed run of uint32 words
+          `[name, full_name, return_type, template, flags, n_args, *args, n_scopes, *(scope_name, scope_template)]`
+          where strings are indexes into the string table,
+        - the record offsets: uint64 word offsets of each record, plus the end offset,
+        - the string offsets: uint64 byte offsets of each string, plus the end offset,
+        - the string data: the UTF-8 encoded strings, back to back.
+
+    Attributes:
+        path (str): The path of the store file.
+
+    Private Attributes:
+        _file (BinaryIO): The open store file.
+        _mmap (mmap.mmap): The mapping of the file.
+        _words (memoryview): The record data, as uint32 words.
+        _record_offsets (memoryview): Start word of each record, plus the end offset.
+        _string_offsets (memoryview): Start byte of each string, plus the end offset.
+        _string_data (memoryview): The UTF-8 string data.
+        _string (Callable[[int], Optional[str]]): Cached decoder of string references.
+    """
+
+    def __init__(self, path: str, string_cache_size: int = 65536) -> None:
+        """
+        Opens and maps a store file.
+
+        Args:
+            path (str): The path of the store file.
+            string_cache_size (int): Number of decoded strings kept in memory, as scope names and
+                types are shared by many symbols.
+
+        Raises:
+            ValueError: If the file is not a store of a supported version.
+            OSError: On big-endian hosts, where the store can't be mapped directly.
+        """
+        if sys.byteorder != "little":
+            raise OSError("SymbolStore requires a little-endian host")
+
+        self.path: str = path
+        self._file: BinaryIO = open(path, "rb")
+        try:
+            self._mmap: mmap.mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise ValueError(f"'{path}' is not a version {VERSION} symbol store")
+
+        view: memoryview = memoryview(self._mmap)
+        magic, version, _, strings, records, data_at, records_at, strings_at, chars_at, end = \
+            _HEADER.unpack_from(view)
+        if magic != MAGIC or version != VERSION:
+            view.release()
+            self.close()
+            raise ValueError(f"'{path}' is not a version {VERSION} symbol store")
+
+        self._words: memoryview = view[data_at:records_at].cast("I")
+        self._record_offsets: memoryview = view[records_at:records_at + 8 * (records + 1)].cast("Q")
+        self._string_offsets: memoryview = view[strings_at:strings_at + 8 * (strings + 1)].cast("Q")
+        self._string_data: memoryview = view[chars_at:end]
+        self._string: Callable[[int], Optional[str]] = lru_cache(maxsize=string_cache_size)(self._decode_string)
+
+    def __len__(self) -> int:
+        return len(self._record_offsets) - 1
+
+    def __getitem__(self, index: int) -> FQN:
+        """
+        Decodes the record of a symbol.
+
+        Args:
+            index (int): The position of the symbol in the store. Negative indexes count from the end.
+
+        Returns:
+            FQN: The decoded FQN.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SymbolStore index out of range")
+
+        words: memoryview = self._words
+        string: Callable[[int], Optional[str]] = self._string
+        cursor: int = self._record_offsets[index]
+        name, full_name, return_type, template, flags, n_args = words[cursor:cursor + 6]
+        cursor += 6
+        args: Optional[tuple] = None
+        if n_args != _NONE:
+            args = tuple([string(arg) for arg in words[cursor:cursor + n_args]])
+            cursor += n_args
+        n_scopes: int = words[cursor]
+        cursor += 1
+        scopes: Optional[tuple] = None
+        if n_scopes != _NONE:
+            scopes = tuple([Scope(string(words[cursor + i]), string(words[cursor + i + 1]))  # type: ignore[arg-type]
+                            for i in range(0, 2 * n_scopes, 2)])
+
+        return FQN(name=string(name),  # type: ignore[arg-type]
+                   full_name=string(full_name),  # type: ignore[arg-type]
+                   return_type=string(return_type),
+                   args=args,
+                   scopes=scopes,
+                   template=string(template),
+                   constant=bool(flags & _CONSTANT),
+                   volatile=bool(flags & _VOLATILE))
+
+    def __iter__(self) -> Iterator[FQN]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def _decode_string(self, index: int) -> Optional[str]:
+        """
+        Decodes a string reference of the string table.
+        """
+        if index == _NONE:
+            return None
+        start, end = self._string_offsets[index:index + 2]
+        return sys.intern(str(self._string_data[start:end], "utf-8"))
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the store. FQNs already decoded remain valid.
+        """
+        for attr in ("_words", "_record_offsets", "_string_offsets", "_string_data"):
+            view: Optional[memoryview] = getattr(self, attr, None)
+            if view is not None:
+                view.release()
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'SymbolStore':
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+    @staticmethod
+    def write(path: str, fqns: Iterable[FQN], append: bool = False) -> int:
+        """
+        Writes FQNs to a store file.
+
+        Args:
+            path (str): The path of the store file.
+            fqns (Iterable[FQN]): The FQNs to write.
+            append (bool): Whether to keep the symbols already in the file, if it exists.
+
+        Returns:
+            int: The total number of symbols in the store.
+        """
+        with StoreWriter(path, append=append) as writer:
+            for fqn in fqns:
+                writer.add(fqn)
+            return writer.count
+
+
+class StoreWriter:
+    """
+    Writes parsed FQNs to a `SymbolStore` file.
+
+    Record data is streamed to a temporary file next to the destination while the string table
+    is built in memory, deduplicating every string except full names. On `close()`, the
+    temporary file is completed and atomically renamed over the destination, so processes that
+    have the previous version mapped keep reading it undisturbed. It keeps the permissions of
+    the store it replaces, and a new store gets the default permissions for the umask.
+
+    Attributes:
+        path (str): The path of the store file.
+        count (int): Number of records written so far.
+
+    Private Attributes:
+        _tmp_path (str): The path of the temporary file.
+        _tmp (BinaryIO): The temporary file being written.
+        _record_offsets (array): Start word of each record.
+        _words (int): Number of record words written.
+        _strings (List[bytes]): The encoded string table.
+        _string_ids (Dict[str, int]): Index of each deduplicated string in the table.
+    """
+
+    def __init__(self, path: str, append: bool = False) -> None:
+        """
+        Starts writing a store.
+
+        Args:
+            path (str): The path of the store file.
+            append (bool): Whether to keep the symbols of an existing store at `path`. Their
+                records are copied as-is, without being decoded.
+
+        Raises:
+            OSError: On big-endian hosts, see `SymbolStore`.
+        """
+        if sys.byteorder != "little":
+            raise OSError("StoreWriter requires a little-endian host")
+
+        self.path: str = path
+        self.count: int = 0
+        fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+        self._tmp_path: str = tmp_path
+        self._tmp: BinaryIO = os.fdopen(fd, "w+b")
+        self._tmp.write(b"\0" * _HEADER.size)
+        self._record_offsets: array = array("Q")
+        self._words: int = 0
+        self._strings: List[bytes] = []
+        self._string_ids: Dict[str, int] = {}
+
+        if append and os.path.exists(path):
+            try:
+                self._copy_store(path)
+            except BaseException:
+                self.abort()
+                raise
+
+    def _copy_store(self, path: str) -> None:
+        """
+        Seeds the writer with the strings and records of an existing store, keeping their
+        string references valid.
+        """
+        with SymbolStore(path) as store:
+            offsets: memoryview = store._string_offsets
+            for index in range(len(offsets) - 1):
+                string: bytes = bytes(store._string_data[offsets[index]:offsets[index + 1]])
+                self._string_ids.setdefault(string.decode("utf-8"), index)
+                self._strings.append(string)
+            with store._words[:store._record_offsets[-1]] as words:
+                self._tmp.write(words)
+                self._words = len(words)
+            self._record_offsets.extend(store._record_offsets[:-1])
+            self.count = len(store)
+
+    def _string_id(self, string: Optional[str], dedup: bool = True) -> int:
+        """
+        Returns the string table index of a string, adding it if needed.
+        """
+        if string is None:
+            return _NONE
+        if dedup:
+            index: Optional[int] = self._string_ids.get(string)
+            if index is not None:
+                return index
+            self._string_ids[string] = len(self._strings)
+        self._strings.append(string.encode("utf-8"))
+        return len(self._strings) - 1
+
+    def add(self, fqn: FQN) -> None:
+        """
+        Appends an FQN to the store.
+
+        Args:
+            fqn (FQN): The FQN to write.
+        """
+        string_id = self._string_id
+        words: array = array("I", [string_id(fqn.name),
+                                   string_id(fqn.full_name, dedup=False),
+                                   string_id(fqn.return_type),
+                                   string_id(fqn.template),
+                                   (_CONSTANT if fqn.constant else 0) | (_VOLATILE if fqn.volatile else 0)])
+        if fqn.args is None:
+            words.append(_NONE)
+        else:
+            words.append(len(fqn.args))
+            words.extend([string_id(arg) for arg in fqn.args])
+        if fqn.scopes is None:
+            words.append(_NONE)
+        else:
+            words.append(len(fqn.scopes))
+            for scope in fqn.scopes:
+                words.append(string_id(scope.name))
+                words.append(string_id(scope.template))
+
+        self._record_offsets.append(self._words)
+        self._tmp.write(words.tobytes())
+        self._words += len(words)
+        self.count += 1
+
+    def close(self) -> None:
+        """
+        Writes the offsets, string table and header, and moves the store into place.
+        """
+        if self._tmp.closed:
+            return
+        try:
+            tmp: BinaryIO = self._tmp
+            _pad(tmp)
+            records_at: int = tmp.tell()
+            self._record_offsets.append(self._words)
+            tmp.write(self._record_offsets.tobytes())
+
+            strings_at: int = tmp.tell()
+            string_offsets: array = array("Q", [0])
+            for string in self._strings:
+                string_offsets.append(string_offsets[-1] + len(string))
+            tmp.write(string_offsets.tobytes())
+            chars_at: int = tmp.tell()
+            for string in self._strings:
+                tmp.write(string)
+            end: int = tmp.tell()
+
+            tmp.seek(0)
+            tmp.write(_HEADER.pack(MAGIC, VERSION, 0, len(self._strings), self.count,
+                                   _HEADER.size, records_at, strings_at, chars_at, end))
+            tmp.flush()
+            os.fsync(tmp.fileno())
+            tmp.close()
+            os.chmod(self._tmp_path, _file_mode(self.path))
+            os.replace(self._tmp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self) -> None:
+        """
+        Discards everything written, leaving any existing store untouched.
+        """
+        self._tmp.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> 'StoreWriter':
+        return self
+
+    def __exit__(self,
+                 exc_type: Optional[Type[BaseException]],
+                 exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def merge_stores(path: str, sources: Sequence[str]) -> int:
+    """
+    Merges several stores into one. The records of the first source are copied as-is; the
+    others are decoded and re-encoded against the merged string table.
+
+    Args:
+        path (str): The path of the merged store. It may be one of `sources`.
+        sources (Sequence[str]): The paths of the stores to merge, in order.
+
+    Returns:
+        int: The number of symbols in the merged store.
+    """
+    writer: StoreWriter = StoreWriter(path)
+    try:
+        if sources:
+            writer._copy_store(sources[0])
+        for source in sources[1:]:
+            with SymbolStore(source) as store:
+                for fqn in store:
+                    writer.add(fqn)
+    except BaseException:
+        writer.abort()
+        raise
+    writer.close()
+    return writer.count
+
+
+def _pad(fileobj: BinaryIO, alignment: int = 8) -> None:
+    """
+    Pads a file with zeros up to the next multiple of `alignment` bytes.
+    """
+    fileobj.write(b"\0" * (-fileobj.tell() % alignment))
+
+
+def _file_mode(path: str) -> int:
+    """
+    Returns the permissions of the file at `path`, or those of a new file under the current
+    umask if there is none. Temporary files are created private, whatever the umask.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask: int = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
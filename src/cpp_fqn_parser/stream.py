@@ -0,0 +1,208 @@
+import io
+import json
+import re
+import sys
+from typing import IO, Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Union, cast
+
+from .batch import parse_many, ParseResult
+from .fqn import FQN
+from .serialization import dump_many
+
+FORMATS = ("jsonl", "csv", "parquet")
+
+CSV_COLUMNS: List[str] = ["name", "full_name", "return_type", "args", "scopes", "template", "constant", "volatile"]
+
+_GZIP_MAGIC: bytes = b"\x1f\x8b"
+_ZSTD_MAGIC: bytes = b"\x28\xb5\x2f\xfd"
+
+# An `nm` line: an optional address, the one-letter symbol type and the symbol itself.
+_NM_LINE_RE = re.compile(r"^\s*(?:[0-9a-fA-F]+\s+)?[a-zA-Z?-]\s+(.*)$")
+
+
+def parse_stream(fileobj: Iterable[str],
+                 nm: bool = False,
+                 workers: Optional[int] = 1,
+                 chunksize: int = 1024,
+                 errors: str = "skip",
+                 mangled: bool = False,
+                 threads: bool = False) -> Iterator[ParseResult]:
+    """
+    Lazily parses newline-delimited symbols read from a file object.
+
+    Lines are read one at a time, so memory use does not depend on the size of the input.
+    Blank lines are ignored.
+
+    Args:
+        fileobj (Iterable[str]): A text file object (or any iterable of lines).
+        nm (bool): Whether lines are in `nm` output format ('<address> <type> <symbol>'),
+            in which case only the symbol is parsed.
+        workers (Optional[int]): Number of worker processes, or threads with `threads`, see `parse_many`.
+        chunksize (int): Number of lines sent to a worker at once, see `parse_many`.
+        errors (str): What to do with lines that fail to parse, see `parse_many`.
+        mangled (bool): Whether mangled symbols are parsed directly, see `parse_many`.
+        threads (bool): Whether the workers are threads instead of processes, see `parse_many`.
+
+    Yields:
+        Iterator[Union[FQN, SyntaxError]]: The parse result of each symbol.
+    """
+    return parse_many(_iter_symbols(fileobj, nm), workers=workers, chunksize=chunksize, errors=errors,
+                      mangled=mangled, threads=threads)
+
+
+def _iter_symbols(lines: Iterable[str], nm: bool) -> Iterator[str]:
+    """
+    Extracts the symbols from raw input lines, skipping blank ones.
+    """
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if nm:
+            matched = _NM_LINE_RE.match(line)
+            line = matched[1] if matched else line
+        if line.strip():
+            yield line
+
+
+def open_input(path: str) -> TextIO:
+    """
+    Opens a file (or stdin, for '-') for reading text, transparently decompressing it.
+
+    Compression is detected from the content, not the file name: gzip is supported out of
+    the box and zstd requires the `zstandard` package.
+
+    Args:
+        path (str): The path to open, or '-' for stdin.
+
+    Returns:
+        TextIO: A text stream over the decompressed content.
+
+    Raises:
+        ImportError: If the input is zstd-compressed and `zstandard` is not installed.
+    """
+    raw: IO[bytes] = sys.stdin.buffer if path == "-" else open(path, "rb")
+    buffered: io.BufferedReader = raw if isinstance(raw, io.BufferedReader) else io.BufferedReader(raw)  # type: ignore[arg-type]
+    magic: bytes = buffered.peek(4)[:4]
+
+    binary: IO[bytes] = buffered
+    if magic.startswith(_GZIP_MAGIC):
+        import gzip
+        binary = cast(IO[bytes], gzip.GzipFile(fileobj=buffered))
+    elif magic.startswith(_ZSTD_MAGIC):
+        binary = _zstd_reader(buffered)
+
+    return io.TextIOWrapper(binary, encoding="utf-8", errors="replace")  # type: ignore[arg-type]
+
+
+def open_output(path: str, binary: bool = False) -> IO[Any]:
+    """
+    Opens a file (or stdout, for '-') for writing. Paths ending in '.gz' are gzip-compressed.
+
+    Args:
+        path (str): The path to open, or '-' for stdout.
+        binary (bool): Whether to open the file in binary mode.
+
+    Returns:
+        IO[Any]: The opened stream.
+    """
+    if path == "-":
+        return sys.stdout.buffer if binary else sys.stdout
+    if path.endswith(".gz"):
+        import gzip
+        return cast(IO[Any], gzip.open(path, "wb") if binary else gzip.open(path, "wt", encoding="utf-8", newline=""))
+    return open(path, "wb") if binary else open(path, "w", encoding="utf-8", newline="")
+
+
+def _zstd_reader(fileobj: IO[bytes]) -> IO[bytes]:
+    """
+    Wraps a binary stream with a zstd decompressor.
+    """
+    try:
+        import zstandard  # type: ignore[import-not-found, unused-ignore]
+    except ImportError as e:
+        raise ImportError("Reading zstd-compressed input requires the 'zstandard' package") from e
+    return zstandard.ZstdDecompressor().stream_reader(fileobj)
+
+
+def write_jsonl(fqns: Iterable[FQN], out: IO[str]) -> int:
+    """
+    Writes FQNs as JSON Lines, one `FQN.to_dict()` object per line.
+
+    Args:
+        fqns (Iterable[FQN]): The FQNs to write.
+        out (IO[str]): The stream to write to.
+
+    Returns:
+        int: The number of FQNs written.
+    """
+    return dump_many(fqns, out, "jsonl")
+
+
+def write_csv(fqns: Iterable[FQN], out: IO[str]) -> int:
+    """
+    Writes FQNs as CSV with a header row. The `args` and `scopes` columns hold JSON lists.
+
+    Args:
+        fqns (Iterable[FQN]): The FQNs to write.
+        out (IO[str]): The stream to write to.
+
+    Returns:
+        int: The number of FQNs written.
+    """
+    import csv
+
+    writer = csv.writer(out)
+    writer.writerow(CSV_COLUMNS)
+    count: int = 0
+    for fqn in fqns:
+        row: Dict[str, Any] = fqn.to_dict()
+        row["args"] = json.dumps(row["args"])
+        row["scopes"] = json.dumps(row["scopes"])
+        writer.writerow([row[column] for column in CSV_COLUMNS])
+        count += 1
+    return count
+
+
+def write_parquet(fqns: Iterable[FQN], out: Union[str, BinaryIO], batch_size: int = 65536) -> int:
+    """
+    Writes FQNs as a Parquet file, one row group per `batch_size` FQNs, so that only a
+    single batch is ever held in memory. Requires the `pyarrow` package.
+
+    Args:
+        fqns (Iterable[FQN]): The FQNs to write.
+        out (Union[str, BinaryIO]): The path or binary stream to write to.
+        batch_size (int): Number of rows per row group.
+
+    Returns:
+        int: The number of FQNs written.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+    try:
+        import pyarrow as pa  # type: ignore[import-not-found, import-untyped, unused-ignore]
+        import pyarrow.parquet as pq  # type: ignore[import-not-found, import-untyped, unused-ignore]
+    except ImportError as e:
+        raise ImportError("Writing Parquet output requires the 'pyarrow' package") from e
+
+    scope_type = pa.struct([("name", pa.string()), ("template", pa.string())])
+    schema = pa.schema([("name", pa.string()),
+                        ("full_name", pa.string()),
+                        ("return_type", pa.string()),
+                        ("args", pa.list_(pa.string())),
+                        ("scopes", pa.list_(scope_type)),
+                        ("template", pa.string()),
+                        ("constant", pa.bool_()),
+                        ("volatile", pa.bool_())])
+
+    count: int = 0
+    with pq.ParquetWriter(out, schema) as writer:
+        batch: List[Dict[str, Any]] = []
+        for fqn in fqns:
+            batch.append(fqn.to_dict())
+            if len(batch) == batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch.clear()
+        if batch or not count:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
@@ -1,20 +1,78 @@
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field
 
-from .utils import to_dict, check_keys
+from .utils import check_keys
 
+_KEYS: List[str] = ["type_", "value"]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True, init=False, repr=False, eq=False)
 class Token:
     """
     Represents a lexical token with a type and value.
 
+    A token is a span `[start, end)` of its source string: its value is only sliced out of
+    the source when it is read. Tokens are immutable and hashable.
+
     Attributes:
         type_ (str): The type/category of the token (e.g., 'MEMBER', 'SCOPE').
-        value (str): The string value of the token.
+        source (str): The string the token was read from.
+        start (int): Index of the first character of the token in `source`.
+        end (int): Index right after the last character of the token in `source`.
+        kind (Optional[str]): For OPERATOR tokens, the kind of operator (e.g., 'SUBSCRIPT',
+            'NEW_ARRAY', 'CONVERSION'). Not taken into account for equality.
+
+    Private Attributes:
+        _value (Optional[str]): The value of the token when it differs from its span, e.g. the
+            normalized name of an operator ('operator[]' for 'operator []').
     """
     type_: str
-    value: str
+    source: str
+    start: int
+    end: int
+    kind: Optional[str] = field(default=None)
+    _value: Optional[str] = field(default=None)
+
+    def __init__(self,
+                 type_: str,
+                 value: Optional[str] = None,
+                 kind: Optional[str] = None,
+                 *,
+                 source: Optional[str] = None,
+                 start: int = 0,
+                 end: Optional[int] = None) -> None:
+        """
+        Initializes a token, either from its value or as a span of a source string.
+
+        Args:
+            type_ (str): The type/category of the token.
+            value (Optional[str]): The value of the token. Required without `source`; with
+                `source`, only given when it differs from the span.
+            kind (Optional[str]): The kind of operator, for OPERATOR tokens.
+            source (Optional[str]): The string the token was read from.
+            start (int): Start of the span in `source`.
+            end (Optional[int]): End of the span in `source`. Defaults to the end of `source`.
+
+        Raises:
+            ValueError: If neither `value` nor `source` is given.
+        """
+        if source is None:
+            if value is None:
+                raise ValueError("A Token needs a value or a source")
+            source, value = value, None
+        _set_type(self, type_)
+        _set_source(self, source)
+        _set_start(self, start)
+        _set_end(self, len(source) if end is None else end)
+        _set_kind(self, kind)
+        _set_value(self, value)
+
+    @property
+    def value(self) -> str:
+        """
+        The string value of the token.
+        """
+        return self.source[self.start:self.end] if self._value is None else self._value
 
     def __eq__(self, other: object) -> bool:
         """
@@ -28,12 +86,32 @@ class Token:
         """
         return isinstance(other, Token) and self.type_ == other.type_ and self.value == other.value
 
+    def __hash__(self) -> int:
+        return hash((self.type_, self.value))
+
+    def __repr__(self) -> str:
+        kind: str = f", kind={self.kind!r}" if self.kind is not None else ""
+        return f"Token(type_={self.type_!r}, value={self.value!r}{kind})"
+
     def to_dict(self) -> Dict[str, Any]:
-        return to_dict(self)
+        return {"type_": self.type_, "value": self.value, "kind": self.kind}
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'Token':
-        attrs: List[str] = ["type_", "value"]
-        check_keys(attrs, data)
-        return Token(type_=data["type_"],
-                     value=data["value"])
+        try:
+            return Token(type_=data["type_"],
+                         value=data["value"],
+                         kind=data.get("kind"))
+        except KeyError:
+            check_keys(_KEYS, data)
+            raise
+
+
+# Setters of the slots of Token. Tokens are created for every lexeme, and setting the slots
+# directly is much cheaper than going through the frozen `__setattr__`.
+_set_type = vars(Token)["type_"].__set__
+_set_source = vars(Token)["source"].__set__
+_set_start = vars(Token)["start"].__set__
+_set_end = vars(Token)["end"].__set__
+_set_kind = vars(Token)["kind"].__set__
+_set_value = vars(Token)["_value"].__set__
@@ -1,36 +1,52 @@
 import re
-from typing import Optional, Pattern, Match, List, Tuple
+from array import array
+from bisect import bisect_left
+from typing import Any, Optional, Pattern, Match, List, Tuple
 from collections.abc import Iterator
 
 from .token import Token
-
-OPERATORS: List[str] = ['+', '-', '/', '*', '%',
-                        '++', '--',
-                        '<', '>', '<=', '>=', '==', '!=',
-                        '+=', '-=', '*=', '/=', '%=', '&=', '|=', '^=', '<<=', '>>=',
-                        '<<', '>>', '&', '^', '~', '|',
-                        '&&', '||', '!',
-                        '->', '[]',
-                        '=',
-                        '()', ',']
-
-SORTED_OPERATORS: List[str] = sorted(OPERATORS, key=len, reverse=True)
+from .buffer import TokenBuffer, OPERATOR, WHITESPACE, MEMBER
+from .operators import OPERATOR_KINDS, match_symbol, match_operator
 
 _OPERATOR_PREFIX_RE = re.compile(r"^operator\b\s*")
 
-_SPEC: List[Tuple[Pattern[str], str]] = [
-    (re.compile(r"^\s+"), "WHITESPACE"),
-    (re.compile(r"^::"), "SCOPE"),
-    (re.compile(r"^<"), "TEMPLATE_START"),
-    (re.compile(r"^>"), "TEMPLATE_END"),
-    (re.compile(r"^\("), "PARENTHESIS_START"),
-    (re.compile(r"^\)"), "PARENTHESIS_END"),
-    (re.compile(r"^\*"), "POINTER"),
-    (re.compile(r"^&"), "REFERENCE"),
-    (re.compile(r"^,"), "SEPARATOR"),
-    (re.compile(r"^[a-zA-Z_]\w*"), "MEMBER"),
+_SPEC: List[Tuple[str, str]] = [
+    (r"\s+", "WHITESPACE"),
+    (r"::", "SCOPE"),
+    (r"<", "TEMPLATE_START"),
+    (r">", "TEMPLATE_END"),
+    (r"\(", "PARENTHESIS_START"),
+    (r"\)", "PARENTHESIS_END"),
+    (r"\*", "POINTER"),
+    (r"&", "REFERENCE"),
+    (r",", "SEPARATOR"),
+    (r"[a-zA-Z_]\w*", "MEMBER"),
 ]
 
+# All token patterns folded into a single alternation so that each token is found with one
+# `match(string, pos)` call at the cursor. The 'operator' keyword goes first, as it would
+# otherwise be taken as a MEMBER; the operator that follows it is recognized by `match_operator`.
+# The groups are in the order of `buffer.TYPE_NAMES`.
+_MASTER_RE: Pattern[str] = re.compile(
+    "|".join([r"(?P<OPERATOR>operator\b\s*)"]
+             + [f"(?P<{token_type}>{pattern})" for pattern, token_type in _SPEC])
+)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Builds the operator lists `OPERATORS` and `SORTED_OPERATORS` on first access. Tokenizing
+    uses the `operators` trie instead, so importing this module doesn't pay for them.
+    """
+    if name == "OPERATORS":
+        value: List[str] = list(OPERATOR_KINDS)
+    elif name == "SORTED_OPERATORS":
+        value = sorted(OPERATOR_KINDS, key=len, reverse=True)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 class Tokenizer:
     """
@@ -75,27 +91,45 @@ class Tokenizer:
         if not self._has_more_tokens():
             return None
 
-        string: str = self.string[self.__cursor:]
+        start: int = self.__cursor
+        matched: Optional[Match[str]] = _MASTER_RE.match(self.string, start)
+        if matched is None:
+            raise SyntaxError(f"Unexpected token '{self.string[start]}'")
+        self.__cursor = matched.end()
 
-        token = self.get_operator(string)
-        if token:
-            return token
+        token_type: Optional[str] = matched.lastgroup
+        if token_type == "OPERATOR":
+            return self._operator_token(start)
 
-        for pattern, token_type in _SPEC:
-            token_value: Optional[str] = self._match(pattern, string)
-            if token_value is not None:
-                return Token(token_type, token_value)
+        return Token(str(token_type), source=self.string, start=start, end=self.__cursor)
 
-        raise SyntaxError(f"Unexpected token '{string[0]}'")
+    def _operator_token(self, start: int) -> Token:
+        """
+        Builds the token of an 'operator' keyword the cursor just moved past, consuming the
+        operator that follows it.
+
+        Args:
+            start (int): The position of the 'operator' keyword.
+
+        Returns:
+            Token: An OPERATOR token with its normalized name and kind, or a MEMBER token for
+                'operator' if no valid operator follows.
+        """
+        operator = match_operator(self.string, self.__cursor)
+        if operator is None:
+            return Token("MEMBER", source=self.string, start=start, end=start + len("operator"))
+        self.__cursor, name, kind = operator
+        return Token("OPERATOR", name, kind, source=self.string, start=start, end=self.__cursor)
 
     def get_operator(self, string: str) -> Optional[Token]:
         """
         Attempts to match and extract a C++ operator overload token from the beginning of the input string.
 
         This method detects the 'operator' keyword as a whole word, optionally followed by whitespace
-        and a valid C++ operator symbol (e.g., '==', '[]', '+', etc.). If a match is found, it consumes
-        the corresponding characters from the input and returns an OPERATOR token. If only the 'operator'
-        keyword is matched without a valid symbol, a MEMBER token for 'operator' is returned.
+        and a valid C++ operator (e.g., '==', '[]', 'new[]', '""_km', or the type of a conversion
+        operator). If a match is found, it consumes the corresponding characters from the input and
+        returns an OPERATOR token. If only the 'operator' keyword is matched without a valid operator,
+        a MEMBER token for 'operator' is returned.
 
         Args:
             string (str): The remaining input string to check for an operator overload.
@@ -107,33 +141,146 @@ class Tokenizer:
         if not match:
             return None
 
-        prefix_len = match.end()
-        remainder = string[prefix_len:]
-        op_symbol = _match_operator_symbol(remainder)
-        if op_symbol:
-            self.__cursor += prefix_len + len(op_symbol)
-            return Token("OPERATOR", f"operator{op_symbol}")
-        else:
-            self.__cursor += prefix_len
+        operator = match_operator(string, match.end())
+        if operator is None:
+            self.__cursor += match.end()
             return Token("MEMBER", "operator")
+        end, name, kind = operator
+        self.__cursor += end
+        return Token("OPERATOR", name, kind)
 
-    def _match(self, pattern: str | Pattern[str], string: str) -> Optional[str]:
+    def tokenize(self) -> TokenBuffer:
         """
-        Tries to match a regex pattern at the start of the input string.
+        Tokenizes the entire input string into a compact buffer of type codes and offsets.
+
+        Returns:
+            TokenBuffer: The tokens, in the order they appear.
+
+        Raises:
+            SyntaxError: If an unrecognized token is encountered.
+        """
+        string: str = self.string
+        buffer: TokenBuffer = TokenBuffer(string)
+        types_append = buffer.types.append
+        starts_append = buffer.starts.append
+        ends_append = buffer.ends.append
+        match = _MASTER_RE.match
+        length: int = len(string)
+        cursor: int = 0
+        while cursor < length:
+            matched: Optional[Match[str]] = match(string, cursor)
+            if matched is None:
+                self.__cursor = cursor
+                raise SyntaxError(f"Unexpected token '{string[cursor]}'")
+            start: int = cursor
+            cursor = end = matched.end()
+            code: int = matched.lastindex - 1  # type: ignore[operator]
+            if code == OPERATOR:
+                operator = match_operator(string, cursor)
+                if operator is None:
+                    code, end = MEMBER, start + len("operator")
+                else:
+                    cursor = end = operator[0]
+                    buffer.overrides[len(buffer.types)] = (operator[1], operator[2])
+            types_append(code)
+            starts_append(start)
+            ends_append(end)
+        self.__cursor = cursor
+        return buffer
+
+    def retokenize(self, previous: TokenBuffer, offset: int, removed: int, inserted: int) -> TokenBuffer:
+        """
+        Tokenizes the input string, the result of an edit of `previous.string`, reusing the
+        tokens of `previous` that the edit can't have changed.
+
+        Tokens are rescanned from the last one the edit may affect, and only until the scan
+        reaches the start of a token after the edit: from there on, the input is unchanged, so
+        the old tokens are kept, shifted by the change in length.
 
         Args:
-            pattern (str | Pattern[str]): The regex pattern to match.
-            string (str): The remaining string to match against.
+            previous (TokenBuffer): The tokens of the string before the edit.
+            offset (int): The position of the edit.
+            removed (int): The number of characters removed from the previous string at `offset`.
+            inserted (int): The number of characters inserted in their place.
 
         Returns:
-            Optional[str]: The matched string, or None if no match was found.
+            TokenBuffer: The tokens, the same as those of `tokenize`.
+
+        Raises:
+            SyntaxError: If an unrecognized token is encountered.
         """
-        matched: Optional[Match] = re.match(pattern, string)
-        if matched is not None:
-            token: str = matched[0]
-            self.__cursor += len(token)
-            return token
-        return None
+        string: str = self.string
+        old_types: array = previous.types
+        old_starts: array = previous.starts
+        old_ends: array = previous.ends
+        count: int = len(old_types)
+
+        # The first token that ends at or after the edit: it, or the character it was delimited
+        # by, may have changed. An operator reads past its end, up to the next token that is not
+        # whitespace, so the last one before the edit is rescanned too.
+        first: int = bisect_left(old_ends, offset)
+        last: int = first - 1
+        while last >= 0 and old_types[last] == WHITESPACE:
+            last -= 1
+        if last >= 0 and (old_types[last] == OPERATOR
+                          or (old_types[last] == MEMBER and previous.value(last) == "operator")):
+            first = last
+
+        buffer: TokenBuffer = TokenBuffer(string)
+        buffer.types = old_types[:first]
+        buffer.starts = old_starts[:first]
+        buffer.ends = old_ends[:first]
+        buffer.overrides = {index: value for index, value in previous.overrides.items() if index < first}
+
+        delta: int = inserted - removed
+        edit_end: int = offset + inserted
+        resync: int = bisect_left(old_starts, offset + removed)
+        match = _MASTER_RE.match
+        length: int = len(string)
+        cursor: int = old_starts[first] if first < count else 0
+        while cursor < length:
+            if cursor >= edit_end:
+                while resync < count and old_starts[resync] + delta < cursor:
+                    resync += 1
+                if resync < count and old_starts[resync] + delta == cursor:
+                    self._splice(buffer, previous, resync, delta)
+                    self.__cursor = length
+                    return buffer
+
+            matched: Optional[Match[str]] = match(string, cursor)
+            if matched is None:
+                self.__cursor = cursor
+                raise SyntaxError(f"Unexpected token '{string[cursor]}'")
+            start: int = cursor
+            cursor = end = matched.end()
+            code: int = matched.lastindex - 1  # type: ignore[operator]
+            if code == OPERATOR:
+                operator = match_operator(string, cursor)
+                if operator is None:
+                    code, end = MEMBER, start + len("operator")
+                else:
+                    cursor = end = operator[0]
+                    buffer.overrides[len(buffer.types)] = (operator[1], operator[2])
+            buffer.append(code, start, end)
+        self.__cursor = cursor
+        return buffer
+
+    @staticmethod
+    def _splice(buffer: TokenBuffer, previous: TokenBuffer, index: int, delta: int) -> None:
+        """
+        Appends the tokens of `previous` from `index` on to `buffer`, shifted by `delta`.
+        """
+        shift: int = len(buffer.types) - index
+        buffer.types.extend(previous.types[index:])
+        if delta:
+            buffer.starts.extend([start + delta for start in previous.starts[index:]])
+            buffer.ends.extend([end + delta for end in previous.ends[index:]])
+        else:
+            buffer.starts.extend(previous.starts[index:])
+            buffer.ends.extend(previous.ends[index:])
+        for old, value in previous.overrides.items():
+            if old >= index:
+                buffer.overrides[old + shift] = value
 
     def get_all_tokens(self) -> Iterator[Token]:
         """
@@ -143,17 +290,14 @@ class Tokenizer:
             Iterator[Token]: A generator of Token objects in the order they appear.
         """
         self.__cursor = 0
-        while token := self.get_next_token():
-            yield token
+        yield from self.tokenize()
 
 
 def _match_operator_symbol(string: str) -> Optional[str]:
     """
     Attempts to match a valid C++ operator symbol at the start of the given string.
 
-    The function checks whether the input string begins with any of the predefined C++
-    operator overload symbols (e.g., '==', '+', '[]', '->', etc.), prioritizing longer
-    matches first (e.g., '>>=' before '>').
+    The longest matching symbol wins (e.g., '>>=' before '>'), see `operators.match_symbol`.
 
     Args:
         string (str): The string to match against known operator symbols.
@@ -161,7 +305,5 @@ def _match_operator_symbol(string: str) -> Optional[str]:
     Returns:
         Optional[str]: The matched operator symbol if found, otherwise None.
     """
-    for op in SORTED_OPERATORS:
-        if string.startswith(op):
-            return op
-    return None
+    symbol: Optional[str] = match_symbol(string)
+    return symbol if symbol in OPERATOR_KINDS else None
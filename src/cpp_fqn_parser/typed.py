@@ -0,0 +1,354 @@
+import sys
+from array import array
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from .buffer import (TokenBuffer, TYPE_NAMES, OPERATOR, WHITESPACE, SCOPE, TEMPLATE_START, TEMPLATE_END,
+                     POINTER, REFERENCE, SEPARATOR, MEMBER)
+from .parser import Parser, ParseSpans
+
+_QUALIFIERS = frozenset(["const", "volatile"])
+
+
+@dataclass(frozen=True, slots=True)
+class TypeNode:
+    """
+    A parsed C++ type, such as a template argument, an argument or a return type.
+
+    Attributes:
+        name (str): The unqualified name, e.g. 'basic_string' or 'unsigned int'.
+        scopes (Tuple[TypeNode, ...]): The enclosing scopes, outermost first, e.g. 'std'.
+        template_args (Optional[Tuple[TypeNode, ...]]): The template arguments, or None if the
+            type is not a template.
+        constant (bool): Whether the type is const-qualified.
+        volatile (bool): Whether the type is volatile-qualified.
+        layers (Tuple[str, ...]): The pointer and reference layers applied to the type, innermost
+            first, with their own qualifiers, e.g. ('*', '* const', '&').
+
+    Private Attributes:
+        _hash (int): The hash of the node, computed once, as nodes are used as cache keys.
+    """
+    name: str
+    scopes: Tuple['TypeNode', ...] = ()
+    template_args: Optional[Tuple['TypeNode', ...]] = None
+    constant: bool = False
+    volatile: bool = False
+    layers: Tuple[str, ...] = ()
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.name, self.scopes, self.template_args,
+                                                self.constant, self.volatile, self.layers)))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __str__(self) -> str:
+        """
+        Formats the type the way c++filt does, e.g. 'std::vector<char const*, std::allocator<char> >'.
+        """
+        qualifiers: str = "".join([" const" if self.constant else "", " volatile" if self.volatile else ""])
+        text: str = "".join(f"{scope}::" for scope in self.scopes) + self.name
+        if self.template_args is not None:
+            template: str = ", ".join(str(arg) for arg in self.template_args)
+            text += f"<{template}{' ' if template.endswith('>') else ''}>"
+        return text + qualifiers + "".join(self.layers)
+
+
+class TypeCache:
+    """
+    Hash-conses TypeNode objects: equal nodes are replaced by a single shared instance, so
+    subtrees such as 'std::allocator<char>' are only kept once across all parsed symbols.
+
+    Attributes:
+        maxsize (Optional[int]): The maximum number of distinct nodes kept, or None for no limit.
+            Once full, new nodes are returned as they are, without being shared.
+
+    Private Attributes:
+        _nodes (Dict[TypeNode, TypeNode]): The shared instance of each node.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1 << 20) -> None:
+        """
+        Initializes an empty cache.
+
+        Args:
+            maxsize (Optional[int]): The maximum number of distinct nodes kept, or None for no limit.
+        """
+        self.maxsize: Optional[int] = maxsize
+        self._nodes: Dict[TypeNode, TypeNode] = {}
+
+    def intern(self, node: TypeNode) -> TypeNode:
+        """
+        Returns the shared instance of a node, adding it to the cache if there is room.
+
+        Args:
+            node (TypeNode): The node to look up.
+
+        Returns:
+            TypeNode: The shared node equal to `node`, or `node` itself.
+        """
+        shared: Optional[TypeNode] = self._nodes.get(node)
+        if shared is not None:
+            return shared
+        if self.maxsize is None or len(self._nodes) < self.maxsize:
+            self._nodes[node] = node
+        return node
+
+    def clear(self) -> None:
+        """
+        Empties the cache.
+        """
+        self._nodes.clear()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+@dataclass(frozen=True, slots=True)
+class TypedFQN:
+    """
+    A fully qualified name (FQN) whose types are parsed into TypeNode trees.
+
+    Attributes:
+        name (str): The unqualified name.
+        full_name (str): The original input string.
+        return_type (Optional[TypeNode]): The return type, if any.
+        args (Optional[Tuple[TypeNode, ...]]): The argument types, or None if there are none.
+        scopes (Optional[Tuple[TypeNode, ...]]): The enclosing scopes with their template
+            arguments, or None if there are none.
+        template (Optional[Tuple[TypeNode, ...]]): The template arguments of the symbol, if any.
+        constant (bool): Whether the symbol is const-qualified.
+        volatile (bool): Whether the symbol is volatile-qualified.
+    """
+    name: str
+    full_name: str
+    return_type: Optional[TypeNode]
+    args: Optional[Tuple[TypeNode, ...]]
+    scopes: Optional[Tuple[TypeNode, ...]]
+    template: Optional[Tuple[TypeNode, ...]]
+    constant: bool
+    volatile: bool
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Returns the attributes, with every TypeNode formatted as a string.
+        """
+        return {f.name: _format(getattr(self, f.name)) for f in fields(self)}
+
+
+def parse_typed(string: str, cache: Optional[TypeCache] = None) -> TypedFQN:
+    """
+    Parses a string representation of a fully qualified name (FQN), with its template
+    arguments, arguments, scopes and return type parsed into TypeNode trees.
+
+    The trees are built from the token ranges found by the parser's single reverse pass,
+    without tokenizing the components again.
+
+    Args:
+        string (str): The string to parse.
+        cache (Optional[TypeCache]): A cache sharing equal nodes across calls, if any.
+
+    Returns:
+        TypedFQN: The parsed FQN.
+
+    Raises:
+        SyntaxError: If the string, or one of its types, can't be parsed.
+    """
+    parser: Parser = Parser(string)
+    reader: _TypeReader = _TypeReader(parser.buffer, cache)
+    spans: ParseSpans = parser.scan()
+
+    args: Optional[Tuple[TypeNode, ...]] = None
+    if spans.args is not None and not (len(spans.args) == 1 and reader.is_blank(*spans.args[0])):
+        args = tuple(reader.read(lo, hi) for lo, hi in spans.args)
+
+    template: Optional[Tuple[TypeNode, ...]] = reader.read_template(*spans.template) if spans.template else None
+
+    name: str = sys.intern(reader.buffer.value(spans.name))
+
+    scopes: Optional[Tuple[TypeNode, ...]] = None
+    if spans.scopes is not None:
+        scopes = tuple(reader.node(sys.intern(reader.buffer.value(index)),
+                                   template_args=reader.read_template(*tpl) if tpl else None)
+                       for index, tpl in spans.scopes)
+
+    return_type: Optional[TypeNode] = reader.read(0, spans.return_type) if spans.return_type is not None else None
+
+    return TypedFQN(name=name,
+                    full_name=string,
+                    return_type=return_type,
+                    args=args,
+                    scopes=scopes,
+                    template=template,
+                    constant=spans.constant,
+                    volatile=spans.volatile)
+
+
+class _TypeReader:
+    """
+    Reads TypeNode trees forwards from token ranges of a TokenBuffer.
+
+    Attributes:
+        buffer (TokenBuffer): The tokens.
+        cache (Optional[TypeCache]): The cache interning the nodes, if any.
+
+    Private Attributes:
+        _pos (int): The index of the current token.
+        _end (int): The end of the token range being read.
+    """
+
+    def __init__(self, buffer: TokenBuffer, cache: Optional[TypeCache]) -> None:
+        self.buffer: TokenBuffer = buffer
+        self.cache: Optional[TypeCache] = cache
+        self._types: array = buffer.types
+        self._pos: int = 0
+        self._end: int = 0
+
+    def node(self, name: str, **attributes: Any) -> TypeNode:
+        """
+        Builds a node, interned if there is a cache.
+        """
+        node: TypeNode = TypeNode(name, **attributes)
+        return self.cache.intern(node) if self.cache is not None else node
+
+    def is_blank(self, lo: int, hi: int) -> bool:
+        """
+        Checks whether the token range `[lo, hi)` only holds whitespace.
+        """
+        return all(self._types[i] == WHITESPACE for i in range(lo, hi))
+
+    def read(self, lo: int, hi: int) -> TypeNode:
+        """
+        Reads the type spanning the whole token range `[lo, hi)`.
+
+        Raises:
+            SyntaxError: If the range doesn't hold exactly one type.
+        """
+        self._pos, self._end = lo, hi
+        node: TypeNode = self._type()
+        self._skip_whitespace()
+        if self._pos < hi:
+            self._unexpected()
+        return node
+
+    def read_template(self, lo: int, hi: int) -> Tuple[TypeNode, ...]:
+        """
+        Reads the template arguments between the '<' token `lo` and the '>' token `hi`.
+        """
+        self._pos, self._end = lo, hi + 1
+        return self._list(TEMPLATE_START, TEMPLATE_END)
+
+    def _type(self) -> TypeNode:
+        self._skip_whitespace()
+        constant, volatile = self._qualifiers()
+
+        scopes: List[TypeNode] = []
+        words: List[str] = []
+        template_args: Optional[Tuple[TypeNode, ...]] = None
+        while True:
+            if self._peek() not in (MEMBER, OPERATOR):
+                self._unexpected()
+            words.append(self.buffer.value(self._pos))
+            self._pos += 1
+            if self._peek() == TEMPLATE_START:
+                template_args = self._list(TEMPLATE_START, TEMPLATE_END)
+            if self._peek() == SCOPE:
+                self._pos += 1
+                scopes.append(self.node(sys.intern(" ".join(words)), template_args=template_args))
+                words, template_args = [], None
+                continue
+            self._skip_whitespace()
+            # Multi-word names such as 'unsigned long'.
+            if (template_args is None and self._peek() == MEMBER
+                    and self.buffer.value(self._pos) not in _QUALIFIERS):
+                continue
+            break
+
+        suffix_constant, suffix_volatile = self._qualifiers()
+        return self.node(sys.intern(" ".join(words)),
+                         scopes=tuple(scopes),
+                         template_args=template_args,
+                         constant=constant or suffix_constant,
+                         volatile=volatile or suffix_volatile,
+                         layers=self._layers())
+
+    def _list(self, open_code: int, close_code: int) -> Tuple[TypeNode, ...]:
+        """
+        Reads a delimited, comma-separated list of types, such as '<int, char>' or '()'.
+        """
+        self._expect(open_code)
+        self._skip_whitespace()
+        items: List[TypeNode] = []
+        if self._peek() == close_code:
+            self._pos += 1
+            return ()
+        while True:
+            items.append(self._type())
+            self._skip_whitespace()
+            if self._peek() == SEPARATOR:
+                self._pos += 1
+                continue
+            self._expect(close_code)
+            return tuple(items)
+
+    def _qualifiers(self) -> Tuple[bool, bool]:
+        """
+        Reads any 'const' and 'volatile' keywords.
+        """
+        constant: bool = False
+        volatile: bool = False
+        while self._peek() == MEMBER and self.buffer.value(self._pos) in _QUALIFIERS:
+            if self.buffer.value(self._pos) == "const":
+                constant = True
+            else:
+                volatile = True
+            self._pos += 1
+            self._skip_whitespace()
+        return constant, volatile
+
+    def _layers(self) -> Tuple[str, ...]:
+        """
+        Reads pointer and reference layers with their qualifiers, e.g. '* const &'.
+        """
+        layers: List[str] = []
+        while self._peek() in (POINTER, REFERENCE):
+            layer: str = "*" if self._peek() == POINTER else "&"
+            self._pos += 1
+            if layer == "&" and self._peek() == REFERENCE:
+                layer = "&&"
+                self._pos += 1
+            self._skip_whitespace()
+            constant, volatile = self._qualifiers()
+            layers.append(layer + (" const" if constant else "") + (" volatile" if volatile else ""))
+        return tuple(layers)
+
+    def _peek(self) -> int:
+        """
+        Returns the type code of the current token, or -1 at the end of the range.
+        """
+        return self._types[self._pos] if self._pos < self._end else -1
+
+    def _expect(self, code: int) -> None:
+        if self._peek() != code:
+            self._unexpected(TYPE_NAMES[code])
+        self._pos += 1
+
+    def _skip_whitespace(self) -> None:
+        while self._peek() == WHITESPACE:
+            self._pos += 1
+
+    def _unexpected(self, expected: str = "a type") -> None:
+        found: str = self.buffer.value(self._pos) if self._pos < self._end else "end of type"
+        raise SyntaxError(f"Expected {expected}, but found '{found}'")
+
+
+def _format(value: object) -> object:
+    """
+    Formats the TypeNode objects of a TypedFQN attribute as strings.
+    """
+    if isinstance(value, tuple):
+        return [_format(item) for item in value]
+    if isinstance(value, TypeNode):
+        return str(value)
+    return value
@@ -1,3 +1,4 @@
+from dataclasses import fields, is_dataclass
 from typing import Dict, Any, List, Mapping
 
 
@@ -5,10 +6,10 @@ def to_dict(obj: Any) -> Dict[str, Any]:
     """
     Recursively converts an object and its attributes into a dictionary.
 
-    This function inspects the given object and returns a dictionary of its attributes.
-    If any attribute is:
+    This function inspects the given object (its dataclass fields, or `vars()` otherwise) and
+    returns a dictionary of its attributes. If any attribute is:
     - An object with a `to_dict()` method, it calls that method.
-    - A list, it recursively serializes each item.
+    - A list or tuple, it recursively serializes each item into a list.
     - A dict, it recursively serializes each value.
     - A primitive type (str, int, float, etc.), it leaves it unchanged.
 
@@ -23,13 +24,15 @@ def to_dict(obj: Any) -> Dict[str, Any]:
     def serialize(inner_obj):
         if hasattr(inner_obj, "to_dict"):
             return inner_obj.to_dict()
-        elif isinstance(inner_obj, list):
+        elif isinstance(inner_obj, (list, tuple)):
             return [serialize(item) for item in inner_obj]
         elif isinstance(inner_obj, dict):
             return {k: serialize(v) for k, v in inner_obj.items()}
         else:
             return inner_obj
 
+    if is_dataclass(obj):
+        return {field.name: serialize(getattr(obj, field.name)) for field in fields(obj)}
     return {k: serialize(v) for k, v in vars(obj).items()}
 
 
@@ -0,0 +1,136 @@
+import re
+from array import array
+from typing import Iterable, Iterator, Pattern
+
+from .buffer import (TokenBuffer, OPERATOR, WHITESPACE, SCOPE, TEMPLATE_START, TEMPLATE_END,
+                     PARENTHESIS_START, PARENTHESIS_END, MEMBER)
+from .tokenizer import Tokenizer
+
+# Every token but operators, see `tokenizer._SPEC`. A string without the 'operator' keyword can
+# be tokenized if and only if it is a sequence of these. Runs of whitespace and names must be
+# maximal, so that a failed match doesn't backtrack through every way of splitting them.
+_TOKENS_RE: Pattern[str] = re.compile(r"(?:\s+(?!\s)|::|[<>()*&,]|[a-zA-Z_]\w*(?!\w))*")
+
+# Without operators, a string ending in a name must end in a qualifier after whitespace.
+_TRAILING_QUALIFIER_RE: Pattern[str] = re.compile(r"\s(?:const|volatile)\Z")
+
+_QUALIFIERS = frozenset(["const", "volatile"])
+
+
+def is_fqn(string: str) -> bool:
+    """
+    Checks whether a string can be parsed as an FQN, without parsing it.
+
+    The result is the same as whether `Parser(string).parse()` succeeds, but no FQN, Scope or
+    substring is built and no error message is formatted. Strings with characters that can't
+    start a token, or ending in a name (such as data symbols), are rejected by regex matches
+    before tokenizing.
+
+    Args:
+        string (str): The string to check.
+
+    Returns:
+        bool: True if the string is a valid FQN.
+    """
+    if "operator" not in string:
+        if _TOKENS_RE.fullmatch(string) is None:
+            return False
+        last: str = string[-1:]
+        if (last.isalnum() or last == "_") and _TRAILING_QUALIFIER_RE.search(string) is None:
+            return False
+    try:
+        buffer: TokenBuffer = Tokenizer(string).tokenize()
+    except SyntaxError:
+        return False
+    return _is_valid_sequence(buffer)
+
+
+def filter_fqns(strings: Iterable[str], invert: bool = False) -> Iterator[str]:
+    """
+    Lazily filters the strings that can be parsed as an FQN, see `is_fqn`.
+
+    Args:
+        strings (Iterable[str]): The strings to check.
+        invert (bool): Whether to yield the strings that can't be parsed instead.
+
+    Yields:
+        Iterator[str]: The strings that passed the check.
+    """
+    for string in strings:
+        if is_fqn(string) is not invert:
+            yield string
+
+
+def _is_valid_sequence(buffer: TokenBuffer) -> bool:
+    """
+    Checks a token sequence the way `Parser.parse` consumes it: from the end, through the
+    qualifiers, arguments, template, name and scopes. Anything left is the return type.
+    """
+    types: array = buffer.types
+    i: int = len(types) - 1
+
+    if i >= 0 and types[i] == MEMBER:
+        if buffer.value(i) not in _QUALIFIERS:
+            return False
+        i -= 1
+        if i < 0 or types[i] != WHITESPACE:
+            return False
+        i -= 1
+        if i >= 0 and types[i] == MEMBER:
+            i -= 1
+            if i < 0 or types[i] != WHITESPACE:
+                return False
+            i -= 1
+
+    if i >= 0 and types[i] == PARENTHESIS_END:
+        i -= 1
+        while i >= 0 and types[i] != PARENTHESIS_START:
+            i -= 1
+        if i < 0:
+            return False
+        i -= 1
+
+    if i >= 0 and types[i] == WHITESPACE:
+        i -= 1
+    if i >= 0 and types[i] == TEMPLATE_END:
+        i = _skip_template(types, i)
+
+    if i >= 0 and types[i] == WHITESPACE:
+        i -= 1
+    if i < 0 or (types[i] != MEMBER and types[i] != OPERATOR):
+        return False
+    i -= 1
+
+    if i >= 0 and types[i] == SCOPE:
+        while i >= 0 and types[i] != WHITESPACE:
+            if types[i] != SCOPE:
+                return False
+            i -= 1
+            if i >= 0 and types[i] == TEMPLATE_END:
+                i = _skip_template(types, i)
+            if i < 0 or types[i] != MEMBER:
+                return False
+            i -= 1
+
+    return True
+
+
+def _skip_template(types: array, i: int) -> int:
+    """
+    Skips backwards over the possibly nested template closed by the '>' at `i`.
+
+    Returns:
+        int: The index before its opening '<', or -2 if it is never opened, so that every
+            following check fails.
+    """
+    depth: int = 0
+    while i >= 0:
+        code: int = types[i]
+        if code == TEMPLATE_END:
+            depth += 1
+        elif code == TEMPLATE_START:
+            depth -= 1
+            if depth == 0:
+                return i - 1
+        i -= 1
+    return -2
@@ -1,12 +1,30 @@
 from pathlib import Path
+from typing import List
 import json
 
+import pytest
 from _pytest.python import Metafunc
 
 
+def _load_fqns() -> List[dict]:
+    path: Path = Path(__file__).parent.parent / "test_data" / "fqns.json"
+    with path.open() as f:
+        return json.load(f)
+
+
+def _load_mangled() -> List[dict]:
+    path: Path = Path(__file__).parent.parent / "test_data" / "mangled.json"
+    with path.open() as f:
+        return json.load(f)
+
+
 def pytest_generate_tests(metafunc: Metafunc) -> None:
     if "fqn_dict" in metafunc.fixturenames:
-        path: Path = Path(__file__).parent.parent / "test_data" / "fqns.json"
-        with path.open() as f:
-            fqns = json.load(f)
-        metafunc.parametrize("fqn_dict", fqns)
+        metafunc.parametrize("fqn_dict", _load_fqns())
+    if "mangled_dict" in metafunc.fixturenames:
+        metafunc.parametrize("mangled_dict", _load_mangled())
+
+
+@pytest.fixture
+def fqn_dicts() -> List[dict]:
+    return _load_fqns()
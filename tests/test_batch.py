@@ -0,0 +1,44 @@
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import parse_many, FQN
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_ordered(fqn_dicts: List[dict], workers: int):
+    strings: List[str] = [fqn_dict["fqn"] for fqn_dict in fqn_dicts] * 3
+    expected: List[FQN] = [FQN.from_dict(fqn_dict["parser"]) for fqn_dict in fqn_dicts] * 3
+    assert list(parse_many(strings, workers=workers, chunksize=2)) == expected
+
+
+def test_parse_many_unordered(fqn_dicts: List[dict]):
+    strings: List[str] = [fqn_dict["fqn"] for fqn_dict in fqn_dicts]
+    result = list(parse_many(strings, workers=2, chunksize=3, ordered=False))
+    assert sorted(fqn.full_name for fqn in result) == sorted(strings)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_errors(workers: int):
+    strings: List[str] = ["one::two()", "one::two() &&", "three()"]
+
+    with pytest.raises(SyntaxError):
+        list(parse_many(strings, workers=workers, chunksize=1))
+
+    skipped = list(parse_many(strings, workers=workers, chunksize=1, errors="skip"))
+    assert [fqn.name for fqn in skipped] == ["two", "three"]
+
+    returned = list(parse_many(strings, workers=workers, chunksize=1, errors="return"))
+    assert isinstance(returned[1], SyntaxError)
+    assert [result.name for result in returned if isinstance(result, FQN)] == ["two", "three"]
+
+
+def test_parse_many_unknown_policy():
+    with pytest.raises(ValueError):
+        parse_many([], errors="ignore")
+
+
+def test_parse_many_threads(fqn_dicts: List[dict]):
+    strings: List[str] = [fqn_dict["fqn"] for fqn_dict in fqn_dicts] * 20
+    expected: List[FQN] = [FQN.from_dict(fqn_dict["parser"]) for fqn_dict in fqn_dicts] * 20
+    assert list(parse_many(strings, workers=4, chunksize=3, threads=True)) == expected
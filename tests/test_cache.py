@@ -0,0 +1,37 @@
+import pytest
+
+from src.cpp_fqn_parser import ParseCache, Parser, parse, FQN
+
+
+def test_parse_cache_hits_and_evictions():
+    cache: ParseCache = ParseCache(maxsize=2)
+    parse("one::two()", cache)
+    parse("one::two()", cache)
+    parse("one::three()", cache)
+    parse("one::four()", cache)
+
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 3, 1, 2)
+    assert "one::two()" not in cache
+    assert "one::four()" in cache
+
+
+def test_parse_cache_results_are_shared():
+    string: str = "int one::two<three>::four(const five &) const"
+    cache: ParseCache = ParseCache()
+    first: FQN = cache.parse(string)
+
+    assert cache.parse(string) is first
+    assert first == Parser(string).parse()
+
+
+def test_parse_cache_does_not_store_failures():
+    cache: ParseCache = ParseCache()
+    with pytest.raises(SyntaxError):
+        cache.parse("one::two() &&")
+    assert len(cache) == 0
+
+
+def test_parse_cache_invalid_size():
+    with pytest.raises(ValueError):
+        ParseCache(maxsize=0)
@@ -0,0 +1,51 @@
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import (Parser, FQN, normalize_type, canonical_name, canonicalize, canonical_key,
+                                scope_key, unique_fqns)
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("const four &", "const four&"),
+    ("four const&", "const four&"),
+    ("four * const", "four* const"),
+    ("char const * const *", "const char* const*"),
+    ("volatile const unsigned int", "const volatile unsigned int"),
+    ("std::vector< int > const &", "const std::vector<int>&"),
+    ("std::map<four const&,std::vector<int> >", "std::map<const four&, std::vector<int>>"),
+])
+def test_normalize_type(text: str, expected: str):
+    assert normalize_type(text) == expected
+
+
+def test_canonical_form_is_stable(fqn_dict: dict):
+    fqn: FQN = Parser(fqn_dict["fqn"]).parse()
+    canonical: FQN = canonicalize(fqn)
+    assert canonical.full_name == canonical_name(fqn)
+    assert canonicalize(canonical) == canonical
+    assert canonical_key(canonical) == canonical_key(fqn)
+
+
+def test_equivalent_spellings_share_keys():
+    spellings: List[FQN] = [Parser(string).parse() for string in [
+        "int one::two< three >::four(const five &, six *) const",
+        "int one::two<three>::four(five const&, six*) const",
+    ]]
+    other: FQN = Parser("int one::two<three>::four(five const&, six* const) const").parse()
+
+    assert spellings[0] != spellings[1]
+    assert canonicalize(spellings[0]) == canonicalize(spellings[1])
+    assert canonical_key(spellings[0], bits=128) == canonical_key(spellings[1], bits=128)
+    assert canonical_key(other) != canonical_key(spellings[0])
+    assert scope_key(other.scopes) == scope_key(spellings[0].scopes)
+    assert list(unique_fqns(spellings + [other])) == [spellings[0], other]
+
+
+def test_canonical_key_is_stable_across_runs():
+    assert canonical_key(Parser("one::two()").parse()) == 0x646855f2facd8a09
+
+
+def test_canonical_key_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        canonical_key(Parser("one::two()").parse(), bits=32)
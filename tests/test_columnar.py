@@ -0,0 +1,63 @@
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import parse_columns, SymbolColumns, Parser
+
+STRINGS: List[str] = ["int one::two<three>::four(const five &, six) const",
+                      "one::four()",
+                      "void seven()"]
+
+
+def test_columns_match_parser(fqn_dicts: List[dict]):
+    strings: List[str] = [fqn_dict["fqn"] for fqn_dict in fqn_dicts]
+    columns: SymbolColumns = parse_columns(strings)
+    assert len(columns) == len(strings)
+    assert [columns.row(i) for i in range(len(columns))] == [Parser(string).parse() for string in strings]
+
+
+def test_columns_are_dictionary_encoded():
+    columns: SymbolColumns = parse_columns(STRINGS)
+    assert list(columns.name) == [0, 0, 1]
+    assert columns.dictionaries["name"] == ["four", "seven"]
+    assert list(columns.template) == [-1, -1, -1]
+    assert list(columns.arg_count) == [2, 0, 0]
+    assert list(columns.arg_offsets) == [0, 2, 2, 2]
+    assert list(columns.scope_offsets) == [0, 2, 3, 3]
+    assert columns.dictionaries["scopes"] == ["one", "two<three>"]
+    assert columns.dictionaries["scope_path"] == ["one::two<three>", "one"]
+    assert list(columns.constant) == [1, 0, 0]
+
+
+def test_parse_columns_errors():
+    with pytest.raises(SyntaxError):
+        parse_columns(["one::two() &&"])
+    columns: SymbolColumns = parse_columns(["one::two() &&", "three()"], errors="skip")
+    assert (len(columns), columns.failures) == (1, 1)
+    with pytest.raises(ValueError):
+        parse_columns([], errors="return")
+
+
+def test_skipped_strings_leave_no_dictionary_entries():
+    columns: SymbolColumns = parse_columns(["<two>(four)", "x::<five>::six(seven)"], errors="skip")
+    assert columns.failures == 2
+    assert not any(columns.dictionaries.values())
+
+
+def test_columns_to_numpy():
+    np = pytest.importorskip("numpy")
+    arrays = parse_columns(STRINGS).to_numpy()
+    assert arrays["arg_count"].dtype == np.int32
+    assert arrays["constant"].tolist() == [True, False, False]
+    assert arrays["args_values"][arrays["args"]].tolist() == ["const five &", " six"]
+
+
+def test_columns_to_arrow():
+    pytest.importorskip("pyarrow")
+    table = parse_columns(STRINGS).to_arrow()
+    rows = table.to_pylist()
+    assert rows[0]["args"] == ["const five &", " six"]
+    assert rows[1]["args"] is None
+    assert rows[1]["scopes"] == ["one"]
+    assert rows[2]["scope_path"] is None
+    assert [row["return_type"] for row in rows] == ["int", None, "void"]
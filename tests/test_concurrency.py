@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from typing import List
+
+from src.cpp_fqn_parser import Parser, ParseCache, ScopePool, FQN
+
+THREADS: int = 8
+
+
+def _run_concurrently(strings: List[str], parse) -> List[List[FQN]]:
+    """
+    Parses `strings` in every thread at once, released together by a barrier.
+    """
+    barrier: Barrier = Barrier(THREADS)
+
+    def work(_: int) -> List[FQN]:
+        barrier.wait()
+        return [parse(string) for string in strings]
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return list(executor.map(work, range(THREADS)))
+
+
+def test_reusable_parser(fqn_dicts: List[dict]):
+    parser: Parser = Parser()
+    for fqn_dict in fqn_dicts:
+        assert parser.parse(fqn_dict["fqn"]) == FQN.from_dict(fqn_dict["parser"])
+        assert parser.parse(fqn_dict["fqn"]) == FQN.from_dict(fqn_dict["parser"])
+
+
+def test_shared_parser_across_threads(fqn_dicts: List[dict]):
+    strings: List[str] = [fqn_dict["fqn"] for fqn_dict in fqn_dicts] * 50
+    expected: List[FQN] = [FQN.from_dict(fqn_dict["parser"]) for fqn_dict in fqn_dicts] * 50
+    parser: Parser = Parser(pool=ScopePool())
+
+    for results in _run_concurrently(strings, parser.parse):
+        assert results == expected
+
+
+def test_shared_pool_and_cache_across_threads(fqn_dicts: List[dict]):
+    strings: List[str] = [fqn_dict["fqn"] for fqn_dict in fqn_dicts] * 50
+    pool: ScopePool = ScopePool()
+    cache: ParseCache = ParseCache(maxsize=4, pool=pool)
+
+    runs: List[List[FQN]] = _run_concurrently(strings, cache.parse)
+    first: List[FQN] = runs[0]
+    for results in runs[1:]:
+        assert results == first
+        assert all(a.scopes is b.scopes for a, b in zip(results, first))
@@ -0,0 +1,63 @@
+from typing import List, Tuple
+
+import pytest
+
+from src.cpp_fqn_parser import diff_symbols, SymbolChange, Parser, FQN
+
+OLD: List[str] = [
+    "void one::kept(int)",
+    "void one::removed(int)",
+    "void one::two::changed(int)",
+    "int one::qualified() const",
+    "void one::overload(int)",
+    "void one::overload(char)",
+]
+
+NEW: List[str] = [
+    "void one::kept(int)",
+    "void one::added(int)",
+    "void one::two::changed(long)",
+    "int one::qualified() const volatile",
+    "void one::overload(int)",
+    "void one::overload(char, int)",
+    "void one::overload(float)",
+]
+
+
+def _parse(strings: List[str]) -> List[FQN]:
+    return [Parser(string).parse() for string in strings]
+
+
+def _summary(changes: List[SymbolChange]) -> List[Tuple[str, str]]:
+    return sorted((change.kind, change.fqn.full_name) for change in changes)
+
+
+EXPECTED: List[Tuple[str, str]] = [
+    ("added", "void one::added(int)"),
+    ("added", "void one::overload(char, int)"),
+    ("added", "void one::overload(float)"),
+    ("qualifier_changed", "int one::qualified() const volatile"),
+    ("removed", "void one::overload(char)"),
+    ("removed", "void one::removed(int)"),
+    ("signature_changed", "void one::two::changed(long)"),
+]
+
+
+@pytest.mark.parametrize("partitions", [1, 3])
+def test_diff_symbols(partitions: int, tmp_path):
+    changes: List[SymbolChange] = list(diff_symbols(_parse(OLD), _parse(NEW), partitions, str(tmp_path)))
+    assert _summary(changes) == EXPECTED
+    changed = next(change for change in changes if change.kind == "signature_changed")
+    assert changed.old == Parser("void one::two::changed(int)").parse()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_diff_identical_sets(fqn_dicts: List[dict]):
+    fqns: List[FQN] = _parse([fqn_dict["fqn"] for fqn_dict in fqn_dicts])
+    assert list(diff_symbols(fqns, reversed(fqns))) == []
+    assert {change.kind for change in diff_symbols(fqns, [])} == {"removed"}
+
+
+def test_diff_symbols_rejects_bad_partitions():
+    with pytest.raises(ValueError):
+        diff_symbols([], [], partitions=0)
@@ -0,0 +1,45 @@
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from src.cpp_fqn_parser import Parser, FQN
+
+
+def test_fqn_dict_round_trip(fqn_dict: dict):
+    result: FQN = Parser(fqn_dict["fqn"]).parse()
+    assert result.to_dict() == fqn_dict["parser"]
+    assert FQN.from_dict(result.to_dict()) == result
+
+
+def test_fqn_is_hashable(fqn_dicts: list):
+    parsed = [Parser(fqn_dict["fqn"]).parse() for fqn_dict in fqn_dicts]
+    reparsed = {Parser(fqn_dict["fqn"]).parse(): fqn_dict for fqn_dict in fqn_dicts}
+    assert all(fqn in reparsed for fqn in parsed)
+
+
+def test_fqn_is_frozen():
+    result: FQN = Parser("one::two(three)").parse()
+    with pytest.raises(FrozenInstanceError):
+        result.name = "four"  # type: ignore[misc]
+    assert result.scopes is not None
+    with pytest.raises(FrozenInstanceError):
+        result.scopes[0].name = "four"  # type: ignore[misc]
+
+
+def test_fqn_tuple_and_json_round_trip(fqn_dict: dict):
+    result: FQN = Parser(fqn_dict["fqn"]).parse()
+    assert FQN.from_tuple(result.to_tuple()) == result
+    assert FQN.from_json(result.to_json()) == result
+
+
+def test_fqn_from_dict_without_scopes():
+    result: FQN = Parser("three()").parse()
+    assert result.scopes is None
+    assert FQN.from_dict(result.to_dict()) == result
+
+
+def test_fqn_from_dict_missing_key():
+    data: dict = Parser("one::two()").parse().to_dict()
+    del data["template"]
+    with pytest.raises(KeyError, match="Missing key 'template'"):
+        FQN.from_dict(data)
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src import cpp_fqn_parser
+
+SRC: Path = Path(__file__).parent.parent / "src"
+
+# Cold-start budget, in seconds, for importing the package and parsing one symbol.
+IMPORT_BUDGET: float = 0.12
+
+# Modules that parsing a single symbol must not import.
+HEAVY_MODULES: List[str] = ["asyncio", "concurrent.futures", "multiprocessing", "sqlite3", "json", "gzip", "csv",
+                            "cpp_fqn_parser.mangled", "cpp_fqn_parser.service", "cpp_fqn_parser.batch"]
+
+SCRIPT: str = """
+import sys
+from time import perf_counter
+start = perf_counter()
+import cpp_fqn_parser
+cpp_fqn_parser.parse("int one::two<three>::four(const five &) const")
+elapsed = perf_counter() - start
+print(elapsed)
+print(" ".join(sorted(name for name in {heavy!r} if name in sys.modules)))
+"""
+
+
+def _run() -> List[str]:
+    output: str = subprocess.run([sys.executable, "-c", SCRIPT.format(heavy=HEAVY_MODULES)], cwd=SRC,
+                                 capture_output=True, text=True, check=True).stdout
+    return output.split("\n")
+
+
+def test_single_parse_imports_stay_within_budget():
+    runs: List[List[str]] = [_run() for _ in range(3)]
+    assert min(float(run[0]) for run in runs) < IMPORT_BUDGET
+    assert runs[0][1] == ""
+
+
+def test_public_names_are_loaded_lazily():
+    assert set(cpp_fqn_parser.__all__) <= set(dir(cpp_fqn_parser))
+    for name in cpp_fqn_parser.__all__:
+        assert getattr(cpp_fqn_parser, name) is vars(cpp_fqn_parser)[name]
+    with pytest.raises(AttributeError):
+        cpp_fqn_parser.missing  # type: ignore[attr-defined]
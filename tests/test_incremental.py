@@ -0,0 +1,70 @@
+import random
+from typing import List, Optional
+
+import pytest
+
+from src.cpp_fqn_parser import IncrementalParse, Parser, Tokenizer, FQN
+
+PIECES: List[str] = ["x", "::", "<", ">", "(", ")", " ", ",", "operator", "int", "&", "*", "const", ""]
+
+
+def _fresh(string: str) -> Optional[FQN]:
+    try:
+        return Parser(string).parse()
+    except SyntaxError:
+        return None
+
+
+def test_retokenize_matches_tokenize(fqn_dict: dict):
+    string: str = fqn_dict["fqn"]
+    previous = Tokenizer(string).tokenize()
+    rng = random.Random(string)
+    for _ in range(200):
+        offset: int = rng.randint(0, len(string))
+        removed: int = rng.randint(0, min(3, len(string) - offset))
+        inserted: str = rng.choice(PIECES)
+        edited: str = string[:offset] + inserted + string[offset + removed:]
+        try:
+            expected = Tokenizer(edited).tokenize()
+        except SyntaxError:
+            with pytest.raises(SyntaxError):
+                Tokenizer(edited).retokenize(previous, offset, removed, len(inserted))
+            continue
+        result = Tokenizer(edited).retokenize(previous, offset, removed, len(inserted))
+        assert (result.types, result.starts, result.ends, result.overrides) == \
+               (expected.types, expected.starts, expected.ends, expected.overrides)
+
+
+def test_incremental_parse_matches_parser(fqn_dict: dict):
+    rng = random.Random(fqn_dict["fqn"])
+    for _ in range(50):
+        current: IncrementalParse = IncrementalParse(fqn_dict["fqn"])
+        for _ in range(5):
+            offset: int = rng.randint(0, len(current.string))
+            removed: int = rng.randint(0, min(3, len(current.string) - offset))
+            inserted: str = rng.choice(PIECES)
+            edited: str = current.string[:offset] + inserted + current.string[offset + removed:]
+            expected: Optional[FQN] = _fresh(edited)
+            if expected is None:
+                with pytest.raises(SyntaxError):
+                    current.edit(offset, removed, inserted)
+                break
+            current = current.edit(offset, removed, inserted)
+            assert current.fqn == expected
+            assert current.fqn.full_name == edited
+
+
+def test_incremental_parse_reuses_components():
+    string: str = "int one<two>::three<four>::five(const six &, seven) const"
+    previous: IncrementalParse = IncrementalParse(string)
+    offset: int = string.index("seven")
+    edited: IncrementalParse = previous.edit(offset, len("seven"), "eight")
+
+    assert edited.fqn.args == ("const six &", " eight")
+    assert edited.fqn.args[0] is previous.fqn.args[0]
+    assert edited.fqn.scopes is previous.fqn.scopes
+
+
+def test_incremental_parse_invalid_edit():
+    with pytest.raises(ValueError):
+        IncrementalParse("one::two()").edit(8, 5, "")
@@ -0,0 +1,68 @@
+from pathlib import Path
+from typing import List
+
+from src.cpp_fqn_parser import FQNIndex, Parser, FQN, Scope
+from src.cpp_fqn_parser.index import parse_scope_path
+
+SYMBOLS: List[str] = [
+    "ns::Foo<T>::bar(int)",
+    "ns::Foo<T>::bar(int, int) const",
+    "ns::Foo<T>::operator==(const ns::Foo<T> &)",
+    "ns::Foo<U>::operator==(const ns::Foo<U> &)",
+    "ns::inner::baz<int>()",
+    "bool other::operator==(const other::X &, const other::X &)",
+    "free()",
+]
+
+
+def make_index() -> FQNIndex:
+    return FQNIndex(Parser(symbol).parse() for symbol in SYMBOLS)
+
+
+def names(fqns: List[FQN]) -> List[str]:
+    return [fqn.full_name for fqn in fqns]
+
+
+def test_index_queries():
+    index: FQNIndex = make_index()
+    assert len(index) == len(SYMBOLS)
+    assert names(index.in_scope("ns::Foo<T>")) == SYMBOLS[:3]
+    assert names(index.in_scope("ns", recursive=True)) == SYMBOLS[:5]
+    assert names(index.in_scope([])) == SYMBOLS[6:]
+    assert names(index.by_name("operator==")) == [SYMBOLS[2], SYMBOLS[3], SYMBOLS[5]]
+    assert names(index.by_template("<int>")) == [SYMBOLS[4]]
+    assert names(index.by_arity(2)) == [SYMBOLS[1], SYMBOLS[5]]
+    assert names(index.find(name="bar", scope="ns::Foo<T>", arity=1)) == [SYMBOLS[0]]
+    assert names(index.find(scope="ns", recursive=True, template=None)) == SYMBOLS[:4]
+    assert index.in_scope("missing::scope") == []
+
+
+def test_index_insert_delete():
+    index: FQNIndex = make_index()
+    fqn: FQN = Parser(SYMBOLS[4]).parse()
+    assert fqn in index
+    assert index.discard(fqn)
+    assert not index.discard(fqn)
+    assert fqn not in index
+    assert index.by_template("<int>") == []
+    assert index.in_scope("ns::inner") == []
+
+    index.add(fqn)
+    index.add(fqn)
+    assert len(index) == len(SYMBOLS)
+    assert index.in_scope("ns::inner") == [fqn]
+
+
+def test_index_save_load(tmp_path: Path):
+    index: FQNIndex = make_index()
+    path: Path = tmp_path / "index.txt"
+    index.save(str(path))
+    loaded: FQNIndex = FQNIndex.load(str(path))
+    assert list(loaded) == list(index)
+    assert loaded.by_name("bar") == index.by_name("bar")
+
+
+def test_parse_scope_path():
+    assert parse_scope_path("a::b<std::pair<int, int> >::c") == (
+        Scope("a"), Scope("b", "<std::pair<int, int> >"), Scope("c"))
+    assert parse_scope_path("") == ()
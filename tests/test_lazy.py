@@ -0,0 +1,23 @@
+import pytest
+
+from src.cpp_fqn_parser import LazyFQN, FQN
+
+
+def test_lazy_fqn(fqn_dict: dict):
+    expected: FQN = FQN.from_dict(fqn_dict["parser"])
+    lazy: LazyFQN = LazyFQN(fqn_dict["fqn"])
+    assert lazy.scopes == expected.scopes
+    assert lazy.to_fqn() == expected
+    assert lazy == expected
+
+
+def test_lazy_fqn_parses_on_demand():
+    lazy: LazyFQN = LazyFQN("int one::::two(three) const")
+    assert lazy.name == "two"
+    assert lazy.args == ("three",)
+    assert lazy.constant
+
+    with pytest.raises(SyntaxError):
+        lazy.scopes
+    with pytest.raises(SyntaxError):
+        lazy.return_type
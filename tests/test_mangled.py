@@ -0,0 +1,41 @@
+import io
+
+import pytest
+
+from src.cpp_fqn_parser import Parser, FQN, parse_mangled, parse_many, parse_stream
+
+
+def test_parse_mangled_matches_parser(mangled_dict: dict):
+    fqn: FQN = parse_mangled(mangled_dict["mangled"])
+    assert fqn.full_name == mangled_dict["demangled"]
+    assert fqn == Parser(mangled_dict["demangled"]).parse()
+
+
+def test_parse_mangled_substitutions():
+    # 'S2_' is the third substitution candidate: 'std::vector<int, std::allocator<int> >'.
+    fqn: FQN = parse_mangled("_ZN2ns1fESt6vectorIiSaIiEES2_")
+    assert fqn.args == ("std::vector<int, std::allocator<int> >", " std::vector<int, std::allocator<int> >")
+    # 'NS1_1BE' nests 'B' in the candidate 'ns::A<int>', reusing its scopes.
+    fqn = parse_mangled("_ZN2ns1fENS_1AIiEENS1_1BE")
+    assert fqn.full_name == "ns::f(ns::A<int>, ns::A<int>::B)"
+
+
+@pytest.mark.parametrize("symbol", ["one::two()", "_ZN3foo3barE", "_ZTV3foo", "_ZN1AD1Ev", "_ZNKR1A1fEv",
+                                    "_Z1fPFivE", "_Z1fIiLi3EEvv", "_ZN1A1fEv.cold", "_ZN3foo", "_Z1fS0_"])
+def test_parse_mangled_rejects(symbol: str):
+    with pytest.raises(SyntaxError):
+        parse_mangled(symbol)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_mangled(workers: int):
+    strings = ["_ZN3foo3barEi", "one::two()", "_ZTV3foo"]
+    results = list(parse_many(strings, workers=workers, chunksize=1, errors="return", mangled=True))
+    assert results[0] == Parser("foo::bar(int)").parse()
+    assert results[1].name == "two"
+    assert isinstance(results[2], SyntaxError)
+
+
+def test_parse_stream_mangled():
+    lines = io.StringIO("0000000000001139 T _ZN3foo3barEv\n                 U strlen\n")
+    assert [fqn.full_name for fqn in parse_stream(lines, nm=True, mangled=True)] == ["foo::bar()"]
@@ -6,3 +6,17 @@ def test_tokenizer_fqn(fqn_dict: dict):
     result: FQN = parser.parse()
     expected = FQN.from_dict(fqn_dict["parser"])
     assert result == expected
+
+
+def test_parser_template_args_commas():
+    parser: Parser = Parser("void f(std::map<int, int>, char)")
+    assert parser.parse().args == ("std::map<int, int>", " char")
+
+
+def test_parser_scan_phases():
+    phases = []
+    spans = Parser("int one::two<three>(four) const").scan(phases.append)
+    assert phases == ["qualifiers", "args", "template", "name", "scopes", "return_type"]
+    assert spans.constant and not spans.volatile
+    assert spans.args is not None and len(spans.args) == 1
+    assert spans.template is not None and spans.return_type is not None
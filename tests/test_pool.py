@@ -0,0 +1,50 @@
+import gc
+
+from src.cpp_fqn_parser import ScopePool, ParseCache, Parser, Scope, parse, FQN
+
+
+def test_pooled_parse_matches_parse(fqn_dict: dict):
+    pool: ScopePool = ScopePool()
+    assert Parser(fqn_dict["fqn"], pool=pool).parse() == Parser(fqn_dict["fqn"]).parse()
+
+
+def test_pooled_fqns_share_scopes_and_chains():
+    pool: ScopePool = ScopePool()
+    first: FQN = parse("void std::vector<int>::push_back(int)", pool=pool)
+    second: FQN = parse("int std::vector<int>::size() const", pool=pool)
+    third: FQN = parse("std::sort(int *, int *)", pool=pool)
+
+    assert first.scopes is second.scopes
+    assert first.scopes is not None and third.scopes is not None
+    assert first.scopes[0] is third.scopes[0]
+    assert pool.info() == (2, 2)
+
+
+def test_pool_intern():
+    pool: ScopePool = ScopePool()
+    parsed: FQN = parse("one::two<three>::four()", pool=pool)
+    loaded: FQN = FQN.from_dict(parse("one::two<three>::four()").to_dict())
+
+    interned: FQN = pool.intern(loaded)
+    assert interned == loaded
+    assert interned.scopes is parsed.scopes
+    assert pool.intern(interned) is interned
+    assert pool.chain([Scope("one")])[0] is pool.scope("one")
+    assert pool.chain_parts(["one", None, "two", "<three>"]) is parsed.scopes
+
+
+def test_weak_pool_releases_unused_scopes():
+    pool: ScopePool = ScopePool(weak=True)
+    fqn: FQN = parse("one::two::three()", pool=pool)
+    assert parse("one::four()", pool=pool).scopes[0] is fqn.scopes[0]  # type: ignore[index]
+    assert pool.info() == (2, 0)
+
+    del fqn
+    gc.collect()
+    assert len(pool) == 0
+
+
+def test_parse_cache_with_pool():
+    pool: ScopePool = ScopePool()
+    cache: ParseCache = ParseCache(pool=pool)
+    assert cache.parse("one::two()").scopes is cache.parse("one::three()").scopes
@@ -0,0 +1,70 @@
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import ParseProfiler, ParseCache, Parser, ScopePool
+from src.cpp_fqn_parser.profiling import PHASES, Histogram
+
+
+def test_profiler_matches_parser(fqn_dict: dict):
+    profiler: ParseProfiler = ParseProfiler()
+    assert profiler.parse(fqn_dict["fqn"]) == Parser(fqn_dict["fqn"]).parse()
+
+
+def test_profiler_stats(fqn_dicts: List[dict]):
+    strings: List[str] = [fqn_dict["fqn"] for fqn_dict in fqn_dicts] * 2 + ["one::two() &&"]
+    profiler: ParseProfiler = ParseProfiler(ParseCache())
+    results = list(profiler.parse_many(strings, errors="return"))
+
+    assert isinstance(results[-1], SyntaxError)
+    stats = profiler.stats()
+    assert stats.parses == len(strings)
+    assert stats.failures == 1
+    assert stats.cache_hits == len(fqn_dicts)
+    assert stats.cache_misses == len(fqn_dicts) + 1
+    assert set(stats.phases) == set(PHASES)
+    assert stats.phases["tokenize"].samples == len(fqn_dicts) + 1
+    assert stats.phases["return_type"].samples == len(fqn_dicts)
+    assert stats.tokens.samples == len(fqn_dicts) + 1
+
+
+def test_profiler_with_pooled_cache():
+    profiler: ParseProfiler = ParseProfiler(ParseCache(pool=ScopePool()))
+    assert profiler.parse("one::two()").scopes is profiler.parse("one::three()").scopes
+
+
+def test_profiler_template_depth():
+    profiler: ParseProfiler = ParseProfiler()
+    profiler.parse("one<two<three<four> > >::five()")
+    profiler.parse("one::two()")
+    snapshot = profiler.stats().template_depth
+    assert snapshot.total == 3
+    assert snapshot.mean == 1.5
+
+
+def test_profiler_prometheus():
+    profiler: ParseProfiler = ParseProfiler()
+    profiler.parse("one::two(int)")
+    text: str = profiler.to_prometheus()
+    assert "cpp_fqn_parser_parses_total 1" in text
+    assert 'cpp_fqn_parser_phase_seconds_bucket{phase="args",le="+Inf"} 1' in text
+    assert 'cpp_fqn_parser_phase_seconds_count{phase="tokenize"} 1' in text
+    assert "# TYPE cpp_fqn_parser_tokens histogram" in text
+
+
+def test_profiler_merge():
+    first, second = ParseProfiler(), ParseProfiler()
+    first.parse("one::two()")
+    second.parse("three()")
+    first.merge(second)
+    assert first.stats().parses == 2
+    assert first.stats().phases["name"].samples == 2
+
+
+def test_histogram():
+    histogram: Histogram = Histogram((1, 10))
+    for value in (0, 1, 5, 100):
+        histogram.observe(value)
+    assert histogram.snapshot().counts == (2, 1, 1)
+    with pytest.raises(ValueError):
+        histogram.merge(Histogram((1,)))
@@ -0,0 +1,25 @@
+import io
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import Parser, FQN, dump_many, load_many
+
+
+@pytest.mark.parametrize("format", ["jsonl", "tuples", "msgpack"])
+def test_dump_load_many(fqn_dicts: List[dict], format: str):
+    if format == "msgpack":
+        pytest.importorskip("msgpack")
+    fqns: List[FQN] = [Parser(fqn_dict["fqn"]).parse() for fqn_dict in fqn_dicts]
+    fp = io.BytesIO() if format == "msgpack" else io.StringIO()
+
+    assert dump_many(fqns, fp, format) == len(fqns)
+    fp.seek(0)
+    assert list(load_many(fp, format)) == fqns
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        dump_many([], io.StringIO(), "xml")
+    with pytest.raises(ValueError):
+        load_many(io.StringIO(), "xml")
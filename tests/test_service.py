@@ -0,0 +1,123 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import AsyncParser, FQN, serve
+
+
+def test_async_parser(fqn_dicts: List[dict]):
+    strings: List[str] = [fqn_dict["fqn"] for fqn_dict in fqn_dicts]
+    expected: List[FQN] = [FQN.from_dict(fqn_dict["parser"]) for fqn_dict in fqn_dicts]
+
+    async def run() -> List[FQN]:
+        async with AsyncParser(max_batch_size=4, max_queue=8) as parser:
+            result = await asyncio.gather(*(parser.parse(string) for string in strings))
+            stats = parser.stats()
+        assert stats.requests == len(strings)
+        assert 0 < stats.batches < len(strings)
+        assert stats.queue_depth == 0
+        assert 0 <= stats.latency_p50 <= stats.latency_p90 <= stats.latency_p99
+        return list(result)
+
+    assert asyncio.run(run()) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_async_parser_errors(workers: int):
+    async def run() -> None:
+        async with AsyncParser(workers=workers) as parser:
+            with pytest.raises(SyntaxError):
+                await parser.parse("one::two() &&")
+            assert (await parser.parse("three()")).name == "three"
+            assert parser.stats().failures == 1
+        with pytest.raises(RuntimeError):
+            await parser.parse("three()")
+
+    asyncio.run(run())
+
+
+def test_async_parser_close_with_blocked_submits():
+    async def run() -> None:
+        parser: AsyncParser = AsyncParser(max_batch_size=1, max_queue=1)
+        await parser.start()
+        submits = [asyncio.ensure_future(parser.submit(f"one{i}()")) for i in range(4)]
+        await asyncio.sleep(0)
+        await asyncio.wait_for(parser.close(), 1)
+
+        for submit in submits:
+            try:
+                fqn: FQN = await asyncio.wait_for(await asyncio.wait_for(submit, 1), 1)
+                assert fqn.name.startswith("one")
+            except RuntimeError as e:
+                assert str(e) == "AsyncParser is closed"
+        with pytest.raises(RuntimeError):
+            await parser.submit("two()")
+
+    asyncio.run(run())
+
+
+def test_serve():
+    lines: List[str] = ["one::two()", "one::two() &&", "", "int three<four>(five) const"]
+
+    async def run() -> List[dict]:
+        async with AsyncParser() as parser:
+            server = await serve(parser)
+            port: int = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write("".join(f"{line}\n" for line in lines).encode())
+            writer.write_eof()
+            responses = [json.loads(line) async for line in reader]
+            writer.close()
+            server.close()
+            await server.wait_closed()
+        return responses
+
+    responses = asyncio.run(run())
+    assert [response.get("name") for response in responses] == ["two", None, "three"]
+    assert "error" in responses[1]
+    assert responses[2]["constant"]
+
+
+def test_serve_more_requests_than_queue():
+    lines: List[str] = [f"one::two{i}()" for i in range(20)]
+
+    async def run() -> List[dict]:
+        async with AsyncParser(max_queue=2) as parser:
+            server = await serve(parser)
+            port: int = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write("".join(f"{line}\n" for line in lines).encode())
+            writer.write_eof()
+            responses = [json.loads(line) async for line in reader]
+            writer.close()
+            server.close()
+            await server.wait_closed()
+        return responses
+
+    assert [response["name"] for response in asyncio.run(run())] == [f"two{i}" for i in range(20)]
+
+
+def test_serve_client_reset_mid_pipeline():
+    def connection_tasks() -> List[asyncio.Task]:
+        return [task for task in asyncio.all_tasks()
+                if task.get_coro().__qualname__.endswith(("handle", "_respond"))]  # type: ignore[union-attr]
+
+    async def run() -> None:
+        async with AsyncParser(max_queue=2) as parser:
+            server = await serve(parser)
+            port: int = server.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"one::two()\n" * 20000)
+            await asyncio.sleep(0.2)
+            writer.transport.abort()
+            for _ in range(100):
+                if not connection_tasks():
+                    break
+                await asyncio.sleep(0.05)
+            assert connection_tasks() == []
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
@@ -0,0 +1,91 @@
+import os
+import stat
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import SymbolStore, StoreWriter, merge_stores, Parser, FQN
+
+
+def parse_all(fqn_dicts: List[dict]) -> List[FQN]:
+    return [Parser(fqn_dict["fqn"]).parse() for fqn_dict in fqn_dicts]
+
+
+def test_store_round_trip(fqn_dicts: List[dict], tmp_path: Path):
+    fqns: List[FQN] = parse_all(fqn_dicts)
+    path: str = str(tmp_path / "symbols.fqns")
+    assert SymbolStore.write(path, fqns) == len(fqns)
+
+    with SymbolStore(path) as store:
+        assert len(store) == len(fqns)
+        assert list(store) == fqns
+        assert store[-1] == fqns[-1]
+        with pytest.raises(IndexError):
+            store[len(fqns)]
+
+
+def test_store_append_and_merge(fqn_dicts: List[dict], tmp_path: Path):
+    fqns: List[FQN] = parse_all(fqn_dicts)
+    first: str = str(tmp_path / "first.fqns")
+    second: str = str(tmp_path / "second.fqns")
+    SymbolStore.write(first, fqns[:3])
+
+    with SymbolStore(first) as store:
+        assert SymbolStore.write(first, fqns[3:], append=True) == len(fqns)
+        assert list(store) == fqns[:3]
+    with SymbolStore(first) as store:
+        assert list(store) == fqns
+
+    SymbolStore.write(second, fqns[:2])
+    merged: str = str(tmp_path / "merged.fqns")
+    assert merge_stores(merged, [second, first]) == len(fqns) + 2
+    with SymbolStore(merged) as store:
+        assert list(store) == fqns[:2] + fqns
+
+
+def test_store_writer_abort(tmp_path: Path):
+    path: Path = tmp_path / "symbols.fqns"
+    with pytest.raises(RuntimeError):
+        with StoreWriter(str(path)) as writer:
+            writer.add(Parser("one::two()").parse())
+            raise RuntimeError()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_store_file_mode(tmp_path: Path):
+    path: Path = tmp_path / "symbols.fqns"
+    umask: int = os.umask(0o022)
+    try:
+        SymbolStore.write(str(path), [Parser("one::two()").parse()])
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o644
+
+    path.chmod(0o640)
+    SymbolStore.write(str(path), [Parser("three()").parse()], append=True)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+
+def test_store_rejects_other_files(tmp_path: Path):
+    path: Path = tmp_path / "symbols.fqns"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        SymbolStore(str(path))
+
+
+def test_store_rejects_truncated_files(tmp_path: Path):
+    path: Path = tmp_path / "symbols.fqns"
+    SymbolStore.write(str(path), [Parser("one::two()").parse()])
+    path.write_bytes(path.read_bytes()[:32])
+    with pytest.raises(ValueError):
+        SymbolStore(str(path))
+
+
+def test_store_writer_append_to_invalid_store(tmp_path: Path):
+    path: Path = tmp_path / "symbols.fqns"
+    path.write_bytes(b"\0" * 128)
+    with pytest.raises(ValueError):
+        StoreWriter(str(path), append=True)
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,83 @@
+import csv
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import parse_stream, FQN
+from src.cpp_fqn_parser.cli import main
+from src.cpp_fqn_parser.stream import open_input, write_csv, write_jsonl
+
+NM_OUTPUT: str = ("0000000000001139 T one::two::three()\n"
+                  "\n"
+                  "                 U one::two::three() &&\n"
+                  "0000000000001150 W int one_3hello0::tconstwo<mytemplate>::three(const four &) volatile\n")
+
+
+def test_parse_stream(fqn_dicts: List[dict]):
+    lines = io.StringIO("".join(f"{fqn_dict['fqn']}\n" for fqn_dict in fqn_dicts))
+    expected: List[FQN] = [FQN.from_dict(fqn_dict["parser"]) for fqn_dict in fqn_dicts]
+    assert list(parse_stream(lines)) == expected
+
+
+def test_parse_stream_nm():
+    result = list(parse_stream(io.StringIO(NM_OUTPUT), nm=True))
+    assert [fqn.name for fqn in result] == ["three", "three"]
+    assert result[1].volatile
+
+
+def test_open_input_gzip(tmp_path: Path):
+    path: Path = tmp_path / "symbols"
+    with gzip.open(path, "wt") as f:
+        f.write(NM_OUTPUT)
+    with open_input(str(path)) as fileobj:
+        assert fileobj.read() == NM_OUTPUT
+
+
+def test_writers_round_trip():
+    fqns: List[FQN] = list(parse_stream(io.StringIO(NM_OUTPUT), nm=True))
+
+    out = io.StringIO()
+    assert write_jsonl(fqns, out) == 2
+    assert [FQN.from_dict(json.loads(line)) for line in out.getvalue().splitlines()] == fqns
+
+    out = io.StringIO()
+    assert write_csv(fqns, out) == 2
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [row["full_name"] for row in rows] == [fqn.full_name for fqn in fqns]
+    assert json.loads(rows[1]["args"]) == ["const four &"]
+
+
+def test_cli(tmp_path: Path, capsys: pytest.CaptureFixture):
+    source: Path = tmp_path / "symbols.txt"
+    source.write_text(NM_OUTPUT)
+    output: Path = tmp_path / "symbols.jsonl"
+
+    assert main([str(source), "--nm", "-o", str(output)]) == 0
+    assert len(output.read_text().splitlines()) == 2
+    assert "skipped 1 line(s)" in capsys.readouterr().err
+
+    assert main([str(source), "--nm", "--strict", "-o", str(output)]) == 1
+
+
+def test_cli_file_errors(tmp_path: Path, capsys: pytest.CaptureFixture):
+    source: Path = tmp_path / "symbols.txt"
+    source.write_text(NM_OUTPUT)
+
+    assert main([str(tmp_path / "missing.txt")]) == 2
+    assert capsys.readouterr().err.startswith("cpp-fqn-parser: ")
+    assert main([str(source), "--nm", "-o", str(tmp_path / "missing" / "symbols.jsonl")]) == 2
+    assert capsys.readouterr().err.startswith("cpp-fqn-parser: ")
+
+
+def test_cli_parquet(tmp_path: Path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    source: Path = tmp_path / "symbols.txt"
+    source.write_text(NM_OUTPUT)
+    output: Path = tmp_path / "symbols.parquet"
+
+    assert main([str(source), "--nm", "-f", "parquet", "-o", str(output)]) == 0
+    assert pq.read_table(output).column("name").to_pylist() == ["three", "three"]
@@ -1,6 +1,10 @@
 from typing import List
 
-from src.cpp_fqn_parser import Tokenizer, Token
+import pytest
+
+from src.cpp_fqn_parser import Tokenizer, Token, TokenBuffer
+from src.cpp_fqn_parser.buffer import TYPE_CODES
+from src.cpp_fqn_parser.tokenizer import _MASTER_RE
 
 
 def test_tokenizer_fqn(fqn_dict: dict):
@@ -9,3 +13,45 @@ def test_tokenizer_fqn(fqn_dict: dict):
     expected = [Token.from_dict(token)
                 for token in fqn_dict["tokens"]]
     assert result == expected
+
+
+@pytest.mark.parametrize("string, value, kind", [
+    ("operator<<=", "operator<<=", "SHIFT_LEFT_ASSIGN"),
+    ("operator ()", "operator()", "CALL"),
+    ("operator<=>", "operator<=>", "THREE_WAY_COMPARE"),
+    ("operator->*", "operator->*", "MEMBER_POINTER_ACCESS"),
+    ("operator new", "operator new", "NEW"),
+    ("operator delete[]", "operator delete[]", "DELETE_ARRAY"),
+    ("operator co_await", "operator co_await", "CO_AWAIT"),
+    ('operator""_km', 'operator""_km', "LITERAL"),
+    ('operator"" _km', 'operator""_km', "LITERAL"),
+    ("operator bool", "operator bool", "CONVERSION"),
+    ("operator newline", "operator newline", "CONVERSION"),
+    ("operator std::map<int, int> const &", "operator std::map<int, int> const &", "CONVERSION"),
+])
+def test_tokenizer_operator_kind(string: str, value: str, kind: str):
+    token = Tokenizer(f"{string}()").get_next_token()
+    assert token == Token("OPERATOR", value)
+    assert token is not None and token.kind == kind
+
+
+def test_tokenizer_spans(fqn_dict: dict):
+    string: str = fqn_dict["fqn"]
+    tokens: List[Token] = list(Tokenizer(string).get_all_tokens())
+    assert tokens[0].start == 0
+    for previous, token in zip(tokens, tokens[1:]):
+        assert previous.end <= token.start
+        assert token.source is string
+        if token.type_ != "OPERATOR":
+            assert token.value == string[token.start:token.end]
+
+
+def test_tokenizer_buffer(fqn_dict: dict):
+    buffer: TokenBuffer = Tokenizer(fqn_dict["fqn"]).tokenize()
+    expected = [Token.from_dict(token) for token in fqn_dict["tokens"]]
+    assert list(buffer) == expected
+    assert [buffer.value(i) for i in range(len(buffer))] == [token.value for token in expected]
+
+
+def test_buffer_codes_follow_master_regex():
+    assert {name: index - 1 for name, index in _MASTER_RE.groupindex.items()} == TYPE_CODES
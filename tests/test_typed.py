@@ -0,0 +1,46 @@
+import pytest
+
+from src.cpp_fqn_parser import FQN, TypeNode, TypeCache, TypedFQN, parse_typed
+
+
+def test_parse_typed(fqn_dict: dict):
+    expected: FQN = FQN.from_dict(fqn_dict["parser"])
+    typed: TypedFQN = parse_typed(fqn_dict["fqn"])
+    assert typed.name == expected.name
+    assert typed.constant == expected.constant
+    assert typed.volatile == expected.volatile
+    assert (typed.args is None) == (expected.args is None)
+    assert [scope.name for scope in typed.scopes or ()] == [scope.name for scope in expected.scopes or ()]
+
+
+def test_type_nodes():
+    typed: TypedFQN = parse_typed("std::vector<int, std::allocator<int> > ns::f<T>"
+                                  "(char const* const*, unsigned long, int&&, const volatile Foo * &)")
+    vector, pointer, unsigned, rvalue, reference = typed.return_type, *typed.args
+    assert vector == TypeNode("vector", (TypeNode("std"),),
+                              (TypeNode("int"), TypeNode("allocator", (TypeNode("std"),), (TypeNode("int"),))))
+    assert pointer == TypeNode("char", constant=True, layers=("* const", "*"))
+    assert unsigned == TypeNode("unsigned long")
+    assert rvalue == TypeNode("int", layers=("&&",))
+    assert reference == TypeNode("Foo", constant=True, volatile=True, layers=("*", "&"))
+    assert typed.template == (TypeNode("T"),)
+    assert str(vector) == "std::vector<int, std::allocator<int> >"
+    assert [str(arg) for arg in typed.args] == ["char const* const*", "unsigned long", "int&&", "Foo const volatile*&"]
+
+
+def test_type_cache_shares_nodes():
+    cache: TypeCache = TypeCache()
+    first: TypedFQN = parse_typed("void f(std::basic_string<char, std::allocator<char> >)", cache)
+    second: TypedFQN = parse_typed("std::allocator<char> g(int)", cache)
+    assert first.args[0].template_args[1] is second.return_type
+    assert first.args[0].scopes[0] is second.return_type.scopes[0]
+    assert len(cache) == 6
+
+    bounded: TypeCache = TypeCache(maxsize=1)
+    parse_typed("void f(std::allocator<char>)", bounded)
+    assert len(bounded) == 1
+
+
+def test_parse_typed_errors():
+    with pytest.raises(SyntaxError):
+        parse_typed("void f(int, )")
@@ -0,0 +1,37 @@
+from typing import List
+
+import pytest
+
+from src.cpp_fqn_parser import Parser, is_fqn, filter_fqns
+
+
+def _parses(string: str) -> bool:
+    try:
+        Parser(string).parse()
+    except SyntaxError:
+        return False
+    return True
+
+
+def test_is_fqn_valid(fqn_dict: dict):
+    assert is_fqn(fqn_dict["fqn"])
+
+
+def test_is_fqn_matches_parser(fqn_dict: dict):
+    string: str = fqn_dict["fqn"]
+    for i in range(len(string) + 1):
+        for variant in (string[:i], string[i:], string[:i] + string[i + 1:]):
+            assert is_fqn(variant) == _parses(variant), variant
+
+
+@pytest.mark.parametrize("string", ["", "foo", "one::two", "vtable for one::two", "one::two() &&", "one::two()const",
+                                    "f(void (*)(int))", "one<two::three()", "$x()", "one::two() xconst"])
+def test_is_fqn_invalid(string: str):
+    assert not is_fqn(string)
+    assert not _parses(string)
+
+
+def test_filter_fqns():
+    strings: List[str] = ["one::two()", "data_symbol", "three<four>()", "garbage $"]
+    assert list(filter_fqns(strings)) == ["one::two()", "three<four>()"]
+    assert list(filter_fqns(strings, invert=True)) == ["data_symbol", "garbage $"]